@@ -5,6 +5,8 @@ __all__ = [
     "PACKAGE_NAME",
     "ORGANIZATION_NAME",
     "VERSION",
+    "FFT_BACKEND_ENV",
+    "FFT_WORKERS_ENV",
 ]
 
 from importlib.metadata import version, PackageNotFoundError
@@ -17,3 +19,14 @@ try:
     VERSION = version(PACKAGE_NAME)
 except PackageNotFoundError:
     VERSION = "0.0.0"
+
+# Environment variable naming the FFT backend when none is set in code
+# ("numpy", "scipy", "auto", or a registered name).  Being part of the
+# environment, it also reaches spawned worker processes.  Defined here so
+# the CLI can set it without importing the signal engine.
+FFT_BACKEND_ENV = f"{PACKAGE_NAME.upper()}_FFT_BACKEND"
+
+# Environment variable holding the number of threads the scipy backend may
+# use per batched transform; unset means all cores.  Pool workers default
+# it to 1, so N processes do not each start one thread per core.
+FFT_WORKERS_ENV = f"{PACKAGE_NAME.upper()}_FFT_WORKERS"
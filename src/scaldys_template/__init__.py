@@ -1,4 +1,18 @@
 # -*- coding: utf-8 -*-
 
-from scaldys_template.cli import *
-from scaldys_template.common import *
+from scaldys_template.common.lazy_exports import lazy_exports
+
+# Names re-exported from submodules.  They are imported on first access
+# (PEP 562), so importing this package does not load every command module.
+_EXPORTS = {
+    "ARG_TYPE_VERBOSE": "scaldys_template.cli.commands.arg_types",
+    "ARG_TYPE_LOG_LEVEL": "scaldys_template.cli.commands.arg_types",
+    "export": "scaldys_template.cli.commands.cmd_export",
+    "process": "scaldys_template.cli.commands.cmd_process",
+    "AppLocation": "scaldys_template.common.app_location",
+    "setup_logging": "scaldys_template.common.logging",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -165,9 +165,9 @@ def _setup_asyncio_policy() -> None:
     On macOS / Linux the default policy is already correct; this function is a
     no-op there.
     """
-    import asyncio
-
     if platform.system() == "Windows":
+        import asyncio
+
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())  # type: ignore[attr-defined]
 
 
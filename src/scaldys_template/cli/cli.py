@@ -1,23 +1,33 @@
 # -*- coding: utf-8 -*-
 # cython: language_level=3
 
+import importlib
+import os
+
 import typer
-from typer.core import TyperGroup
-from art import text2art
 from rich.console import Console
+from typer.core import TyperCommand, TyperGroup
 
-import scaldys_template.cli.commands.cmd_analyze as cmd_analyze
-import scaldys_template.cli.commands.cmd_export as cmd_export
-import scaldys_template.cli.commands.cmd_gui as cmd_gui
-import scaldys_template.cli.commands.cmd_process as cmd_process
-import scaldys_template.cli.commands.cmd_settings as cmd_settings
-from scaldys_template.__about__ import APP_NAME, VERSION
+from scaldys_template.__about__ import APP_NAME, FFT_BACKEND_ENV, VERSION
 from scaldys_template.cli.commands.arg_types import ARG_TYPE_LOG_LEVEL, ARG_TYPE_VERBOSE
-from scaldys_template.cli.settings import AppSettings
-from scaldys_template.common.logging import setup_logging
 
 console = Console()
 
+# Subcommands, in help order: name → (module, attribute).  A module is only
+# imported when its command is invoked (or listed by --help), so a command
+# never pays for another's dependencies (NumPy, matplotlib, Tk, ...).  An
+# attribute naming a ``typer.Typer`` is a command group, anything else a
+# command function.
+_COMMANDS: dict[str, tuple[str, str]] = {
+    "gui": ("scaldys_template.cli.commands.cmd_gui", "gui"),
+    "analyze": ("scaldys_template.cli.commands.cmd_analyze", "analyze"),
+    "sweep": ("scaldys_template.cli.commands.cmd_sweep", "sweep"),
+    "export": ("scaldys_template.cli.commands.cmd_export", "export"),
+    "process": ("scaldys_template.cli.commands.cmd_process", "process"),
+    "settings": ("scaldys_template.cli.commands.cmd_settings", "app"),
+    "cache": ("scaldys_template.cli.commands.cmd_cache", "app"),
+}
+
 
 def version_callback(value: bool) -> None:
     """
@@ -28,8 +38,37 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _load_command(name: str) -> TyperCommand | TyperGroup:
+    """Import subcommand *name* and build its Click command."""
+    module_name, attribute = _COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attribute)
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_group(target)
+    else:
+        # A Typer app with a single command and no callback builds that
+        # command itself rather than a group.
+        wrapper = typer.Typer(add_completion=False, rich_markup_mode="rich")
+        wrapper.command(name=name)(target)
+        command = typer.main.get_command(wrapper)
+        assert isinstance(command, TyperCommand)  # a single command, not a group
+    command.name = name
+    return command
+
+
 class HeaderGroup(TyperGroup):
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*_COMMANDS, *(name for name in super().list_commands(ctx) if name not in _COMMANDS)]
+
+    # The return type is inherited: typer does not publish its Click
+    # ``Command`` class under a stable name.
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name in _COMMANDS and cmd_name not in self.commands:
+            self.add_command(_load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
     def format_help(self, ctx: typer.Context, formatter) -> None:
+        from art import text2art
+
         # With rich_markup_mode="rich", Typer bypasses the formatter and renders
         # options/commands via Rich directly, so formatter.write() ends up after the
         # panels. Instead, print the art straight to the console before the parent
@@ -63,15 +102,25 @@ def main(
     if ctx.invoked_subcommand is None:
         return
 
+    from scaldys_template.cli.settings import AppSettings
+    from scaldys_template.common.logging import setup_logging
+
     # Resolve the log level: CLI flag takes priority over persisted settings.
+    settings = AppSettings()
     if log_level is None:
-        log_level = AppSettings().log_level
+        log_level = settings.log_level
 
     # Single, authoritative call to setup_logging for the entire process.
     # Individual commands must NOT call setup_logging — logging is now owned
     # here at the application level.
     setup_logging(log_level, verbose)
 
+    # The persisted FFT backend is handed to the engine through its
+    # environment variable: one that is already set wins, and spawned worker
+    # processes inherit the choice.
+    if settings.fft_backend is not None:
+        os.environ.setdefault(FFT_BACKEND_ENV, settings.fft_backend)
+
 
 app = typer.Typer(
     help=f"A CLI to run {APP_NAME} in a terminal window.",
@@ -85,11 +134,7 @@ app = typer.Typer(
     },
 )
 
-app.command()(cmd_gui.gui)
-app.command()(cmd_analyze.analyze)
-app.command()(cmd_export.export)
-app.command()(cmd_process.process)
-app.add_typer(cmd_settings.app, name="settings")
+# Subcommands are registered lazily through HeaderGroup; see _COMMANDS.
 
 
 if __name__ == "__main__":
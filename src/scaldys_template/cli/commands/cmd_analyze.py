@@ -5,8 +5,19 @@
 ``analyze`` CLI command — headless signal analysis.
 
 Reads ``SignalParameters`` from a JSON file (or uses built-in defaults),
-runs the signal engine, and writes results to a directory as CSV files and
-PNG plots.
+runs the signal engine, and writes results to a directory as CSV files (or
+``.npy`` / ``.npz`` arrays or JSON Lines, see ``--format``) and PNG plots.
+Parameter sets with ``streaming`` enabled are generated chunk by chunk and
+written straight to disk, so their length is not bounded by memory.
+
+Results of reproducible, in-memory runs are kept in an on-disk cache
+(see ``scaldys-template cache``); repeating a run with identical parameters
+skips the signal engine and goes straight to export.
+
+The command runs as a staged pipeline: each result file is written on a
+writer thread as soon as its input exists (the time domain while the FFT is
+still running), the PNG plots are rendered alongside on a small process
+pool, and the summary panel and the log break the run time down by stage.
 
 Invocation examples
 --------------------
@@ -14,12 +25,19 @@ Invocation examples
     scaldys-template analyze params.json               # load from file
     scaldys-template analyze params.json --output ./results
     scaldys-template analyze params.json --output ./results --force
+    scaldys-template analyze params.json --fft-mode welch --overlap 0.75 --average median
+    scaldys-template analyze params.json --fft-size auto   # whole capture, fast length
+    scaldys-template analyze params.json --fft-size 1009 --fast-length pad
+    scaldys-template analyze params.json --no-cache     # always run the engine
+    scaldys-template analyze params.json --format npz   # binary, memory-mappable
+    scaldys-template analyze params.json --plot-workers 1   # render plots in-process
     scaldys-template --log debug analyze params.json
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from pathlib import Path
 from typing import Annotated
 
@@ -31,13 +49,29 @@ from rich import box
 
 from scaldys_template.__about__ import APP_NAME, PACKAGE_NAME, VERSION
 from scaldys_template.common.app_location import AppLocation
+from scaldys_template.core.analysis_graph import AnalysisGraph, Stage
 from scaldys_template.core.parameter_store import load_parameters
+from scaldys_template.core.result_cache import ResultCache
 from scaldys_template.core.signal_engine import (
-    compute_fft,
-    compute_metrics,
-    generate_signal,
+    MetricsAccumulator,
+    SignalData,
+    SignalWorkspace,
+    iter_signal_chunks,
+)
+from scaldys_template.core.signal_export import ResultFormat, ResultWriter
+from scaldys_template.core.signal_model import (
+    FastLength,
+    FFTMode,
+    SignalParameters,
+    SpectrumAverage,
 )
-from scaldys_template.core.signal_model import SignalParameters
+from scaldys_template.core.signal_plots import (
+    PlotJob,
+    PlotRenderer,
+    default_plot_workers,
+    plot_jobs,
+)
+from scaldys_template.core.stage_pipeline import StagePipeline
 
 __all__ = ["analyze"]
 
@@ -74,6 +108,15 @@ ARG_TYPE_FORCE = Annotated[
     ),
 ]
 
+ARG_TYPE_FORMAT = Annotated[
+    ResultFormat,
+    typer.Option(
+        "--format",
+        help="Result file format: 'csv', 'npy' or 'npz' (binary arrays plus a result.json "
+        "sidecar, readable with load_result) or 'jsonl'.",
+    ),
+]
+
 ARG_TYPE_NO_PLOTS = Annotated[
     bool,
     typer.Option(
@@ -82,6 +125,76 @@ ARG_TYPE_NO_PLOTS = Annotated[
     ),
 ]
 
+ARG_TYPE_PLOT_WORKERS = Annotated[
+    int | None,
+    typer.Option(
+        "--plot-workers",
+        help="Processes rendering the PNG plots alongside the result writing; 1 renders "
+        "them in-process afterwards.  Defaults to one per plot, at most one per CPU.",
+        min=1,
+    ),
+]
+
+ARG_TYPE_FFT_SIZE = Annotated[
+    str | None,
+    typer.Option(
+        "--fft-size",
+        help="Samples per FFT segment (any integer ≥ 2), or 'auto' for the largest fast "
+        "length that fits the signal.  Overrides the parameters file.",
+    ),
+]
+
+ARG_TYPE_FAST_LENGTH = Annotated[
+    FastLength | None,
+    typer.Option(
+        "--fast-length",
+        help="Adapt the FFT size to a fast (5-smooth) length: 'off', 'pad' (zero-pad up) or "
+        "'truncate' (use fewer samples).  Overrides the parameters file.",
+    ),
+]
+
+ARG_TYPE_FFT_MODE = Annotated[
+    FFTMode | None,
+    typer.Option(
+        "--fft-mode",
+        help="Spectrum estimate: 'single' (first FFT segment) or 'welch' (averaged over the "
+        "whole signal).  Overrides the parameters file.",
+    ),
+]
+
+ARG_TYPE_OVERLAP = Annotated[
+    float | None,
+    typer.Option(
+        "--overlap",
+        help="Welch segment overlap as a fraction of the FFT size (0 ≤ overlap < 1).  "
+        "Overrides the parameters file.",
+    ),
+]
+
+ARG_TYPE_AVERAGE = Annotated[
+    SpectrumAverage | None,
+    typer.Option(
+        "--average",
+        help="Welch averaging: 'mean' or 'median'.  Overrides the parameters file.",
+    ),
+]
+
+ARG_TYPE_SEED = Annotated[
+    int | None,
+    typer.Option(
+        "--seed",
+        help="Random seed for reproducible noise (≥ 0).  Overrides the parameters file.",
+    ),
+]
+
+ARG_TYPE_NO_CACHE = Annotated[
+    bool,
+    typer.Option(
+        "--no-cache",
+        help="Neither read nor store results in the on-disk result cache.",
+    ),
+]
+
 
 # ---------------------------------------------------------------------------
 # Command
@@ -93,15 +206,24 @@ def analyze(
     params_file: ARG_TYPE_PARAMS_FILE = None,
     output_dir: ARG_TYPE_OUTPUT_DIR = None,
     force: ARG_TYPE_FORCE = False,
+    fmt: ARG_TYPE_FORMAT = ResultFormat.CSV,
     no_plots: ARG_TYPE_NO_PLOTS = False,
+    plot_workers: ARG_TYPE_PLOT_WORKERS = None,
+    fft_size: ARG_TYPE_FFT_SIZE = None,
+    fast_length: ARG_TYPE_FAST_LENGTH = None,
+    fft_mode: ARG_TYPE_FFT_MODE = None,
+    overlap: ARG_TYPE_OVERLAP = None,
+    average: ARG_TYPE_AVERAGE = None,
+    seed: ARG_TYPE_SEED = None,
+    no_cache: ARG_TYPE_NO_CACHE = False,
 ) -> None:
     """
-    Run headless signal analysis and export results to CSV and PNG.
+    Run headless signal analysis and export results to CSV (or binary) and PNG.
 
     Demonstrates:
       - Loading ``SignalParameters`` from JSON (or using defaults)
       - Calling the signal engine from a CLI command
-      - Writing tabular results as CSV
+      - Writing tabular results as CSV, binary arrays, or JSON Lines
       - Saving matplotlib plots as PNG without a display
     """
     logger.info("Starting %s %s — analyze command", APP_NAME, VERSION)
@@ -126,6 +248,31 @@ def analyze(
         console.print("No parameters file specified — using built-in defaults.")
         params = SignalParameters()
 
+    overrides = {
+        name: value
+        for name, value in (
+            ("fft_size", fft_size),
+            ("fft_fast_length", fast_length),
+            ("fft_mode", fft_mode),
+            ("welch_overlap", overlap),
+            ("welch_average", average),
+            ("seed", seed),
+        )
+        if value is not None
+    }
+    if overrides:
+        try:
+            params = SignalParameters.model_validate({**params.model_dump(), **overrides})
+        except ValueError as exc:
+            err_console.print(
+                Panel(
+                    f"[red]Invalid parameter options:[/red]\n{exc}",
+                    title="[bold red]Error[/bold red]",
+                    border_style="red",
+                )
+            )
+            raise typer.Exit(code=1) from exc
+
     # ------------------------------------------------------------------
     # Resolve output directory
     # ------------------------------------------------------------------
@@ -150,133 +297,138 @@ def analyze(
     # Run the signal engine
     # ------------------------------------------------------------------
     console.print("\nRunning signal engine…")
-    try:
-        signal_data = generate_signal(params)
-        fft_result = compute_fft(signal_data, params)
-        metrics = compute_metrics(signal_data, fft_result)
-    except Exception as exc:
-        err_console.print(Panel(f"[red]Signal engine error:[/red]\n{exc}", border_style="red"))
-        raise typer.Exit(code=1) from exc
-
-    # ------------------------------------------------------------------
-    # Write CSV: time domain
-    # ------------------------------------------------------------------
-    import csv
-
-    td_path = output_dir / "time_domain.csv"
-    with td_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["time_s", "signal", "noise", "composite"])
-        for i in range(len(signal_data.time)):
-            writer.writerow(
-                [
-                    f"{signal_data.time[i]:.8f}",
-                    f"{signal_data.signal[i]:.8f}",
-                    f"{signal_data.noise[i]:.8f}",
-                    f"{signal_data.composite[i]:.8f}",
-                ]
-            )
-    console.print(f"  Time domain  → [cyan]{td_path}[/cyan]")
-
-    # Write CSV: frequency domain
-    fd_path = output_dir / "frequency_domain.csv"
-    with fd_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["frequency_hz", "magnitude_db", "phase_deg"])
-        for freq, mag, phase in zip(
-            fft_result.frequencies, fft_result.magnitude_db, fft_result.phase_deg
-        ):
-            writer.writerow([f"{freq:.4f}", f"{mag:.4f}", f"{phase:.4f}"])
-    console.print(f"  Freq domain  → [cyan]{fd_path}[/cyan]")
-
-    # Write CSV: metrics
-    mtr_path = output_dir / "metrics.csv"
-    with mtr_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["metric", "value"])
-        writer.writerow(["rms", f"{metrics.rms:.6f}"])
-        writer.writerow(["peak", f"{metrics.peak:.6f}"])
-        writer.writerow(["crest_factor", f"{metrics.crest_factor:.4f}"])
-        writer.writerow(
-            ["snr_db", f"{metrics.snr_db:.2f}" if metrics.snr_db is not None else "N/A"]
-        )
-        writer.writerow(["thd_db", f"{metrics.thd_db:.2f}"])
-        writer.writerow(["peak_freq_hz", f"{metrics.peak_freq:.4f}"])
-    console.print(f"  Metrics      → [cyan]{mtr_path}[/cyan]")
+    run_start = time.perf_counter()
+    renderer = PlotRenderer(1 if no_plots else plot_workers or default_plot_workers())
+    writer = ResultWriter(output_dir, fmt)
+    pipeline = StagePipeline()
+    signal_data: SignalData | None = None
+    td_path: Path | None = None
+
+    def export(stage: Stage, output: Any) -> None:
+        """Hand each engine output to the writer threads as soon as it exists."""
+        nonlocal signal_data
+        if stage == Stage.SIGNAL:
+            signal_data = output
+            if not params.streaming:  # streamed samples are written as generated
+                pipeline.submit(
+                    "write_time_domain", writer.write_time_domain, [output], len(output.composite)
+                )
+        elif stage == Stage.SPECTRUM:
+            pipeline.submit("write_frequency_domain", writer.write_frequency_domain, output)
+            if not no_plots:
+                assert signal_data is not None  # the signal stage is exported first
+                jobs = plot_jobs(signal_data, output, params, output_dir)
+                pipeline.submit("render_plots", _render_plots, renderer, jobs)
+        else:
+            after = () if params.streaming else ("write_time_domain",)
+            pipeline.submit("write_metrics", writer.write_metrics, params, output, after=after)
+
+    with renderer, writer, pipeline:
+        try:
+            if params.streaming:
+                # Stream straight to disk: the full signal is never held in
+                # memory, and every chunk is generated into the same workspace
+                # buffers.  The time-domain plot then shows the leading FFT
+                # segment only; a Welch spectrum still covers the whole signal.
+                accumulator = MetricsAccumulator(params)
+                chunks = iter_signal_chunks(params, workspace=SignalWorkspace())
+                n_samples = int(params.duration * params.sampling_rate)
+                with pipeline.stage("signal"):
+                    td_path = writer.write_time_domain(accumulator.consume(chunks), n_samples)
+                export(Stage.SIGNAL, accumulator.head())
+                with pipeline.stage("spectrum"):
+                    fft_result = accumulator.fft_result()
+                export(Stage.SPECTRUM, fft_result)
+                with pipeline.stage("metrics"):
+                    metrics = accumulator.result(fft_result)
+                export(Stage.METRICS, metrics)
+            else:
+                cache = None if no_cache else ResultCache()
+                result = None
+                if cache is not None:
+                    with pipeline.stage("cache_lookup"):
+                        result = cache.get(params)
+                if result is not None:
+                    console.print("  Cached result found — signal engine skipped.")
+                    export(Stage.SIGNAL, result.signal_data)
+                    export(Stage.SPECTRUM, result.fft_result)
+                    export(Stage.METRICS, result.metrics)
+                else:
+                    run = AnalysisGraph().run(params, on_stage=export)
+                    for stage, seconds in run.timings.items():
+                        pipeline.record(str(stage), seconds)
+                    result = run.result
+                    if cache is not None:
+                        pipeline.submit("store_cache", cache.put, params, result)
+                metrics = result.metrics
+        except Exception as exc:
+            err_console.print(Panel(f"[red]Signal engine error:[/red]\n{exc}", border_style="red"))
+            raise typer.Exit(code=1) from exc
 
-    # ------------------------------------------------------------------
-    # Write PNG plots
-    # ------------------------------------------------------------------
-    if not no_plots:
-        _save_plots(signal_data, fft_result, params, output_dir)
+        # --------------------------------------------------------------
+        # Wait for the export stages
+        # --------------------------------------------------------------
+        try:
+            outputs = pipeline.wait()
+        except Exception as exc:
+            err_console.print(Panel(f"[red]Export error:[/red]\n{exc}", border_style="red"))
+            raise typer.Exit(code=1) from exc
+    total = time.perf_counter() - run_start
+
+    console.print(f"  Time domain  → [cyan]{outputs.get('write_time_domain', td_path)}[/cyan]")
+    console.print(f"  Freq domain  → [cyan]{outputs['write_frequency_domain']}[/cyan]")
+    console.print(f"  Metrics      → [cyan]{outputs['write_metrics']}[/cyan]")
+    for label, png_path in zip(
+        ("Time plot", "Spectrum", "Phase plot"), outputs.get("render_plots", [])
+    ):
+        console.print(f"  {label:<12} → [cyan]{png_path}[/cyan]")
+
+    # Foreground (engine) stages first, then the writer stages.
+    timings = []
+    for timing in sorted(pipeline.timings, key=lambda t: t.background):
+        value = f"{timing.seconds:.3f} s"
+        if timing.name == "render_plots":
+            value += " (in-process)" if renderer.workers == 1 else f" ({renderer.workers} workers)"
+        elif timing.background:
+            value += " (writer thread)"
+        timings.append((timing.name.replace("_", " ").capitalize(), value))
+    timings.append(("Total time", f"{total:.3f} s"))
+    logger.info(
+        "Analyze stage timings",
+        extra={
+            "seconds": {t.name: round(t.seconds, 6) for t in pipeline.timings},
+            "total_seconds": round(total, 6),
+        },
+    )
 
     # ------------------------------------------------------------------
     # Summary
     # ------------------------------------------------------------------
-    _print_summary(params, metrics, output_dir)
+    _print_summary(params, metrics, output_dir, timings)
 
     logger.info("Analyze command finished, output in %s", output_dir)
 
 
-def _save_plots(signal_data: Any, fft_result: Any, params: Any, output_dir: Path) -> None:  # type: ignore[type-arg]
-    """Save the three analysis plots as PNG files."""
-    import matplotlib
+def _render_plots(renderer: PlotRenderer, jobs: list[PlotJob]) -> list[Path]:
+    renderer.submit(jobs)
+    return renderer.wait()
 
-    matplotlib.use("Agg")  # headless / non-interactive backend
-    import matplotlib.pyplot as plt
 
-    n = len(signal_data.time)
-    step = max(1, n // 4000)
-    t = signal_data.time[::step]
-    composite = signal_data.composite[::step]
+def _describe_fft_size(params: SignalParameters) -> str:
+    text = str(params.segment_size)
+    if params.fft_size == "auto":
+        text += " (auto)"
+    if params.transform_size != params.segment_size:
+        text += f", zero-padded to {params.transform_size}"
+    return text
 
-    # Time domain
-    fig, ax = plt.subplots(figsize=(10, 4))
-    ax.plot(t, composite, linewidth=0.8, label="Composite")
-    if signal_data.noise.any():
-        ax.plot(
-            t, signal_data.signal[::step], linewidth=0.6, linestyle="--", label="Signal", alpha=0.7
-        )
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Amplitude")
-    ax.set_title(f"{params.signal_type} {params.frequency:.1f} Hz — Time Domain")
-    ax.legend(fontsize=8)
-    ax.grid(True, alpha=0.4)
-    fig.tight_layout()
-    td_png = output_dir / "time_domain.png"
-    fig.savefig(td_png, dpi=150)
-    plt.close(fig)
-    console.print(f"  Time plot    → [cyan]{td_png}[/cyan]")
-
-    # Spectrum
-    fig, ax = plt.subplots(figsize=(10, 4))
-    ax.plot(fft_result.frequencies, fft_result.magnitude_db, linewidth=0.8)
-    ax.set_xlabel("Frequency (Hz)")
-    ax.set_ylabel("Magnitude (dB)")
-    ax.set_title(f"FFT Spectrum — {params.fft_size}-pt {params.fft_window} window")
-    ax.grid(True, alpha=0.4)
-    fig.tight_layout()
-    sp_png = output_dir / "spectrum.png"
-    fig.savefig(sp_png, dpi=150)
-    plt.close(fig)
-    console.print(f"  Spectrum     → [cyan]{sp_png}[/cyan]")
-
-    # Phase
-    fig, ax = plt.subplots(figsize=(10, 4))
-    ax.plot(fft_result.frequencies, fft_result.phase_deg, linewidth=0.6, alpha=0.8)
-    ax.set_xlabel("Frequency (Hz)")
-    ax.set_ylabel("Phase (°)")
-    ax.set_title("FFT Phase")
-    ax.axhline(0, color="grey", linewidth=0.5, linestyle="--")
-    ax.grid(True, alpha=0.4)
-    fig.tight_layout()
-    ph_png = output_dir / "phase.png"
-    fig.savefig(ph_png, dpi=150)
-    plt.close(fig)
-    console.print(f"  Phase plot   → [cyan]{ph_png}[/cyan]")
-
-
-def _print_summary(params: SignalParameters, metrics: Any, output_dir: Path) -> None:  # type: ignore[type-arg]
+
+def _print_summary(
+    params: SignalParameters,
+    metrics: Any,  # type: ignore[type-arg]
+    output_dir: Path,
+    timings: list[tuple[str, str]],
+) -> None:
     table = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
     table.add_column("Label", style="bold")
     table.add_column("Value")
@@ -286,7 +438,12 @@ def _print_summary(params: SignalParameters, metrics: Any, output_dir: Path) ->
     table.add_row("Amplitude", str(params.amplitude))
     table.add_row("Duration", f"{params.duration:.3f} s")
     table.add_row("Sampling rate", f"{params.sampling_rate:.0f} Hz")
-    table.add_row("FFT size", str(params.fft_size))
+    table.add_row("FFT size", _describe_fft_size(params))
+    if params.fft_mode == FFTMode.WELCH:
+        table.add_row(
+            "FFT mode",
+            f"welch ({params.welch_overlap:.0%} overlap, {params.welch_average})",
+        )
     table.add_row("", "")
     table.add_row("RMS", f"{metrics.rms:.6f}")
     table.add_row("Peak", f"{metrics.peak:.6f}")
@@ -298,6 +455,9 @@ def _print_summary(params: SignalParameters, metrics: Any, output_dir: Path) ->
     table.add_row("THD", f"{metrics.thd_db:.2f} dB")
     table.add_row("Peak frequency", f"{metrics.peak_freq:.4f} Hz")
     table.add_row("Output directory", str(output_dir.resolve()))
+    table.add_row("", "")
+    for stage, elapsed in timings:
+        table.add_row(stage, elapsed)
 
     console.print("\n")
     console.print(Panel(table, title="[bold]Analysis Summary[/bold]", border_style="green"))
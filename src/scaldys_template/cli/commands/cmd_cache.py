@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+``cache`` CLI command group — inspect and clear the analysis result cache.
+
+Invocation examples
+--------------------
+    scaldys-template cache            # same as ``cache stats``
+    scaldys-template cache stats
+    scaldys-template cache clear
+"""
+
+import logging
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.core.result_cache import ResultCache
+
+__all__ = ["clear", "stats"]
+
+
+logger = logging.getLogger(PACKAGE_NAME)
+console = Console()
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    """
+    Manage the on-disk cache of ``analyze`` results.
+
+    When invoked without a subcommand, it displays the cache statistics.
+    """
+    if ctx.invoked_subcommand is None:
+        stats()
+
+
+@app.command()
+def stats() -> None:
+    """
+    Show the location, number of entries, and size of the result cache.
+    """
+    cache_stats = ResultCache().stats()
+    console.print(
+        Panel(
+            f"Directory: [cyan]{cache_stats.directory}[/cyan]\n"
+            f"Entries:   [cyan]{cache_stats.entries}[/cyan]\n"
+            f"Size:      [cyan]{_format_bytes(cache_stats.total_bytes)}[/cyan]"
+            f" of [cyan]{_format_bytes(cache_stats.max_bytes)}[/cyan]",
+            title="[bold]Result Cache[/bold]",
+            expand=False,
+        )
+    )
+
+
+@app.command()
+def clear() -> None:
+    """
+    Remove every cached analysis result.
+    """
+    removed = ResultCache().clear()
+    logger.info("Result cache cleared, %d entries removed", removed)
+    console.print(f"Removed [cyan]{removed}[/cyan] cached result(s).")
+
+
+def _format_bytes(n_bytes: int) -> str:
+    size = float(n_bytes)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
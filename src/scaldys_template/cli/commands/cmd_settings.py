@@ -11,7 +11,7 @@ from typing_extensions import Annotated
 from scaldys_template.__about__ import APP_NAME, PACKAGE_NAME
 from scaldys_template.cli.settings import AppSettings
 
-__all__ = ["log"]
+__all__ = ["fft_backend", "log"]
 
 
 logger = logging.getLogger(PACKAGE_NAME)
@@ -27,6 +27,12 @@ ARG_TYPE_LOG_LEVEL = Annotated[
         help="Must be a valid logging level string: 'off', 'debug', 'info', 'warning', 'error', or 'critical'."
     ),
 ]
+ARG_TYPE_FFT_BACKEND = Annotated[
+    str,
+    typer.Argument(
+        help="FFT backend: 'auto' (scipy when installed, otherwise numpy), 'numpy', or 'scipy'."
+    ),
+]
 
 
 @app.callback(invoke_without_command=True)
@@ -41,7 +47,8 @@ def main(ctx: typer.Context):
         settings = AppSettings()
         console.print(
             Panel(
-                f"Log level: [cyan]{settings.log_level}[/cyan]",
+                f"Log level: [cyan]{settings.log_level}[/cyan]\n"
+                f"FFT backend: [cyan]{settings.fft_backend}[/cyan]",
                 title=f"[bold]{APP_NAME} Settings[/bold]",
                 expand=False,
             )
@@ -71,3 +78,30 @@ def log(level: ARG_TYPE_LOG_LEVEL) -> None:
     console.print(f"Log level set to [cyan]{level}[/cyan]")
 
     return None
+
+
+@app.command("fft-backend")
+def fft_backend(name: ARG_TYPE_FFT_BACKEND) -> None:
+    """
+    Select and persist the FFT backend used by the analysis commands.
+
+    The [bold]SCALDYS_TEMPLATE_FFT_BACKEND[/bold] environment variable, when set, takes
+    precedence over this setting.
+    """
+    from scaldys_template.core.signal_engine import set_fft_backend
+
+    settings = AppSettings()
+    try:
+        settings.fft_backend = name
+        set_fft_backend(name)  # fails if the backend is not installed
+    except ValidationError:
+        err_console.print(
+            f"[bold red]Error:[/bold red] '[cyan]{name}[/cyan]' is not a valid FFT backend.\n"
+            "Valid choices are: [cyan]auto, numpy, scipy[/cyan]"
+        )
+        raise typer.Exit(code=1)
+    except ValueError as exc:
+        err_console.print(f"[bold red]Error:[/bold red] {exc}")
+        raise typer.Exit(code=1)
+    settings.save()
+    console.print(f"FFT backend set to [cyan]{name}[/cyan]")
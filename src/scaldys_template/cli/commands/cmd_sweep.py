@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+
+"""
+``sweep`` CLI command — analyse a grid of parameter sets in parallel.
+
+Reads a ``SweepSpec`` from a JSON file, analyses every point on a pool of
+worker processes, and writes one CSV row of metrics per point::
+
+    {
+      "base": {"noise_type": "gaussian", "seed": 1, "duration": 0.5},
+      "axes": {"frequency": [100, 1000, 5000], "snr_db": [10, 20, 40],
+               "fft_window": ["hanning", "blackman"]}
+    }
+
+Invocation examples
+--------------------
+    scaldys-template sweep spec.json                       # one worker per CPU
+    scaldys-template sweep spec.json --workers 4
+    scaldys-template sweep spec.json --output ./sweep.csv --force
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
+
+from scaldys_template.__about__ import APP_NAME, PACKAGE_NAME, VERSION
+from scaldys_template.common.app_location import AppLocation
+from scaldys_template.core.sweep import SweepPoint, SweepSpec, load_sweep_spec, run_sweep
+
+__all__ = ["sweep"]
+
+logger = logging.getLogger(PACKAGE_NAME)
+console = Console()
+err_console = Console(stderr=True)
+
+# ---------------------------------------------------------------------------
+# Argument type definitions
+# ---------------------------------------------------------------------------
+
+ARG_TYPE_SPEC_FILE = Annotated[
+    Path,
+    typer.Argument(help="Path to a JSON file containing a SweepSpec (base parameters + axes)."),
+]
+
+ARG_TYPE_WORKERS = Annotated[
+    int | None,
+    typer.Option(
+        "--workers",
+        "-w",
+        help="Number of worker processes.  Defaults to the number of CPUs.",
+        min=1,
+    ),
+]
+
+ARG_TYPE_OUTPUT_FILE = Annotated[
+    Path | None,
+    typer.Option(
+        "--output",
+        "-o",
+        help="Metrics CSV file.  Defaults to <app_data>/sweep_metrics.csv.",
+    ),
+]
+
+ARG_TYPE_FORCE = Annotated[
+    bool,
+    typer.Option(
+        "--force",
+        "-f",
+        help="Overwrite an existing output file.",
+    ),
+]
+
+_METRIC_COLUMNS = ("rms", "peak", "crest_factor", "snr_db", "thd_db", "peak_freq_hz")
+
+
+# ---------------------------------------------------------------------------
+# Command
+# ---------------------------------------------------------------------------
+
+
+def sweep(
+    spec_file: ARG_TYPE_SPEC_FILE,
+    workers: ARG_TYPE_WORKERS = None,
+    output_file: ARG_TYPE_OUTPUT_FILE = None,
+    force: ARG_TYPE_FORCE = False,
+) -> None:
+    """
+    Analyse every point of a parameter sweep and write one metrics table.
+    """
+    logger.info("Starting %s %s — sweep command", APP_NAME, VERSION)
+
+    try:
+        spec = load_sweep_spec(spec_file)
+    except Exception as exc:
+        err_console.print(
+            Panel(
+                f"[red]Failed to load sweep spec:[/red]\n{exc}",
+                title="[bold red]Error[/bold red]",
+                border_style="red",
+            )
+        )
+        raise typer.Exit(code=1) from exc
+
+    if output_file is None:
+        output_file = AppLocation.get_directory(AppLocation.AppDataDir) / "sweep_metrics.csv"
+
+    if output_file.exists() and not force:
+        err_console.print(
+            Panel(
+                f"Output file already exists:\n[cyan]{output_file.resolve()}[/cyan]\n\n"
+                "Use [bold]--force[/bold] to overwrite.",
+                title="[bold red]Error[/bold red]",
+                border_style="red",
+                expand=False,
+            )
+        )
+        raise typer.Exit(code=1)
+
+    n_points = spec.n_points
+    axes = " × ".join(f"{name} ({len(values)})" for name, values in spec.axes.items())
+    console.print(f"\nSweeping [bold]{n_points}[/bold] point(s): {axes}\n")
+
+    points: list[SweepPoint] = []
+    interrupted = False
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task_id = progress.add_task("Analysing points...", total=n_points)
+        try:
+            for point in run_sweep(spec, workers=workers):
+                points.append(point)
+                progress.advance(task_id)
+        except KeyboardInterrupt:
+            interrupted = True
+        except Exception as exc:
+            err_console.print(Panel(f"[red]Sweep error:[/red]\n{exc}", border_style="red"))
+            raise typer.Exit(code=1) from exc
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_metrics_csv(spec, points, output_file)
+
+    if interrupted:
+        console.print(
+            f"\n[yellow]Interrupted by user[/yellow] — {len(points)}/{n_points} point(s) "
+            f"written to [cyan]{output_file}[/cyan]"
+        )
+        raise typer.Exit(code=1)
+
+    console.print(f"Metrics → [cyan]{output_file}[/cyan]")
+    logger.info("Sweep command finished, %d points written to %s", len(points), output_file)
+
+
+def _write_metrics_csv(spec: SweepSpec, points: list[SweepPoint], path: Path) -> None:
+    """Write one row per point, in grid order, under a header of axes + metrics."""
+    names = list(spec.axes)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["point", *names, *_METRIC_COLUMNS])
+        for point in sorted(points, key=lambda p: p.index):
+            m = point.metrics
+            writer.writerow(
+                [
+                    point.index,
+                    *(point.values[name] for name in names),
+                    f"{m.rms:.6f}",
+                    f"{m.peak:.6f}",
+                    f"{m.crest_factor:.4f}",
+                    f"{m.snr_db:.2f}" if m.snr_db is not None else "N/A",
+                    f"{m.thd_db:.2f}",
+                    f"{m.peak_freq:.4f}",
+                ]
+            )
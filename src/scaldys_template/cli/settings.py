@@ -18,9 +18,13 @@ logger = logging.getLogger(PACKAGE_NAME)
 # Valid log-level strings accepted by the CLI; empty string means "not configured"
 _LogLevel = Literal["off", "debug", "info", "warning", "error", "critical", ""]
 
+# Valid FFT backend names; empty string means "not configured"
+_FFTBackend = Literal["auto", "numpy", "scipy", ""]
+
 
 class _SettingsModel(BaseModel):
     log_level: _LogLevel = ""
+    fft_backend: _FFTBackend = ""
 
     model_config = {"extra": "ignore"}
 
@@ -44,7 +48,16 @@ class AppSettings:
 
     @log_level.setter
     def log_level(self, value: str | None) -> None:
-        self._model = _SettingsModel(log_level=cast(_LogLevel, value or ""))
+        self._update(log_level=cast(_LogLevel, value or ""))
+
+    @property
+    def fft_backend(self) -> str | None:
+        value = self._model.fft_backend
+        return value if value else None
+
+    @fft_backend.setter
+    def fft_backend(self, value: str | None) -> None:
+        self._update(fft_backend=cast(_FFTBackend, value or ""))
 
     def save(self) -> None:
         logger.debug("Saving application settings")
@@ -54,6 +67,7 @@ class AppSettings:
         config = configparser.ConfigParser()
         config["DEFAULT"] = {
             "log_level": self._model.log_level,
+            "fft_backend": self._model.fft_backend,
         }
         with self._settings_file_path.open("w") as configfile:
             config.write(configfile)
@@ -62,6 +76,10 @@ class AppSettings:
     # Internal
     # ------------------------------------------------------------------
 
+    def _update(self, **changes: Any) -> None:
+        # Re-validate the whole model so an invalid value raises ValidationError.
+        self._model = _SettingsModel(**{**self._model.model_dump(), **changes})
+
     def _initialize(self) -> None:
         settings_dir = AppLocation.get_directory(AppLocation.AppDataDir)
         if not settings_dir.exists():
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+
+__all__ = ["lazy_exports"]
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Build the ``__getattr__`` and ``__dir__`` of a package with lazy re-exports.
+
+    Each re-exported name is imported from its module on first access
+    (PEP 562) and then cached in the package namespace, so importing the
+    package does not load every module it re-exports from::
+
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+    Parameters
+    ----------
+    module_name:
+        ``__name__`` of the package whose attributes are provided.
+    exports:
+        Re-exported name → name of the module defining it.
+
+    Returns
+    -------
+    tuple
+        The module-level ``__getattr__`` and ``__dir__`` functions.
+    """
+    namespace = vars(sys.modules[module_name])
+
+    def __getattr__(name: str) -> object:
+        if name not in exports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name]), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
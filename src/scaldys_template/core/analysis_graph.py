@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+"""Incremental generate → FFT → metrics pipeline.
+
+``AnalysisGraph`` remembers the intermediate results of its last run and
+which ``SignalParameters`` fields they were computed from.  Each field
+belongs to exactly one stage:
+
+    signal    ← SIGNAL_FIELDS     (waveform, sampling, noise, precision)
+    spectrum  ← SPECTRUM_FIELDS   (window, FFT size, Welch settings) + signal
+    metrics   ← signal + spectrum
+
+so changing only ``fft_window`` re-runs the FFT and the metrics but reuses
+the generated signal, and an unchanged parameter set reuses everything::
+
+    graph = AnalysisGraph()
+    run = graph.run(params)
+    run.result.metrics        # AnalysisResult of the run
+    run.skipped               # e.g. (Stage.SIGNAL,) after an FFT-only change
+
+Random signals without a ``seed`` are regenerated on every run, because
+their "input" includes fresh entropy.
+
+``run`` can report each stage output as soon as it is ready, which lets a
+caller start exporting the signal while the FFT is still running::
+
+    graph.run(params, on_stage=lambda stage, output: exporter.submit(stage, output))
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.core.signal_engine import (
+    DEFAULT_MAX_HARMONIC,
+    AnalysisResult,
+    FFTResult,
+    SignalData,
+    SignalMetrics,
+    SignalWorkspace,
+    compute_fft,
+    compute_metrics,
+    generate_signal,
+)
+from scaldys_template.core.signal_model import NoiseType, SignalParameters, SignalType
+
+__all__ = [
+    "SIGNAL_FIELDS",
+    "SPECTRUM_FIELDS",
+    "AnalysisGraph",
+    "GraphRun",
+    "Stage",
+    "is_reproducible",
+]
+
+logger = logging.getLogger(PACKAGE_NAME)
+
+
+class Stage(StrEnum):
+    SIGNAL = "signal"
+    SPECTRUM = "spectrum"
+    METRICS = "metrics"
+
+
+# Fields read by generate_signal.
+SIGNAL_FIELDS: frozenset[str] = frozenset(
+    {
+        "signal_type",
+        "frequency",
+        "amplitude",
+        "duration",
+        "sampling_rate",
+        "phase_deg",
+        "dc_offset",
+        "noise_type",
+        "snr_db",
+        "streaming",
+        "dtype",
+        "seed",
+    }
+)
+
+# Fields read by compute_fft on top of the signal itself.
+SPECTRUM_FIELDS: frozenset[str] = frozenset(
+    {
+        "fft_window",
+        "fft_size",
+        "fft_fast_length",
+        "fft_mode",
+        "welch_overlap",
+        "welch_average",
+    }
+)
+
+
+@dataclass
+class GraphRun:
+    """Outcome of one ``AnalysisGraph.run`` call."""
+
+    result: AnalysisResult
+    recomputed: tuple[Stage, ...]  # stages executed, in pipeline order
+    skipped: tuple[Stage, ...]  # stages whose cached output was reused
+    timings: dict[Stage, float] = field(default_factory=dict)  # seconds per recomputed stage
+
+
+class AnalysisGraph:
+    """Stage-level cache over ``generate_signal``, ``compute_fft``, and ``compute_metrics``.
+
+    Not thread-safe: use one graph per worker, or serialise calls to
+    :meth:`run` (as the GUI does with its single analysis thread).
+
+    Parameters
+    ----------
+    max_harmonic:
+        Highest harmonic included in the THD, passed to ``compute_metrics``.
+    """
+
+    def __init__(self, *, max_harmonic: int = DEFAULT_MAX_HARMONIC) -> None:
+        self._max_harmonic = max_harmonic
+        self._signal_key: dict[str, Any] | None = None
+        self._spectrum_key: dict[str, Any] | None = None
+        self._signal_data: SignalData | None = None
+        self._fft_result: FFTResult | None = None
+        self._metrics: SignalMetrics | None = None
+        # Bumped whenever a stage is recomputed, so downstream stages can tell
+        # that their input changed even when their own fields did not.
+        self._signal_version = 0
+        self._spectrum_version = 0
+        self._metrics_inputs: tuple[int, int] | None = None
+
+    def stale_stages(self, params: SignalParameters) -> tuple[Stage, ...]:
+        """Return the stages :meth:`run` would execute for *params*."""
+        signal_stale = self._signal_stale(params)
+        spectrum_stale = signal_stale or self._spectrum_stale(params)
+        metrics_stale = spectrum_stale or self._metrics_inputs != (
+            self._signal_version,
+            self._spectrum_version,
+        )
+        stale = (
+            (Stage.SIGNAL, signal_stale),
+            (Stage.SPECTRUM, spectrum_stale),
+            (Stage.METRICS, metrics_stale),
+        )
+        return tuple(stage for stage, is_stale in stale if is_stale)
+
+    def run(
+        self,
+        params: SignalParameters,
+        *,
+        workspace: SignalWorkspace | None = None,
+        on_stage: Callable[[Stage, Any], None] | None = None,
+    ) -> GraphRun:
+        """Bring every stage up to date for *params* and return the result.
+
+        Parameters
+        ----------
+        params:
+            Validated ``SignalParameters`` instance.
+        workspace:
+            Optional ``SignalWorkspace`` for the signal stage (see
+            ``generate_signal``).  The cached signal lives in it until the
+            signal stage runs again, so it must not be reused elsewhere while
+            the graph may still return that signal.
+        on_stage:
+            Called as ``on_stage(stage, output)`` as soon as the output of
+            each stage (``SignalData``, ``FFTResult``, ``SignalMetrics``) is
+            up to date, whether recomputed or reused, in pipeline order.
+            It runs on the calling thread, before the next stage starts.
+
+        Returns
+        -------
+        GraphRun
+            The ``AnalysisResult`` plus the recomputed and skipped stages.
+        """
+        stale = self.stale_stages(params)
+        timings: dict[Stage, float] = {}
+        start = time.perf_counter()
+
+        def finish(stage: Stage, output: Any) -> None:
+            nonlocal start
+            if stage in stale:
+                timings[stage] = time.perf_counter() - start
+            if on_stage is not None:
+                on_stage(stage, output)
+            start = time.perf_counter()
+
+        # A stage whose output is missing is always stale, so every output
+        # is set once its stage has been brought up to date.
+        if Stage.SIGNAL in stale:
+            self._signal_data = generate_signal(params, workspace=workspace)
+            self._signal_key = params.model_dump(include=set(SIGNAL_FIELDS))
+            self._signal_version += 1
+        signal_data = self._signal_data
+        assert signal_data is not None
+        finish(Stage.SIGNAL, signal_data)
+
+        if Stage.SPECTRUM in stale:
+            self._fft_result = compute_fft(signal_data, params)
+            self._spectrum_key = params.model_dump(include=set(SPECTRUM_FIELDS))
+            self._spectrum_version += 1
+        fft_result = self._fft_result
+        assert fft_result is not None
+        finish(Stage.SPECTRUM, fft_result)
+
+        if Stage.METRICS in stale:
+            self._metrics = compute_metrics(
+                signal_data, fft_result, max_harmonic=self._max_harmonic
+            )
+            self._metrics_inputs = (self._signal_version, self._spectrum_version)
+        metrics = self._metrics
+        assert metrics is not None
+        finish(Stage.METRICS, metrics)
+
+        skipped = tuple(stage for stage in Stage if stage not in stale)
+        logger.debug(
+            "Analysis graph run",
+            extra={
+                "recomputed": [str(s) for s in stale],
+                "skipped": [str(s) for s in skipped],
+                "seconds": {str(s): round(t, 6) for s, t in timings.items()},
+            },
+        )
+        return GraphRun(
+            result=AnalysisResult(signal_data=signal_data, fft_result=fft_result, metrics=metrics),
+            recomputed=stale,
+            skipped=skipped,
+            timings=timings,
+        )
+
+    def invalidate(self, stage: Stage = Stage.SIGNAL) -> None:
+        """Force *stage* and everything downstream of it to rerun next time."""
+        if stage == Stage.SIGNAL:
+            self._signal_key = None
+        if stage in (Stage.SIGNAL, Stage.SPECTRUM):
+            self._spectrum_key = None
+        self._metrics_inputs = None
+
+    # ------------------------------------------------------------------
+    # Staleness checks
+    # ------------------------------------------------------------------
+
+    def _signal_stale(self, params: SignalParameters) -> bool:
+        if self._signal_data is None or not is_reproducible(params):
+            return True
+        return params.model_dump(include=set(SIGNAL_FIELDS)) != self._signal_key
+
+    def _spectrum_stale(self, params: SignalParameters) -> bool:
+        if self._fft_result is None:
+            return True
+        return params.model_dump(include=set(SPECTRUM_FIELDS)) != self._spectrum_key
+
+
+def is_reproducible(params: SignalParameters) -> bool:
+    """``True`` unless generating *params* involves unseeded random draws.
+
+    Only reproducible parameter sets have a single well-defined result, so
+    only they can be reused across runs.
+    """
+    is_random = params.signal_type == SignalType.WHITE_NOISE or params.noise_type != NoiseType.NONE
+    return not is_random or params.seed is not None
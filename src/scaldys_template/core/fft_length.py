@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""Fast FFT lengths.
+
+The FFT is fastest for lengths whose only prime factors are 2, 3, and 5
+(*5-smooth* or "regular" numbers); a large prime length falls back to a
+much slower algorithm.  The 5-smooth numbers are dense enough that the
+nearest one is never far away::
+
+    >>> next_fast_length(1000), prev_fast_length(1009)
+    (1000, 1000)
+    >>> next_fast_length(4411), prev_fast_length(4410)
+    (4500, 4374)
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "is_fast_length",
+    "next_fast_length",
+    "prev_fast_length",
+]
+
+
+def is_fast_length(n: int) -> bool:
+    """Return ``True`` if *n* ≥ 1 has no prime factor other than 2, 3, and 5."""
+    if n < 1:
+        return False
+    for p in (2, 3, 5):
+        while n % p == 0:
+            n //= p
+    return n == 1
+
+
+def next_fast_length(n: int) -> int:
+    """Return the smallest 5-smooth number ≥ *n*.
+
+    Raises
+    ------
+    ValueError
+        If *n* < 1.
+    """
+    if n < 1:
+        raise ValueError("n must be ≥ 1.")
+    best = 1 << (n - 1).bit_length()  # next power of two
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # Smallest power of two that lifts p35 to at least n.
+            quotient = -(-n // p35)
+            best = min(best, p35 << (quotient - 1).bit_length())
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def prev_fast_length(n: int) -> int:
+    """Return the largest 5-smooth number ≤ *n*.
+
+    Raises
+    ------
+    ValueError
+        If *n* < 1.
+    """
+    if n < 1:
+        raise ValueError("n must be ≥ 1.")
+    best = 1
+    p5 = 1
+    while p5 <= n:
+        p35 = p5
+        while p35 <= n:
+            # Largest power of two that keeps p35 at most n.
+            best = max(best, p35 << ((n // p35).bit_length() - 1))
+            p35 *= 3
+        p5 *= 5
+    return best
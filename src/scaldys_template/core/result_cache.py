@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+"""Content-addressed on-disk cache of analysis results.
+
+Each entry is keyed by a SHA-256 digest of the canonical JSON form of the
+``SignalParameters`` (seed included), the THD harmonic count, and the
+engine version, and stored as one directory per key::
+
+    <app_data>/result_cache/<key>/
+        meta.json          metrics, time axis, parameters
+        samples.npy        (3, N) signal / noise / composite block
+        frequencies.npy  magnitude_db.npy  phase_deg.npy  magnitude.npy
+
+Arrays are memory-mapped back on a hit — the time-domain samples with a
+single map of one file — so a cached result costs no engine time and is
+only paged in as far as the exporters read it::
+
+    cache = ResultCache()
+    result = cache.get(params)
+    if result is None:
+        result = AnalysisGraph().run(params).result
+        cache.put(params, result)
+
+The cache is bounded by ``max_bytes``; least recently used entries are
+evicted after every store.  Only reproducible parameter sets (see
+``is_reproducible``) are cached — an unseeded noisy run has no single
+result to reuse.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from scaldys_template.__about__ import PACKAGE_NAME, VERSION
+from scaldys_template.common.app_location import AppLocation
+from scaldys_template.core.analysis_graph import is_reproducible
+from scaldys_template.core.signal_engine import (
+    DEFAULT_MAX_HARMONIC,
+    SAMPLE_ROWS,
+    AnalysisResult,
+    FFTResult,
+    SignalData,
+    SignalMetrics,
+    TimeAxis,
+)
+from scaldys_template.core.signal_model import SignalParameters
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_BYTES",
+    "CacheStats",
+    "ResultCache",
+    "default_cache_dir",
+    "result_key",
+]
+
+logger = logging.getLogger(PACKAGE_NAME)
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024**2
+
+# Bump when the on-disk entry layout changes.
+_CACHE_FORMAT = 2
+
+_META_FILE = "meta.json"
+_SAMPLES_FILE = "samples.npy"
+_SPECTRUM_ARRAYS = ("frequencies", "magnitude_db", "phase_deg", "magnitude")
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory, ``<app_data>/result_cache``."""
+    return AppLocation.get_directory(AppLocation.AppDataDir) / "result_cache"
+
+
+def result_key(params: SignalParameters, *, max_harmonic: int = DEFAULT_MAX_HARMONIC) -> str:
+    """Return the cache key of the analysis result for *params*.
+
+    Parameters
+    ----------
+    params:
+        Validated ``SignalParameters`` instance.
+    max_harmonic:
+        Highest harmonic included in the THD of the cached metrics.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest.  Equal parameter sets give equal keys regardless
+        of field order; any change to a parameter, the harmonic count, or the
+        package version gives a new key.
+    """
+    payload = {
+        "format": _CACHE_FORMAT,
+        "engine": VERSION,
+        "max_harmonic": max_harmonic,
+        "params": params.model_dump(mode="json"),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of the cache contents."""
+
+    directory: Path
+    entries: int
+    total_bytes: int
+    max_bytes: int
+
+
+class ResultCache:
+    """Size-bounded, least-recently-used store of ``AnalysisResult`` objects.
+
+    Parameters
+    ----------
+    directory:
+        Cache root.  Defaults to :func:`default_cache_dir`; created on first
+        store.
+    max_bytes:
+        Upper bound on the total size of all entries.
+    max_harmonic:
+        Harmonic count the cached metrics were computed with; part of the key.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        max_harmonic: int = DEFAULT_MAX_HARMONIC,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be ≥ 0.")
+        self.directory = directory if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._max_harmonic = max_harmonic
+
+    def get(self, params: SignalParameters) -> AnalysisResult | None:
+        """Return the cached result for *params*, or ``None`` on a miss.
+
+        The returned arrays are read-only memory maps of the entry files.
+        A corrupt or unreadable entry is discarded and reported as a miss.
+        """
+        if not is_reproducible(params):
+            return None
+        entry = self.directory / result_key(params, max_harmonic=self._max_harmonic)
+        meta_path = entry / _META_FILE
+        if not meta_path.exists():
+            return None
+        try:
+            result = _load_entry(entry)
+            os.utime(meta_path)  # mark as most recently used
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Discarding unreadable cache entry %s: %s", entry.name, exc)
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        logger.debug("Result cache hit", extra={"key": entry.name})
+        return result
+
+    def put(self, params: SignalParameters, result: AnalysisResult) -> bool:
+        """Store *result* as the analysis result of *params*.
+
+        Returns
+        -------
+        bool
+            ``True`` if the entry was stored; ``False`` if *params* is not
+            reproducible, the entry alone exceeds ``max_bytes``, or it could
+            not be written (the failure is logged, never raised).
+        """
+        if not is_reproducible(params):
+            return False
+        key = result_key(params, max_harmonic=self._max_harmonic)
+        entry = self.directory / key
+        if (entry / _META_FILE).exists():
+            return True
+        if _result_nbytes(result) > self.max_bytes:
+            logger.debug("Result too large to cache", extra={"key": key})
+            return False
+
+        # Write into a private directory first so that readers (or another
+        # process storing the same key) never observe a partial entry.
+        staging = self.directory / f".{key}.{os.getpid()}.tmp"
+        try:
+            staging.mkdir(parents=True, exist_ok=True)
+            _write_entry(staging, params, result)
+            try:
+                staging.rename(entry)
+            except OSError:
+                if not (entry / _META_FILE).exists():
+                    raise
+        except OSError as exc:
+            logger.warning("Failed to store cache entry %s: %s", key, exc)
+            return False
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        logger.debug("Result cached", extra={"key": key})
+        self.evict()
+        return True
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """Remove least recently used entries until the cache fits.
+
+        Parameters
+        ----------
+        max_bytes:
+            Size bound to enforce; defaults to ``self.max_bytes``.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda e: e[1])  # oldest first
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for path, _, size in entries:
+            if total <= limit:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug("Result cache evicted", extra={"entries": removed})
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry and return how many there were."""
+        return self.evict(0)
+
+    def stats(self) -> CacheStats:
+        """Return the number and total size of the stored entries."""
+        entries = self._entries()
+        return CacheStats(
+            directory=self.directory,
+            entries=len(entries),
+            total_bytes=sum(size for _, _, size in entries),
+            max_bytes=self.max_bytes,
+        )
+
+    def _entries(self) -> list[tuple[Path, float, int]]:
+        """``(path, last_used, size_bytes)`` of every complete entry."""
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.iterdir():
+            meta_path = path / _META_FILE
+            if path.name.startswith(".") or not meta_path.is_file():
+                continue
+            try:
+                last_used = meta_path.stat().st_mtime
+                size = sum(f.stat().st_size for f in path.iterdir())
+            except OSError:  # removed concurrently
+                continue
+            entries.append((path, last_used, size))
+        return entries
+
+
+def _result_nbytes(result: AnalysisResult) -> int:
+    sd, fft = result.signal_data, result.fft_result
+    arrays = [fft.frequencies, fft.magnitude_db, fft.phase_deg]
+    if fft.magnitude is not None:
+        arrays.append(fft.magnitude)
+    return len(SAMPLE_ROWS) * sd.signal.nbytes + sum(a.nbytes for a in arrays)
+
+
+def _save_samples(path: Path, signal_data: SignalData) -> None:
+    """Write the ``(3, N)`` sample block of *signal_data* as one ``.npy`` file."""
+    if signal_data.samples is not None:
+        np.save(path, signal_data.samples, allow_pickle=False)
+        return
+    # Fill the file row by row rather than stacking a temporary block first.
+    n_samples = len(signal_data.signal)
+    block = np.lib.format.open_memmap(
+        path, mode="w+", dtype=signal_data.signal.dtype, shape=(len(SAMPLE_ROWS), n_samples)
+    )
+    try:
+        block[0] = signal_data.signal
+        block[1] = signal_data.noise_samples()
+        block[2] = signal_data.composite
+        block.flush()
+    finally:
+        del block  # release the mapping before the entry is renamed
+
+
+def _write_entry(entry: Path, params: SignalParameters, result: AnalysisResult) -> None:
+    sd, fft = result.signal_data, result.fft_result
+    _save_samples(entry / _SAMPLES_FILE, sd)
+    for name in _SPECTRUM_ARRAYS:
+        values = getattr(fft, name)
+        if values is not None:
+            np.save(entry / f"{name}.npy", values, allow_pickle=False)
+    time = sd.time
+    meta = {
+        "time": {"dt": time.dt, "n": time.n, "start": time.start},
+        "sample_rate": sd.sample_rate,
+        "has_noise": sd.has_noise,
+        "metrics": asdict(result.metrics),
+        "params": params.model_dump(mode="json"),
+    }
+    # meta.json is written last: its presence marks the entry as complete.
+    (entry / _META_FILE).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+
+def _load_entry(entry: Path) -> AnalysisResult:
+    meta = json.loads((entry / _META_FILE).read_text(encoding="utf-8"))
+
+    def load(name: str) -> np.ndarray:
+        return np.load(entry / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+
+    samples = np.load(entry / _SAMPLES_FILE, mmap_mode="r", allow_pickle=False)
+    if samples.ndim != 2 or samples.shape[0] != len(SAMPLE_ROWS):
+        raise ValueError(f"Unexpected sample block shape {samples.shape}.")
+    signal, noise, composite = samples
+    magnitude_path = entry / "magnitude.npy"
+    return AnalysisResult(
+        signal_data=SignalData(
+            time=TimeAxis(**meta["time"]),
+            signal=signal,
+            noise=noise if meta["has_noise"] else noise[:0],
+            composite=composite,
+            sample_rate=meta["sample_rate"],
+            samples=samples,
+        ),
+        fft_result=FFTResult(
+            frequencies=load("frequencies"),
+            magnitude_db=load("magnitude_db"),
+            phase_deg=load("phase_deg"),
+            magnitude=load("magnitude") if magnitude_path.exists() else None,
+        ),
+        metrics=SignalMetrics(**meta["metrics"]),
+    )
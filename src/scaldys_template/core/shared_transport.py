@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+
+"""Pass ``SignalData`` / ``FFTResult`` arrays between processes without pickling.
+
+Arrays are placed in ``multiprocessing.shared_memory`` blocks and only small,
+picklable descriptors (block name, shape, dtype, offset) cross the process
+boundary.  The receiving process maps the same pages, so a multi-megabyte
+signal costs one copy into shared memory instead of a pickle round trip
+through a pipe.
+
+Every block is created and owned by a ``SharedArena`` in the parent process;
+workers only attach.  The two directions look like this::
+
+    with SharedArena() as arena:
+        # parent → worker: copy an existing result into shared memory
+        desc = arena.share_signal_data(signal_data)
+        executor.submit(work, desc)              # worker: attach_signal_data(desc)
+
+        # worker → parent: pre-allocate result slots sized from the parameters
+        slots = arena.allocate_result(params)
+        filled = executor.submit(work, params, slots).result()
+        #                      worker: return store_result(slots, result)
+        result = attach_result(filled)           # views into the arena's blocks
+
+Lifetime rules
+--------------
+- Attached arrays keep their block mapped for as long as any view of them
+  is alive, even after the arena has been closed.
+- ``SharedArena.close()`` (also run on ``with`` exit, garbage collection,
+  and interpreter exit) unlinks every block, so no block outlives its
+  owner.  If the owner is killed outright, the ``multiprocessing`` resource
+  tracker unlinks its blocks.
+- Once ``_shutdown_event`` in ``__main__`` is set, arenas refuse to create
+  new blocks, so a run interrupted mid-way only has to unwind.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import math
+import threading
+import weakref
+from collections.abc import Sequence
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.core.signal_engine import (
+    SAMPLE_ROWS,
+    AnalysisResult,
+    FFTResult,
+    SignalData,
+    SignalMetrics,
+    TimeAxis,
+)
+from scaldys_template.core.signal_model import NoiseType, SignalParameters
+
+__all__ = [
+    "AnalysisResultDescriptor",
+    "ArrayDescriptor",
+    "FFTResultDescriptor",
+    "SharedArena",
+    "SignalDataDescriptor",
+    "attach_array",
+    "attach_fft_result",
+    "attach_result",
+    "attach_signal_data",
+    "store_result",
+]
+
+logger = logging.getLogger(PACKAGE_NAME)
+
+# Byte alignment of every array inside a block (one cache line).
+_ALIGN = 64
+
+
+# ---------------------------------------------------------------------------
+# Descriptors
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ArrayDescriptor:
+    """Location of one array inside a shared memory block."""
+
+    block: str  # SharedMemory name
+    shape: tuple[int, ...]
+    dtype: str  # numpy dtype string, e.g. "<f8"
+    offset: int  # byte offset of the first element within the block
+
+    @property
+    def nbytes(self) -> int:
+        return math.prod(self.shape) * np.dtype(self.dtype).itemsize
+
+
+@dataclass(frozen=True)
+class SignalDataDescriptor:
+    """Picklable stand-in for a ``SignalData`` living in shared memory.
+
+    ``samples`` describes the ``(3, N)`` block whose rows the three sample
+    descriptors point into; ``noise`` has shape ``(0,)`` when there is no
+    noise, although its row is still present (and zero) in the block.
+    """
+
+    time: TimeAxis
+    signal: ArrayDescriptor
+    noise: ArrayDescriptor
+    composite: ArrayDescriptor
+    sample_rate: float
+    samples: ArrayDescriptor | None = None
+
+
+@dataclass(frozen=True)
+class FFTResultDescriptor:
+    """Picklable stand-in for an ``FFTResult`` living in shared memory."""
+
+    frequencies: ArrayDescriptor
+    magnitude_db: ArrayDescriptor
+    phase_deg: ArrayDescriptor
+    magnitude: ArrayDescriptor | None
+
+
+@dataclass(frozen=True)
+class AnalysisResultDescriptor:
+    """Picklable stand-in for an ``AnalysisResult``.
+
+    ``metrics`` travel by value; they are ``None`` for result slots that
+    have been allocated but not yet filled by :func:`store_result`.
+    """
+
+    signal_data: SignalDataDescriptor
+    fft_result: FFTResultDescriptor
+    metrics: SignalMetrics | None = None
+
+
+# ---------------------------------------------------------------------------
+# Owner side
+# ---------------------------------------------------------------------------
+
+
+class SharedArena:
+    """Creates, owns, and unlinks the shared memory blocks of a run.
+
+    Each ``share_*`` / ``allocate_*`` call creates one block holding all
+    arrays of that object.  Descriptors stay valid until :meth:`close`.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: dict[str, SharedMemory] = {}
+        self._lock = threading.Lock()
+        # Runs on close(), garbage collection, or interpreter exit —
+        # whichever comes first.
+        self._finalizer = weakref.finalize(self, _release_blocks, self._blocks)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    @property
+    def n_blocks(self) -> int:
+        """Number of blocks currently owned."""
+        return len(self._blocks)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the blocks currently owned."""
+        return sum(shm.size for shm in self._blocks.values())
+
+    def share_array(self, array: npt.ArrayLike) -> ArrayDescriptor:
+        """Copy *array* into a new block and return its descriptor."""
+        (desc,) = self._share([np.asarray(array)])
+        return desc
+
+    def share_signal_data(self, signal_data: SignalData) -> SignalDataDescriptor:
+        """Copy the samples of *signal_data* into a new ``(3, N)`` block.
+
+        A signal backed by ``samples`` is copied in one pass.
+        """
+        if signal_data.samples is not None:
+            (samples,) = self._share([signal_data.samples])
+        else:
+            shape = (len(SAMPLE_ROWS), len(signal_data.signal))
+            (samples,) = self._allocate([(shape, signal_data.signal.dtype)])
+            block = _view(self._blocks[samples.block], samples)
+            block[0] = signal_data.signal
+            block[1] = signal_data.noise_samples()
+            block[2] = signal_data.composite
+            del block
+        return _signal_data_descriptor(
+            signal_data.time, samples, signal_data.has_noise, signal_data.sample_rate
+        )
+
+    def share_fft_result(self, fft_result: FFTResult) -> FFTResultDescriptor:
+        """Copy the arrays of *fft_result* into a new block."""
+        arrays = [fft_result.frequencies, fft_result.magnitude_db, fft_result.phase_deg]
+        if fft_result.magnitude is not None:
+            arrays.append(fft_result.magnitude)
+        frequencies, magnitude_db, phase_deg, *magnitude = self._share(arrays)
+        return FFTResultDescriptor(
+            frequencies=frequencies,
+            magnitude_db=magnitude_db,
+            phase_deg=phase_deg,
+            magnitude=magnitude[0] if magnitude else None,
+        )
+
+    def share_result(self, result: AnalysisResult) -> AnalysisResultDescriptor:
+        """Copy every array of *result* into shared memory."""
+        return AnalysisResultDescriptor(
+            signal_data=self.share_signal_data(result.signal_data),
+            fft_result=self.share_fft_result(result.fft_result),
+            metrics=result.metrics,
+        )
+
+    def allocate_result(self, params: SignalParameters) -> AnalysisResultDescriptor:
+        """Allocate zero-filled slots for the in-memory analysis of *params*.
+
+        The shapes and dtypes match what ``generate_signal`` and
+        ``compute_fft`` return for *params*, so a worker can fill the slots
+        with :func:`store_result`.
+        """
+        n_samples = int(params.duration * params.sampling_rate)
+        n_bins = params.transform_size // 2 + 1
+        dtype = np.dtype(str(params.dtype))
+        samples, frequencies, magnitude_db, phase_deg, magnitude = self._allocate(
+            [
+                ((len(SAMPLE_ROWS), n_samples), dtype),
+                ((n_bins,), np.dtype(np.float64)),
+                ((n_bins,), dtype),
+                ((n_bins,), dtype),
+                ((n_bins,), dtype),
+            ]
+        )
+        return AnalysisResultDescriptor(
+            signal_data=_signal_data_descriptor(
+                TimeAxis(dt=1.0 / params.sampling_rate, n=n_samples),
+                samples,
+                params.noise_type != NoiseType.NONE,
+                params.sampling_rate,
+            ),
+            fft_result=FFTResultDescriptor(
+                frequencies=frequencies,
+                magnitude_db=magnitude_db,
+                phase_deg=phase_deg,
+                magnitude=magnitude,
+            ),
+        )
+
+    def close(self) -> None:
+        """Unlink every block.  Arrays already attached stay readable."""
+        self._finalizer()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _share(self, arrays: Sequence[np.ndarray]) -> list[ArrayDescriptor]:
+        descriptors = self._allocate([(a.shape, a.dtype) for a in arrays])
+        shm = self._blocks[descriptors[0].block]
+        for desc, array in zip(descriptors, arrays):
+            _view(shm, desc)[...] = array
+        return descriptors
+
+    def _allocate(self, specs: Sequence[tuple[tuple[int, ...], np.dtype]]) -> list[ArrayDescriptor]:
+        """Create one block laid out for *specs* and describe its arrays."""
+        if _shutdown_requested():
+            raise RuntimeError("Shutdown in progress; no new shared memory blocks are created.")
+
+        offsets = []
+        size = 0
+        for shape, dtype in specs:
+            nbytes = math.prod(shape) * dtype.itemsize
+            if nbytes:
+                size = -(-size // _ALIGN) * _ALIGN
+            offsets.append(size)
+            size += nbytes
+
+        with self._lock:
+            if self.closed:
+                raise RuntimeError("SharedArena is closed.")
+            shm = SharedMemory(create=True, size=max(size, 1))
+            self._blocks[shm.name] = shm
+
+        logger.debug("Shared memory block created", extra={"block": shm.name, "size": size})
+        return [
+            ArrayDescriptor(block=shm.name, shape=tuple(shape), dtype=dtype.str, offset=offset)
+            for (shape, dtype), offset in zip(specs, offsets)
+        ]
+
+
+def _signal_data_descriptor(
+    time: TimeAxis, samples: ArrayDescriptor, has_noise: bool, sample_rate: float
+) -> SignalDataDescriptor:
+    """Describe the rows of the ``(3, N)`` block *samples* as a signal."""
+    n_samples = samples.shape[1]
+    row_bytes = n_samples * np.dtype(samples.dtype).itemsize
+
+    def row(index: int, length: int) -> ArrayDescriptor:
+        offset = samples.offset + index * row_bytes
+        return dataclasses.replace(samples, shape=(length,), offset=offset)
+
+    return SignalDataDescriptor(
+        time=time,
+        signal=row(0, n_samples),
+        noise=row(1, n_samples if has_noise else 0),
+        composite=row(2, n_samples),
+        sample_rate=sample_rate,
+        samples=samples,
+    )
+
+
+def _release_blocks(blocks: dict[str, SharedMemory]) -> None:
+    for name, shm in list(blocks.items()):
+        try:
+            shm.close()
+        except BufferError:  # still viewed in this process; unmapped on last release
+            pass
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Failed to unlink shared memory block %s: %s", name, exc)
+    if blocks:
+        logger.debug("Shared memory blocks released", extra={"n_blocks": len(blocks)})
+    blocks.clear()
+
+
+def _shutdown_requested() -> bool:
+    # Imported lazily, as in async_processor: __main__ is not loaded when the
+    # module is used from tests or from a worker process.
+    try:
+        from scaldys_template.__main__ import _shutdown_event
+    except ImportError:
+        return False
+    return _shutdown_event.is_set()
+
+
+# ---------------------------------------------------------------------------
+# Attaching side
+# ---------------------------------------------------------------------------
+
+
+class _BlockBuffer:
+    """Buffer exporter that keeps an attached block mapped while it is viewed.
+
+    Arrays created on top of it hold it as their ``base``; once the last view
+    is gone it is collected and the ``SharedMemory`` handle closes itself.
+    """
+
+    __slots__ = ("_shm",)
+
+    def __init__(self, shm: SharedMemory) -> None:
+        self._shm = shm
+
+    def __buffer__(self, flags: int) -> memoryview:
+        buf = self._shm.buf
+        assert buf is not None  # the handle closes only after the last view is gone
+        return buf
+
+
+def _view(buffer: SharedMemory | _BlockBuffer, desc: ArrayDescriptor) -> np.ndarray:
+    buf = buffer.buf if isinstance(buffer, SharedMemory) else buffer
+    return np.ndarray(desc.shape, dtype=np.dtype(desc.dtype), buffer=buf, offset=desc.offset)
+
+
+class _Attacher:
+    """Opens each block once per attach call."""
+
+    def __init__(self, writeable: bool) -> None:
+        self._writeable = writeable
+        self._buffers: dict[str, _BlockBuffer] = {}
+
+    def __call__(self, desc: ArrayDescriptor) -> np.ndarray:
+        buffer = self._buffers.get(desc.block)
+        if buffer is None:
+            # track=False: the owner unlinks the block, not this process's
+            # resource tracker.
+            buffer = _BlockBuffer(SharedMemory(desc.block, track=False))
+            self._buffers[desc.block] = buffer
+        array = _view(buffer, desc)
+        array.flags.writeable = self._writeable
+        return array
+
+
+def attach_array(desc: ArrayDescriptor, *, writeable: bool = False) -> np.ndarray:
+    """Return a view of the shared array described by *desc*.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the block no longer exists (its arena was closed).
+    """
+    return _Attacher(writeable)(desc)
+
+
+def attach_signal_data(desc: SignalDataDescriptor, *, writeable: bool = False) -> SignalData:
+    """Return a ``SignalData`` whose arrays are views into shared memory."""
+    return _attach_signal_data(desc, _Attacher(writeable))
+
+
+def attach_fft_result(desc: FFTResultDescriptor, *, writeable: bool = False) -> FFTResult:
+    """Return an ``FFTResult`` whose arrays are views into shared memory."""
+    return _attach_fft_result(desc, _Attacher(writeable))
+
+
+def attach_result(desc: AnalysisResultDescriptor, *, writeable: bool = False) -> AnalysisResult:
+    """Return an ``AnalysisResult`` whose arrays are views into shared memory.
+
+    Raises
+    ------
+    ValueError
+        If *desc* is an allocated slot that has not been filled yet.
+    """
+    if desc.metrics is None:
+        raise ValueError("Result slot has not been filled; call store_result first.")
+    attach = _Attacher(writeable)
+    return AnalysisResult(
+        signal_data=_attach_signal_data(desc.signal_data, attach),
+        fft_result=_attach_fft_result(desc.fft_result, attach),
+        metrics=desc.metrics,
+    )
+
+
+def store_result(
+    desc: AnalysisResultDescriptor, result: AnalysisResult
+) -> AnalysisResultDescriptor:
+    """Copy *result* into the slots of *desc* (see ``SharedArena.allocate_result``).
+
+    Returns
+    -------
+    AnalysisResultDescriptor
+        *desc* with the metrics and time axis of *result*; send it back to
+        the owner, which reads the result with :func:`attach_result`.
+
+    Raises
+    ------
+    ValueError
+        If an array of *result* does not match the shape of its slot.
+    """
+    attach = _Attacher(writeable=True)
+    sd, fft = result.signal_data, result.fft_result
+    pairs = [
+        (desc.signal_data.signal, sd.signal),
+        (desc.signal_data.noise, sd.noise),
+        (desc.signal_data.composite, sd.composite),
+        (desc.fft_result.frequencies, fft.frequencies),
+        (desc.fft_result.magnitude_db, fft.magnitude_db),
+        (desc.fft_result.phase_deg, fft.phase_deg),
+    ]
+    if desc.fft_result.magnitude is not None and fft.magnitude is not None:
+        pairs.append((desc.fft_result.magnitude, fft.magnitude))
+    for slot, values in pairs:
+        if tuple(slot.shape) != values.shape:
+            raise ValueError(
+                f"Result array of shape {values.shape} does not fit slot {slot.shape}."
+            )
+        attach(slot)[...] = values
+    return dataclasses.replace(
+        desc,
+        signal_data=dataclasses.replace(desc.signal_data, time=sd.time),
+        metrics=result.metrics,
+    )
+
+
+def _attach_signal_data(desc: SignalDataDescriptor, attach: _Attacher) -> SignalData:
+    if desc.samples is None:
+        return SignalData(
+            time=desc.time,
+            signal=attach(desc.signal),
+            noise=attach(desc.noise),
+            composite=attach(desc.composite),
+            sample_rate=desc.sample_rate,
+        )
+    samples = attach(desc.samples)
+    signal, noise, composite = samples
+    return SignalData(
+        time=desc.time,
+        signal=signal,
+        noise=noise[: desc.noise.shape[0]],
+        composite=composite,
+        sample_rate=desc.sample_rate,
+        samples=samples,
+    )
+
+
+def _attach_fft_result(desc: FFTResultDescriptor, attach: _Attacher) -> FFTResult:
+    return FFTResult(
+        frequencies=attach(desc.frequencies),
+        magnitude_db=attach(desc.magnitude_db),
+        phase_deg=attach(desc.phase_deg),
+        magnitude=attach(desc.magnitude) if desc.magnitude is not None else None,
+    )
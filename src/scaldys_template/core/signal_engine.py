@@ -3,38 +3,120 @@
 """Signal generation, FFT computation, and metrics.
 
 All functions are pure (no I/O, no GUI dependency) and operate on NumPy
-arrays.  The public surface is small:
+arrays.  A run is three calls:
 
     signal_data = generate_signal(params)
     fft_result  = compute_fft(signal_data, params)
     metrics     = compute_metrics(signal_data, fft_result)
 
-``SignalData``, ``FFTResult``, and ``SignalMetrics`` are dataclasses used as
-typed result containers throughout the application.
+A time-frequency view is available from ``compute_stft``, which returns a
+``Spectrogram``.
+
+Every rFFT goes through the selected FFT backend (``get_fft_backend``).
+NumPy is always available; ``scipy.fft`` is picked up automatically when
+installed, which transforms batches on all cores (or on as many threads as
+``SCALDYS_TEMPLATE_FFT_WORKERS`` allows).  The backend is chosen with
+``set_fft_backend`` or the ``SCALDYS_TEMPLATE_FFT_BACKEND`` environment
+variable, and further backends can be added with ``register_fft_backend``.
+
+Signals too long to hold in memory are produced chunk by chunk with
+``iter_signal_chunks`` and reduced in constant memory by a
+``MetricsAccumulator``.  Live feeds are monitored with the
+``StreamingAnalyzer`` of ``scaldys_template.core.streaming``, which builds on
+the spectrum and metrics helpers of this module: ``rfft_spectrum``,
+``spectral_metrics``, ``sum_squares``, and ``peak_abs``.  These are internal
+API shared between the two modules; they are left out of ``__all__`` and
+may change without notice.
+
+``params.dtype`` selects float64 (default) or float32 sample and spectrum
+arrays; the time and frequency axes stay float64, and metrics are always
+accumulated in float64.
+
+Many parameter sets can be run at once with ``analyze_batch``, which stacks
+runs of equal length into 2-D arrays and returns the same per-item results as
+the scalar path.
+
+When only the metrics are wanted (sweeps, batch jobs), ``measure_metrics``
+and ``measure_batch`` skip the ``FFTResult``: they take the spectral peak
+and its harmonics from the magnitude alone, and for long transforms evaluate
+just those few bins directly instead of running the full rFFT.
+
+Multi-channel captures are held as ``(channels, N)`` arrays in one
+``SignalData`` (see ``capture_signal`` and ``stack_channels``).
+``compute_fft`` transforms every channel with one batched rFFT, and
+``compute_channel_metrics`` / ``measure_channel_metrics`` return a
+``ChannelMetrics`` whose fields are per-channel arrays.
+
+``SignalData``, ``FFTResult``, ``SignalMetrics``, ``Spectrogram``, and
+``AnalysisResult`` are dataclasses used as typed result containers throughout
+the application.  ``SignalData.time`` is a lazily evaluated ``TimeAxis``.
 """
 
 from __future__ import annotations
 
+import importlib
 import logging
-from dataclasses import dataclass
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import NamedTuple
 
 import numpy as np
+import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
 
-from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.__about__ import FFT_BACKEND_ENV, FFT_WORKERS_ENV, PACKAGE_NAME
 from scaldys_template.core.signal_model import (
+    MAX_SAMPLES,
+    FFTMode,
     NoiseType,
     SignalParameters,
     SignalType,
+    SpectrumAverage,
     WindowType,
 )
 
 __all__ = [
+    "TimeAxis",
     "SignalData",
     "FFTResult",
     "SignalMetrics",
+    "ChannelMetrics",
+    "Spectrogram",
+    "AnalysisResult",
+    "MetricsAccumulator",
+    "SignalWorkspace",
+    "WindowCoefficients",
+    "WindowCacheInfo",
+    "get_window",
+    "window_cache_info",
+    "clear_window_cache",
+    "FFTBackend",
+    "get_fft_backend",
+    "set_fft_backend",
+    "register_fft_backend",
+    "available_fft_backends",
+    "FFT_BACKEND_ENV",
+    "FFT_WORKERS_ENV",
+    "init_pool_worker",
     "generate_signal",
+    "capture_signal",
+    "stack_channels",
     "compute_fft",
     "compute_metrics",
+    "compute_channel_metrics",
+    "compute_stft",
+    "measure_metrics",
+    "measure_channel_metrics",
+    "analyze_batch",
+    "measure_batch",
+    "iter_signal_chunks",
+    "spawn_rngs",
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_MAX_HARMONIC",
+    "SAMPLE_ROWS",
 ]
 
 logger = logging.getLogger(PACKAGE_NAME)
@@ -42,30 +124,216 @@ logger = logging.getLogger(PACKAGE_NAME)
 # Floating-point floor used before log10 to avoid -inf in magnitude array.
 _LOG_FLOOR = 1e-12
 
+# Maximum number of distinct (window type, length, dtype) entries kept by the
+# window coefficient cache.  Sweeps typically cycle through a handful of
+# windows and FFT sizes, so a small bound is plenty.
+_WINDOW_CACHE_MAXSIZE = 32
+
+# Default number of samples per chunk yielded by ``iter_signal_chunks``
+# (512 KiB per float64 array).
+DEFAULT_CHUNK_SIZE = 65_536
+
+# Upper bound on the number of samples windowed and transformed per batched
+# rFFT in ``compute_stft`` (32 MiB of float64), which keeps the complex
+# intermediate bounded for multi-million-sample captures.
+_STFT_BLOCK_SAMPLES = 1 << 22
+
+# Number of samples per row reduced at a time by the metrics pass (128 KiB of
+# float64), small enough for the block to stay in L2 while RMS and peak are
+# taken from it.
+_REDUCE_BLOCK = 1 << 14
+
+# Transform length from which evaluating the handful of bins the metrics need
+# (about a dozen) directly beats computing the whole rFFT: about 2× faster at
+# 2¹⁶ points and 4× at 2²⁰.  Below it the fixed cost of the direct DFT wins.
+_TARGETED_MIN_SIZE = 1 << 16
+
+# Smallest SNR plus processing gain, 10·log10(segment length), in dB at which
+# the spectral peak is taken to sit next to the nominal frequency (or at DC)
+# rather than on a noise bin.  At 30 dB a noise bin would have to exceed its
+# mean power about 150-fold, which does not happen at any supported length.
+_TARGETED_MIN_GAIN_DB = 30.0
+
+# Bins either side of the nominal fundamental searched for the spectral peak;
+# covers the main lobe of every window type.
+_TARGETED_PEAK_SEARCH = 3
+
+# Highest harmonic included in the THD unless the caller asks otherwise.
+DEFAULT_MAX_HARMONIC = 5
+
+# Row order of the ``SignalData.samples`` block.
+SAMPLE_ROWS = ("signal", "noise", "composite")
+
 
 # ---------------------------------------------------------------------------
 # Result containers
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class TimeAxis:
+    """Uniformly sampled time axis ``t[i] = (start + i) * dt``, evaluated lazily.
+
+    Stands in for a 1-D float64 array of ``n`` values: ``len()``, integer and
+    slice indexing, iteration, and ``np.asarray()`` all work, but values are
+    only computed for the samples that are actually requested.  ``start`` is
+    the absolute index of the first sample, so the axis of a streamed chunk
+    holds exactly the same values as the matching slice of the full axis.
+    """
+
+    dt: float  # sample spacing in seconds
+    n: int  # number of samples
+    start: int = 0  # absolute index of the first sample
+
+    @property
+    def t0(self) -> float:
+        """Time of the first sample in seconds."""
+        return self.start * self.dt
+
+    @property
+    def shape(self) -> tuple[int]:
+        return (self.n,)
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def size(self) -> int:
+        return self.n
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float64)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(
+        self, index: int | np.integer | slice | npt.NDArray[np.integer] | npt.NDArray[np.bool_]
+    ) -> np.float64 | np.ndarray:
+        if isinstance(index, slice):
+            lo, hi, step = index.indices(self.n)
+            return np.arange(self.start + lo, self.start + hi, step, dtype=np.float64) * self.dt
+        if isinstance(index, (int, np.integer)):
+            i = int(index) + self.n if index < 0 else int(index)
+            if not 0 <= i < self.n:
+                raise IndexError(f"index {index} is out of bounds for a time axis of {self.n}")
+            return np.float64(self.start + i) * self.dt
+        return self.to_array()[index]
+
+    def __array__(self, dtype: npt.DTypeLike | None = None, copy: bool | None = None) -> np.ndarray:
+        values = self.to_array()
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def to_array(self) -> np.ndarray:
+        """Materialise all ``n`` time values as a new float64 array."""
+        return np.arange(self.start, self.start + self.n, dtype=np.float64) * self.dt
+
+
 @dataclass
 class SignalData:
-    """Time-domain arrays produced by ``generate_signal``."""
+    """Time-domain arrays produced by ``generate_signal``.
+
+    Only the arrays a run actually needs are stored: ``time`` is an implicit
+    ``TimeAxis``, ``noise`` is a zero-size array when no noise was added, and
+    ``composite`` *is* ``signal`` (the same array object) when there is
+    neither noise nor DC offset.  Treat all arrays as read-only.
+
+    Signals generated with ``contiguous=True`` (or converted with
+    :meth:`contiguous`) are additionally backed by ``samples``, one
+    C-contiguous ``(3, N)`` buffer whose rows are ``signal``,
+    ``noise_samples()``, and ``composite``; the three arrays are views of
+    its rows, so the whole signal can be saved, memory-mapped, or shared as
+    a single buffer.
 
-    time: np.ndarray  # shape (N,)  — time axis in seconds
-    signal: np.ndarray  # shape (N,)  — clean waveform (no noise, no DC)
-    noise: np.ndarray  # shape (N,)  — noise component (zeros if no noise)
-    composite: np.ndarray  # shape (N,)  — signal + noise + dc_offset
+    A multi-channel signal stores ``(channels, N)`` arrays (and a
+    ``(channels, 0)`` noise sentinel) that share one time axis; the
+    analysis functions work along the last axis and so cover every channel
+    at once.  :meth:`channel` returns one channel as single-channel data.
+    """
+
+    time: TimeAxis  # N samples — time axis in seconds
+    signal: np.ndarray  # shape (N,) or (C, N) — clean waveform (no noise, no DC)
+    noise: np.ndarray  # shape (N,) or (C, N) — noise component; last axis 0 if no noise
+    composite: np.ndarray  # shape (N,) or (C, N) — signal + noise + dc_offset
     sample_rate: float  # Hz
+    # shape (3, N) or (3, C, N) — rows SAMPLE_ROWS backing the arrays above, or None
+    samples: np.ndarray | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def has_noise(self) -> bool:
+        """``True`` when a noise array was stored for this signal."""
+        return self.noise.size > 0
+
+    @property
+    def is_multichannel(self) -> bool:
+        """``True`` when the sample arrays have shape ``(channels, N)``."""
+        return self.composite.ndim == 2
+
+    @property
+    def n_channels(self) -> int:
+        """Number of channels (1 for single-channel, 1-D data)."""
+        return self.composite.shape[0] if self.is_multichannel else 1
+
+    def channel(self, index: int) -> SignalData:
+        """Return channel *index* of a multi-channel signal as 1-D views.
+
+        Raises
+        ------
+        ValueError
+            If the signal is not multi-channel.
+        """
+        if not self.is_multichannel:
+            raise ValueError("channel() requires a multi-channel signal.")
+        return SignalData(
+            time=self.time,
+            signal=self.signal[index],
+            noise=self.noise[index],
+            composite=self.composite[index],
+            sample_rate=self.sample_rate,
+        )
+
+    def noise_samples(self) -> np.ndarray:
+        """Return the noise with one value per sample.
+
+        Without noise this is a read-only, zero-stride view of a single zero,
+        so no N-sample buffer is allocated.
+        """
+        if self.has_noise:
+            return self.noise
+        return np.broadcast_to(np.zeros((), dtype=self.signal.dtype), self.signal.shape)
+
+    def contiguous(self) -> SignalData:
+        """Return this signal backed by a single ``samples`` buffer.
+
+        Returns ``self`` when it already is; otherwise the three sample rows
+        are copied into a new ``(3, N)`` buffer.
+        """
+        if self.samples is not None:
+            return self
+        samples = np.empty((len(SAMPLE_ROWS), *self.signal.shape), dtype=self.signal.dtype)
+        samples[0] = self.signal
+        samples[1] = self.noise_samples()
+        samples[2] = self.composite
+        return _from_samples(self.time, samples, self.has_noise, self.sample_rate)
 
 
 @dataclass
 class FFTResult:
-    """Frequency-domain arrays produced by ``compute_fft``."""
+    """Frequency-domain arrays produced by ``compute_fft``.
+
+    ``magnitude`` is the linear spectrum ``magnitude_db`` was derived from;
+    metrics read it directly instead of converting dB back to linear.  It
+    may be ``None`` for results built elsewhere, in which case it is
+    recovered from ``magnitude_db``.  The spectra of a multi-channel signal
+    have one row per channel over the shared ``frequencies``.
+    """
 
     frequencies: np.ndarray  # shape (M,)  — positive frequency bins in Hz
-    magnitude_db: np.ndarray  # shape (M,)  — magnitude spectrum in dB
-    phase_deg: np.ndarray  # shape (M,)  — phase spectrum in degrees
+    magnitude_db: np.ndarray  # shape (M,) or (C, M) — magnitude spectrum in dB
+    phase_deg: np.ndarray  # shape (M,) or (C, M) — phase spectrum in degrees
+    magnitude: np.ndarray | None = None  # shape (M,) or (C, M) — linear, 1.0 ≙ 0 dB
 
 
 @dataclass
@@ -80,13 +348,423 @@ class SignalMetrics:
     peak_freq: float  # Hz — dominant frequency bin
 
 
+@dataclass
+class ChannelMetrics:
+    """Per-channel quality metrics produced by ``compute_channel_metrics``.
+
+    Every field is a float64 array of shape ``(C,)``; ``snr_db`` is NaN for
+    channels whose noise is silent.
+    """
+
+    rms: np.ndarray
+    peak: np.ndarray
+    crest_factor: np.ndarray  # peak / RMS
+    snr_db: np.ndarray | None  # None when no noise was stored for any channel
+    thd_db: np.ndarray
+    peak_freq: np.ndarray  # Hz
+
+    @property
+    def n_channels(self) -> int:
+        """Number of channels."""
+        return len(self.rms)
+
+    def channel(self, index: int) -> SignalMetrics:
+        """Return the metrics of channel *index* as a scalar ``SignalMetrics``."""
+        snr_db = self.snr_db
+        return SignalMetrics(
+            rms=float(self.rms[index]),
+            peak=float(self.peak[index]),
+            crest_factor=float(self.crest_factor[index]),
+            snr_db=None if snr_db is None or np.isnan(snr_db[index]) else float(snr_db[index]),
+            thd_db=float(self.thd_db[index]),
+            peak_freq=float(self.peak_freq[index]),
+        )
+
+
+@dataclass
+class Spectrogram:
+    """Time-frequency magnitude produced by ``compute_stft``."""
+
+    times: np.ndarray  # shape (F,)  — centre time of each frame in seconds
+    frequencies: np.ndarray  # shape (M,)  — positive frequency bins in Hz
+    magnitude_db: np.ndarray  # shape (F, M) float32 — magnitude in dB per frame
+
+
+@dataclass
+class AnalysisResult:
+    """Outputs of one complete generate → FFT → metrics run."""
+
+    signal_data: SignalData
+    fft_result: FFTResult
+    metrics: SignalMetrics
+
+
+class MetricsAccumulator:
+    """Constant-memory ``SignalMetrics`` over a stream of ``SignalData`` chunks.
+
+    RMS, peak, and SNR are running sums over every chunk.  THD and the
+    dominant frequency come from the spectrum ``compute_fft`` would return
+    for the whole signal.  In ``FFTMode.SINGLE`` that is the FFT of the first
+    ``params.segment_size`` samples, the only data the accumulator retains.
+    In ``FFTMode.WELCH`` the power spectra of the segments are summed as the
+    segments complete, and fewer than ``segment_size`` samples are carried
+    over from one chunk to the next.
+
+    Parameters
+    ----------
+    params:
+        The parameter set the chunks were generated from.
+
+    Raises
+    ------
+    ValueError
+        If *params* asks for median Welch averaging, which needs every
+        segment spectrum at once.
+    """
+
+    def __init__(self, params: SignalParameters) -> None:
+        self._params = params
+        self._n_samples = 0
+        self._sum_sq = 0.0
+        self._peak = 0.0
+        self._signal_sum_sq = 0.0
+        self._noise_sum_sq = 0.0
+        self._has_noise = False
+        self._head: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._head_len = 0
+        self._head_time: TimeAxis | None = None
+        if params.fft_mode == FFTMode.WELCH and params.welch_average == SpectrumAverage.MEDIAN:
+            raise ValueError("Median Welch averaging is not available for streamed signals.")
+        # Welch running state: samples of the next, incomplete segment, the
+        # summed |X|² of the finished segments, and the phase of the first.
+        self._carry = np.empty(0, dtype=params.dtype)
+        self._power: np.ndarray | None = None
+        self._first_phase_deg: np.ndarray | None = None
+        self._n_segments = 0
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples seen so far."""
+        return self._n_samples
+
+    def update(self, chunk: SignalData) -> None:
+        """Fold one chunk into the running statistics."""
+        composite = chunk.composite
+        if len(composite) == 0:
+            return
+
+        self._n_samples += len(composite)
+        self._sum_sq += float(sum_squares(composite))
+        self._peak = max(self._peak, float(peak_abs(composite)))
+        self._signal_sum_sq += float(sum_squares(chunk.signal))
+        noise_sum_sq = float(sum_squares(chunk.noise))
+        self._noise_sum_sq += noise_sum_sq
+        self._has_noise = self._has_noise or noise_sum_sq > 0.0
+
+        # Keep (copies of) the leading samples needed for the spectrum so the
+        # producer is free to reuse its chunk buffers.
+        need = self._params.segment_size - self._head_len
+        if need > 0:
+            if self._head_time is None:
+                self._head_time = chunk.time
+            self._head.append(
+                (
+                    chunk.signal[:need].copy(),
+                    chunk.noise[:need].copy(),
+                    composite[:need].copy(),
+                )
+            )
+            self._head_len += min(need, len(composite))
+
+        if self._params.fft_mode == FFTMode.WELCH:
+            self._update_welch(composite)
+
+    def _update_welch(self, composite: np.ndarray) -> None:
+        """Add the Welch segments that *composite* completes to the power sum."""
+        params = self._params
+        samples = np.concatenate((self._carry, composite)) if self._carry.size else composite
+        if len(samples) < params.segment_size:
+            self._carry = samples.copy()
+            return
+        hop = params.welch_hop
+        segments = _frames(samples, params.segment_size, hop)
+        spectra = _rfft(_apply_window(segments, params.fft_window), params.transform_size)
+        power = np.sum(np.real(spectra) ** 2 + np.imag(spectra) ** 2, axis=0, dtype=np.float64)
+        if self._power is None:
+            self._power = power
+            self._first_phase_deg = np.rad2deg(np.angle(spectra[0]))
+        else:
+            self._power += power
+        self._n_segments += len(segments)
+        # Fewer than segment_size samples remain; the next segment starts there.
+        self._carry = samples[len(segments) * hop :].copy()
+
+    def consume(self, chunks: Iterable[SignalData]) -> Iterator[SignalData]:
+        """Update from each chunk of *chunks* and pass it through unchanged.
+
+        Lets a single pass over a stream feed both the accumulator and a
+        writer::
+
+            acc = MetricsAccumulator(params)
+            write_time_domain_csv(acc.consume(iter_signal_chunks(params)), path)
+            metrics = acc.result()
+        """
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+
+    def head(self) -> SignalData:
+        """Return the leading ``segment_size`` samples seen so far.
+
+        Raises
+        ------
+        ValueError
+            If no samples have been accumulated.
+        """
+        first = self._head_time
+        if first is None:
+            raise ValueError("No samples have been accumulated.")
+        signal, noise, composite = (np.concatenate(parts) for parts in zip(*self._head))
+        return SignalData(
+            time=TimeAxis(dt=first.dt, n=self._head_len, start=first.start),
+            signal=signal,
+            noise=noise,
+            composite=composite,
+            sample_rate=self._params.sampling_rate,
+        )
+
+    def fft_result(self) -> FFTResult:
+        """Compute the spectrum of the samples accumulated so far.
+
+        The FFT of the leading ``segment_size`` samples, or in
+        ``FFTMode.WELCH`` the mean of the segment spectra, as by
+        ``compute_fft``.
+
+        Raises
+        ------
+        ValueError
+            If fewer than ``segment_size`` samples have been accumulated.
+        """
+        if self._head_len < self._params.segment_size:
+            raise ValueError(
+                f"At least {self._params.segment_size} samples are required for the FFT; "
+                f"only {self._head_len} were accumulated."
+            )
+        if self._power is None or self._first_phase_deg is None:
+            return compute_fft(self.head(), self._params)
+        params = self._params
+        power = self._power / self._n_segments
+        raw = np.sqrt(power).astype(self._first_phase_deg.dtype, copy=False)
+        magnitude = _normalise_magnitude(raw, params.segment_size)
+        return FFTResult(
+            frequencies=np.fft.rfftfreq(params.transform_size, d=1.0 / params.sampling_rate),
+            magnitude_db=_to_db(magnitude),
+            phase_deg=self._first_phase_deg,
+            magnitude=magnitude,
+        )
+
+    def result(
+        self, fft_result: FFTResult | None = None, *, max_harmonic: int = DEFAULT_MAX_HARMONIC
+    ) -> SignalMetrics:
+        """Return the metrics of everything accumulated so far.
+
+        Parameters
+        ----------
+        fft_result:
+            Spectrum to derive THD and peak frequency from.  Without one they
+            are measured from the leading samples as by ``measure_metrics``,
+            which skips the full spectrum (in ``FFTMode.WELCH`` the
+            accumulated spectrum is used); pass :meth:`fft_result` when the
+            spectrum is needed anyway (for plots).
+        max_harmonic:
+            Highest harmonic included in the THD, as for ``compute_metrics``.
+
+        Raises
+        ------
+        ValueError
+            If fewer than ``segment_size`` samples have been accumulated.
+        """
+        if max_harmonic < 2:
+            raise ValueError("max_harmonic must be ≥ 2.")
+        if fft_result is None and self._power is not None:
+            fft_result = self.fft_result()
+        if fft_result is None:
+            if self._head_len < self._params.segment_size:
+                self.fft_result()  # raises the "too few samples" error
+            thd_db, peak_freq = _measured_spectral_metrics(
+                self.head().composite[np.newaxis], [self._params], max_harmonic
+            )
+        else:
+            thd_db, peak_freq = spectral_metrics(
+                _linear_magnitude(fft_result)[np.newaxis],
+                fft_result.frequencies[np.newaxis],
+                max_harmonic,
+            )
+
+        n = max(self._n_samples, 1)
+        rms = float(np.sqrt(self._sum_sq / n))
+        crest_factor = self._peak / rms if rms > 0.0 else 0.0
+        (snr_db,) = _snr_db(
+            np.array([self._signal_sum_sq / n]),
+            np.array([self._noise_sum_sq / n]),
+            np.array([self._has_noise]),
+        )
+        return SignalMetrics(
+            rms=rms,
+            peak=self._peak,
+            crest_factor=crest_factor,
+            snr_db=snr_db,
+            thd_db=float(thd_db[0]),
+            peak_freq=float(peak_freq[0]),
+        )
+
+
+class SignalWorkspace:
+    """Reusable sample buffers for ``generate_signal`` and ``iter_signal_chunks``.
+
+    Passing the same workspace to successive calls recycles its memory, so
+    repeated runs of the same length allocate nothing::
+
+        workspace = SignalWorkspace()
+        for params in runs:
+            signal_data = generate_signal(params, workspace=workspace)
+
+    The ``SignalData`` arrays returned are views into the workspace and are
+    overwritten by the next call that uses it — copy them to keep them.
+    Buffers grow to the longest run seen and are replaced when the sample
+    dtype changes.  A workspace must not be shared between threads.
+
+    Parameters
+    ----------
+    n_samples:
+        Number of samples to preallocate.
+    dtype:
+        Sample dtype to preallocate for.
+    """
+
+    def __init__(self, n_samples: int = 0, dtype: npt.DTypeLike = np.float64) -> None:
+        self._capacity = 0
+        self._dtype = np.dtype(dtype)
+        self._index = np.empty(0)  # 0, 1, 2, … — source of the time values
+        self._scratch = np.empty(0)  # float64 time / phase argument
+        # signal, noise, composite — stored flat so that the (3, n) block of
+        # any run shorter than the capacity is C-contiguous.
+        self._samples = np.empty(0, dtype=self._dtype)
+        self.reserve(n_samples, dtype)
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the buffers currently hold."""
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the buffers in bytes."""
+        return self._index.nbytes + self._scratch.nbytes + self._samples.nbytes
+
+    def reserve(self, n_samples: int, dtype: npt.DTypeLike | None = None) -> None:
+        """Make sure the buffers hold at least *n_samples* samples of *dtype*."""
+        dtype = self._dtype if dtype is None else np.dtype(dtype)
+        if n_samples > self._capacity:
+            self._capacity = n_samples
+            self._index = np.arange(n_samples, dtype=np.float64)
+            self._scratch = np.empty(n_samples)
+        if dtype != self._dtype or self._samples.size < len(SAMPLE_ROWS) * self._capacity:
+            self._dtype = dtype
+            self._samples = np.empty(len(SAMPLE_ROWS) * self._capacity, dtype=dtype)
+
+    def _buffers(self, time: TimeAxis, dtype: np.dtype) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(t, samples)`` views for *time*.
+
+        ``t`` is filled with the time values, identical to
+        ``time.to_array()``; ``samples`` is an uninitialised, C-contiguous
+        ``(3, n)`` block laid out as ``SAMPLE_ROWS``.
+        """
+        n = time.n
+        self.reserve(n, dtype)
+        t = self._scratch[:n]
+        # Integer-valued floats add exactly, so this matches np.arange(start, stop).
+        np.add(self._index[:n], time.start, out=t)
+        t *= time.dt
+        samples = self._samples[: len(SAMPLE_ROWS) * n].reshape(len(SAMPLE_ROWS), n)
+        return t, samples
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _apply_window(arr: np.ndarray, window_type: WindowType) -> np.ndarray:
-    n = len(arr)
+@dataclass(frozen=True)
+class WindowCoefficients:
+    """Read-only window array plus its normalisation constants.
+
+    Instances are shared between callers through the window cache, so
+    ``values`` is flagged non-writeable.
+    """
+
+    values: np.ndarray  # shape (N,)  — window coefficients (read-only)
+    coherent_gain: float  # mean(w) — amplitude scaling of a windowed sine
+    enbw: float  # equivalent noise bandwidth in bins: N·Σw² / (Σw)²
+
+
+class WindowCacheInfo(NamedTuple):
+    """Snapshot of the window cache counters (mirrors ``functools`` cache info)."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _WindowCache:
+    """Bounded, thread-safe LRU cache of ``WindowCoefficients``.
+
+    Keys are ``(window_type, n, dtype)``.  Coefficients are computed outside
+    the lock; if two threads miss on the same key concurrently, both compute
+    and the last insert wins, which is harmless because the values are equal.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[WindowType, int, np.dtype], WindowCoefficients] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, window_type: WindowType, n: int, dtype: np.dtype) -> WindowCoefficients:
+        key = (window_type, n, dtype)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+
+        entry = _build_window(window_type, n, dtype)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def info(self) -> WindowCacheInfo:
+        with self._lock:
+            return WindowCacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _build_window(window_type: WindowType, n: int, dtype: np.dtype) -> WindowCoefficients:
     match window_type:
         case WindowType.HANNING:
             w = np.hanning(n)
@@ -94,188 +772,1559 @@ def _apply_window(arr: np.ndarray, window_type: WindowType) -> np.ndarray:
             w = np.hamming(n)
         case WindowType.BLACKMAN:
             w = np.blackman(n)
-        case _:  # RECTANGULAR — no windowing
+        case _:  # RECTANGULAR
             w = np.ones(n)
-    return arr * w
 
+    # Constants are derived from the float64 coefficients before any cast.
+    w_sum = float(np.sum(w))
+    coherent_gain = w_sum / n if n > 0 else 0.0
+    enbw = n * float(np.dot(w, w)) / (w_sum * w_sum) if w_sum != 0.0 else 0.0
 
-# ---------------------------------------------------------------------------
-# Public API
-# ---------------------------------------------------------------------------
+    values = w.astype(dtype, copy=False)
+    values.flags.writeable = False
+    return WindowCoefficients(values=values, coherent_gain=coherent_gain, enbw=enbw)
 
 
-def generate_signal(params: SignalParameters) -> SignalData:
-    """Generate a synthetic time-domain signal from *params*.
+_window_cache = _WindowCache(_WINDOW_CACHE_MAXSIZE)
 
-    Parameters
-    ----------
-    params:
-        Validated ``SignalParameters`` instance.
 
-    Returns
-    -------
-    SignalData
-        Arrays for time, clean signal, noise, and composite waveform.
+@dataclass(frozen=True)
+class FFTBackend:
+    """A named real-input FFT implementation.
+
+    ``rfft(x, n, axis)`` must behave like ``np.fft.rfft``: transform *x*
+    along *axis*, zero-padded or truncated to *n* points, and return the
+    ``n // 2 + 1`` non-negative frequency bins in the complex dtype that
+    matches *x* (complex64 for float32 input).
+    """
+
+    name: str
+    rfft: Callable[[np.ndarray, int, int], np.ndarray]
+
+
+def _numpy_rfft() -> Callable[[np.ndarray, int, int], np.ndarray]:
+    return lambda x, n, axis: np.fft.rfft(x, n=n, axis=axis)
+
+
+def _fft_workers() -> int:
+    """Threads per scipy transform: ``FFT_WORKERS_ENV``, else every core."""
+    value = os.environ.get(FFT_WORKERS_ENV)
+    if value:
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers >= 1:
+            return workers
+        logger.warning("Ignoring %s=%r: expected an integer ≥ 1.", FFT_WORKERS_ENV, value)
+    return os.cpu_count() or 1
+
+
+def _scipy_rfft() -> Callable[[np.ndarray, int, int], np.ndarray]:
+    # scipy is an optional extra, hence imported by name.
+    scipy_fft = importlib.import_module("scipy.fft")
+
+    # scipy parallelises the independent transforms of a batch (segments,
+    # channels, sweep points) over the workers and keeps a cache of plans.
+    workers = _fft_workers()
+    return lambda x, n, axis: scipy_fft.rfft(x, n=n, axis=axis, workers=workers)
+
+
+def init_pool_worker() -> None:
+    """Process-pool initializer: one FFT thread per worker unless configured.
+
+    The pool already runs one process per core; letting each of them thread
+    its transforms over every core as well would oversubscribe the machine.
+    """
+    os.environ.setdefault(FFT_WORKERS_ENV, "1")
+
+
+class _FFTBackendRegistry:
+    """Thread-safe registry of FFT backend loaders plus the active backend.
+
+    A loader imports whatever its backend needs and returns the ``rfft``
+    callable, raising ``ImportError`` when the backend is not installed.
+    Loaders run at most once per selection; the resolved backend is cached
+    until the selection changes.
+    """
+
+    def __init__(self) -> None:
+        self._loaders: dict[str, Callable[[], Callable[[np.ndarray, int, int], np.ndarray]]] = {
+            "numpy": _numpy_rfft,
+            "scipy": _scipy_rfft,
+        }
+        self._selected: str | None = None
+        self._active: FFTBackend | None = None
+        self._lock = threading.Lock()
+
+    def register(
+        self, name: str, loader: Callable[[], Callable[[np.ndarray, int, int], np.ndarray]]
+    ) -> None:
+        if name == "auto":
+            raise ValueError("'auto' is reserved and cannot be registered as an FFT backend.")
+        with self._lock:
+            self._loaders[name] = loader
+            if self._active is not None and self._active.name == name:
+                self._active = None
+
+    def available(self) -> list[str]:
+        names = []
+        for name, loader in list(self._loaders.items()):
+            try:
+                loader()
+            except ImportError:
+                continue
+            names.append(name)
+        return names
+
+    def select(self, name: str | None) -> FFTBackend | None:
+        backend = None if name is None else self._load(name)
+        with self._lock:
+            self._selected = name
+            self._active = backend
+        return backend
+
+    def active(self) -> FFTBackend:
+        with self._lock:
+            if self._active is not None:
+                return self._active
+            name = self._selected
+        if name is None:
+            name = os.environ.get(FFT_BACKEND_ENV) or "auto"
+        try:
+            backend = self._load(name)
+        except ValueError as exc:
+            logger.warning("Ignoring %s: %s", FFT_BACKEND_ENV, exc)
+            backend = self._load("auto")
+        with self._lock:
+            self._active = backend
+        logger.debug("FFT backend selected", extra={"fft_backend": backend.name})
+        return backend
+
+    def _load(self, name: str) -> FFTBackend:
+        """Load backend *name*; ``"auto"`` prefers scipy and falls back to NumPy."""
+        if name == "auto":
+            try:
+                return FFTBackend("scipy", self._loaders["scipy"]())
+            except ImportError:
+                return FFTBackend("numpy", self._loaders["numpy"]())
+        loader = self._loaders.get(name)
+        if loader is None:
+            known = ", ".join(["auto", *self._loaders])
+            raise ValueError(f"Unknown FFT backend '{name}' (expected one of: {known}).")
+        try:
+            return FFTBackend(name, loader())
+        except ImportError as exc:
+            raise ValueError(f"FFT backend '{name}' is not available: {exc}") from exc
+
+
+_fft_registry = _FFTBackendRegistry()
+
+
+def _rfft(x: np.ndarray, n: int) -> np.ndarray:
+    """rFFT of *x* along its last axis at *n* points, on the active backend."""
+    return _fft_registry.active().rfft(x, n, -1)
+
+
+def _apply_window(arr: np.ndarray, window_type: WindowType) -> np.ndarray:
+    """Return *arr* multiplied by the cached window along its last axis.
+
+    The window broadcasts over any leading (segment, channel) axes.
+
+    The rectangular window is the identity, so *arr* itself is returned
+    without a multiply or copy; callers must not modify the result in place.
+    """
+    if window_type == WindowType.RECTANGULAR:
+        return arr
+    return arr * get_window(window_type, arr.shape[-1], arr.dtype).values
+
+
+def _sample_count(params: SignalParameters) -> int:
+    return int(params.duration * params.sampling_rate)
+
+
+def _periodic_waveform(
+    signal_type: SignalType,
+    t: np.ndarray,
+    amplitude: float | np.ndarray,
+    frequency: float | np.ndarray,
+    phase_deg: float | np.ndarray,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Evaluate a deterministic waveform at the times *t*, in place.
+
+    *t* must be a float64 scratch array: it is overwritten by the
+    intermediate results, and the waveform is written to *out* (default:
+    *t* itself), which may have a narrower float dtype.  No other array is
+    allocated.
+
+    The scalar arguments may also be ``(B, 1)`` column vectors, in which case
+    they broadcast against a ``(B, N)`` time array (batch path).  Both paths
+    perform exactly the same element-wise operations.
     """
-    n_samples = int(params.duration * params.sampling_rate)
-    t = np.linspace(0.0, params.duration, n_samples, endpoint=False)
-    omega = 2.0 * np.pi * params.frequency
-    phase_rad = np.deg2rad(params.phase_deg)
+    if out is None:
+        out = t
+    omega = 2.0 * np.pi * frequency
+    phase_rad = np.deg2rad(phase_deg)
+
+    match signal_type:
+        case SignalType.SINE | SignalType.SQUARE:
+            t *= omega
+            t += phase_rad
+            np.sin(t, out=t)
+            if signal_type == SignalType.SQUARE:
+                np.sign(t, out=t)
+
+        case SignalType.SAWTOOTH | SignalType.TRIANGLE:
+            # The sawtooth ramps linearly from -A to +A within each period;
+            # the triangle folds that ramp about zero.
+            period = 1.0 / frequency
+            t += phase_rad / omega
+            np.remainder(t, period, out=t)
+            t *= 2.0
+            t /= period
+            t -= 1.0
+            if signal_type == SignalType.TRIANGLE:
+                np.abs(t, out=t)
+                t *= 2.0
+                t -= 1.0
+
+        case _:
+            out[...] = 0.0
+            return out
+
+    return np.multiply(t, amplitude, out=out)
 
+
+def _nominal_power(params: SignalParameters) -> float:
+    """Expected mean power of the clean waveform, known before generation."""
+    a2 = params.amplitude**2
     match params.signal_type:
         case SignalType.SINE:
-            raw = params.amplitude * np.sin(omega * t + phase_rad)
-
-        case SignalType.SQUARE:
-            raw = params.amplitude * np.sign(np.sin(omega * t + phase_rad))
-
-        case SignalType.SAWTOOTH:
-            # Linearly ramps from -A to +A within each period.
-            period = 1.0 / params.frequency
-            phase_shift = phase_rad / omega
-            raw = params.amplitude * (2.0 * ((t + phase_shift) % period) / period - 1.0)
-
-        case SignalType.TRIANGLE:
-            period = 1.0 / params.frequency
-            phase_shift = phase_rad / omega
-            raw = params.amplitude * (
-                2.0 * np.abs(2.0 * ((t + phase_shift) % period) / period - 1.0) - 1.0
-            )
+            return a2 / 2.0
+        case SignalType.SAWTOOTH | SignalType.TRIANGLE:
+            return a2 / 3.0
+        case _:  # SQUARE, WHITE_NOISE
+            return a2
 
-        case SignalType.WHITE_NOISE:
-            rng = np.random.default_rng()
-            raw = params.amplitude * rng.standard_normal(n_samples)
 
-        case _:
-            raw = np.zeros(n_samples)
+class _RandomStreams(NamedTuple):
+    """Independent generators for the two random draws of one run."""
+
+    waveform: np.random.Generator  # WHITE_NOISE samples
+    noise: np.random.Generator  # additive noise
+
+
+def _random_streams(
+    params: SignalParameters, rng: np.random.Generator | None = None
+) -> _RandomStreams:
+    """Return the random streams of one run.
+
+    The waveform and the additive noise draw from separate child streams, so
+    a seeded run produces the same samples whether it is generated in one
+    block or in chunks.  The children are spawned from *rng* when given —
+    successive runs sharing one generator get distinct but reproducible
+    streams without touching OS entropy — and from ``params.seed`` otherwise.
+    """
+    if rng is not None:
+        return _RandomStreams(*rng.spawn(2))
+    seed_seq = np.random.SeedSequence(params.seed)
+    return _RandomStreams(*(np.random.default_rng(child) for child in seed_seq.spawn(2)))
 
-    # ------------------------------------------------------------------
-    # Additive noise
-    # ------------------------------------------------------------------
-    noise = np.zeros(n_samples)
+
+def _additive_noise(
+    params: SignalParameters,
+    signal_power: float,
+    n_samples: int,
+    rng: np.random.Generator,
+    out: np.ndarray | None = None,
+) -> np.ndarray | None:
+    """Draw the additive noise for *params* given the clean signal power.
+
+    The noise is drawn into *out* when given.  Returns ``None`` when no noise
+    is to be added.
+    """
+    dtype = np.dtype(params.dtype)
+    if params.noise_type == NoiseType.NONE or signal_power <= 0.0:
+        return None
+
+    noise_power = signal_power / (10.0 ** (params.snr_db / 10.0))
+    noise_std = float(np.sqrt(noise_power))
+
+    # Drawn directly in the target dtype and scaled in place.  For float64
+    # this is bit-identical to rng.normal(0, std) / rng.uniform(-b, b).
+    if params.noise_type == NoiseType.GAUSSIAN:
+        noise = rng.standard_normal(n_samples, dtype=dtype, out=out)
+        noise *= noise_std
+        return noise
+    # UNIFORM — same variance as Gaussian for given SNR
+    bound = noise_std * float(np.sqrt(3.0))
+    noise = rng.random(n_samples, dtype=dtype, out=out)
+    noise *= 2.0 * bound
+    noise -= bound
+    return noise
+
+
+def _no_noise(dtype: npt.DTypeLike, channels: tuple[int, ...] = ()) -> np.ndarray:
+    """Zero-size, read-only ``SignalData.noise`` sentinel for noiseless runs.
+
+    *channels* is ``(C,)`` for a multi-channel signal, giving shape ``(C, 0)``.
+    """
+    noise = np.empty((*channels, 0), dtype=dtype)
+    noise.flags.writeable = False
+    return noise
+
+
+def _composite(
+    raw: np.ndarray, noise: np.ndarray, dc_offset: float, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Return ``raw + noise + dc_offset``, written to *out* when given.
+
+    At most one array is allocated (none with *out*), and *raw* itself is
+    returned when there is neither noise nor DC offset.
+    """
+    if noise.size:
+        composite = np.add(raw, noise, out=out)
+        if dc_offset != 0.0:
+            composite += dc_offset
+        return composite
+    if dc_offset != 0.0:
+        return np.add(raw, dc_offset, out=out)
+    return raw
+
+
+def _synthesize(
+    params: SignalParameters,
+    time: TimeAxis,
+    streams: _RandomStreams,
+    signal_power: float | None = None,
+    workspace: SignalWorkspace | None = None,
+    contiguous: bool = False,
+) -> SignalData:
+    """Generate the samples of *params* at the instants of *time*.
+
+    Shared by ``generate_signal`` and ``iter_signal_chunks``.  The noise is
+    scaled to *signal_power*, or to the measured power of the waveform when
+    ``None``.  With a *workspace*, every array is written into its buffers
+    and nothing is allocated; without one, a clean float64 run allocates a
+    single array, which serves as both scratch and result.  With
+    *contiguous*, the arrays are rows of one ``samples`` block (the
+    workspace's, or a new one).
+    """
+    n_samples = time.n
+    dtype = np.dtype(params.dtype)
+    t = samples = None
+    if workspace is not None:
+        t, samples = workspace._buffers(time, dtype)
+        raw_out, noise_out, composite_out = samples
+    elif contiguous:
+        samples = np.empty((len(SAMPLE_ROWS), n_samples), dtype=dtype)
+        raw_out, noise_out, composite_out = samples
+    else:
+        raw_out = None if dtype == np.float64 else np.empty(n_samples, dtype=dtype)
+        noise_out = composite_out = None
+
+    if params.signal_type == SignalType.WHITE_NOISE:
+        raw = streams.waveform.standard_normal(n_samples, dtype=dtype, out=raw_out)
+        raw *= params.amplitude
+    else:
+        # The phase argument is always evaluated in float64: float32 cannot
+        # resolve sample instants of signals longer than a few seconds.
+        if t is None:
+            t = time.to_array()
+        raw = _periodic_waveform(
+            params.signal_type,
+            t,
+            params.amplitude,
+            params.frequency,
+            params.phase_deg,
+            out=raw_out,
+        )
+
+    noise = None
     if params.noise_type != NoiseType.NONE:
-        signal_power = float(np.mean(raw**2))
-        if signal_power > 0.0:
-            noise_power = signal_power / (10.0 ** (params.snr_db / 10.0))
-            noise_std = float(np.sqrt(noise_power))
-            rng = np.random.default_rng()
-            if params.noise_type == NoiseType.GAUSSIAN:
-                noise = rng.normal(0.0, noise_std, n_samples)
-            else:  # UNIFORM — same variance as Gaussian for given SNR
-                bound = noise_std * float(np.sqrt(3.0))
-                noise = rng.uniform(-bound, bound, n_samples)
-
-    composite = raw + noise + params.dc_offset
+        if signal_power is None:
+            # The composite buffer is free until the very end, so it doubles
+            # as scratch for the squared samples.
+            squared_mean = np.mean(np.square(raw, out=composite_out), dtype=np.float64)
+            signal_power = float(squared_mean)
+        noise = _additive_noise(params, signal_power, n_samples, streams.noise, out=noise_out)
+    if noise is None:
+        noise = _no_noise(dtype)
+    composite = _composite(raw, noise, params.dc_offset, out=composite_out)
 
-    logger.debug(
-        "Signal generated",
-        extra={"n_samples": n_samples, "signal_type": params.signal_type},
-    )
+    if not contiguous:
+        return SignalData(
+            time=time,
+            signal=raw,
+            noise=noise,
+            composite=composite,
+            sample_rate=params.sampling_rate,
+        )
+    # Complete the rows the noiseless / offset-free shortcuts left unwritten.
+    assert samples is not None  # set by both the workspace and the contiguous branch
+    _, noise_row, composite_row = samples
+    if not noise.size:
+        noise_row.fill(0)
+    if composite is not composite_row:
+        np.copyto(composite_row, composite)
+    return _from_samples(time, samples, bool(noise.size), params.sampling_rate)
+
+
+def _from_samples(
+    time: TimeAxis, samples: np.ndarray, has_noise: bool, sample_rate: float
+) -> SignalData:
+    """Build a ``SignalData`` whose arrays are the rows of *samples*."""
+    signal, noise, composite = samples
     return SignalData(
-        time=t,
-        signal=raw,
-        noise=noise,
+        time=time,
+        signal=signal,
+        noise=noise if has_noise else _no_noise(samples.dtype, samples.shape[1:-1]),
         composite=composite,
-        sample_rate=params.sampling_rate,
+        sample_rate=sample_rate,
+        samples=samples,
     )
 
 
-def compute_fft(signal_data: SignalData, params: SignalParameters) -> FFTResult:
-    """Compute the FFT of the composite signal.
+def _normalise_magnitude(magnitude: np.ndarray, segment_size: int) -> np.ndarray:
+    """Scale a raw rFFT magnitude in place so a full-scale sine reads 1.0.
 
-    Only the first ``params.fft_size`` samples are used so the window length
-    is always a power of two (as validated by ``SignalParameters``).
+    *segment_size* is the number of signal samples transformed; zero padding
+    adds bins but no energy, so it does not enter the scale.
+    """
+    magnitude /= segment_size / 2.0
+    return magnitude
 
-    Parameters
-    ----------
-    signal_data:
-        Time-domain data returned by ``generate_signal``.
-    params:
-        The same parameter set used to generate the signal (provides
-        ``fft_size``, ``fft_window``, and ``sampling_rate``).
 
-    Returns
-    -------
-    FFTResult
-        Positive-frequency bins with magnitude (dB) and phase (degrees).
-    """
-    segment = signal_data.composite[: params.fft_size]
-    windowed = _apply_window(segment, params.fft_window)
+def _to_db(magnitude: np.ndarray) -> np.ndarray:
+    """Convert a normalised linear magnitude to dB (floored at ``_LOG_FLOOR``)."""
+    return 20.0 * np.log10(np.maximum(magnitude, _LOG_FLOOR))
 
-    spectrum = np.fft.rfft(windowed)
-    frequencies = np.fft.rfftfreq(params.fft_size, d=1.0 / signal_data.sample_rate)
 
-    # Normalise so that a full-scale sine reads 0 dB at its fundamental.
-    magnitude = np.abs(spectrum) / (params.fft_size / 2.0)
-    magnitude = np.where(magnitude < _LOG_FLOOR, _LOG_FLOOR, magnitude)
-    magnitude_db = 20.0 * np.log10(magnitude)
+def rfft_spectrum(
+    windowed: np.ndarray, transform_size: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(magnitude, magnitude_db, phase_deg)`` of *windowed* along its last axis.
 
+    Each row is zero-padded to *transform_size* points before the rFFT.
+    """
+    spectrum = _rfft(windowed, transform_size)
+    magnitude = _normalise_magnitude(np.abs(spectrum), windowed.shape[-1])
     phase_deg = np.rad2deg(np.angle(spectrum))
+    return magnitude, _to_db(magnitude), phase_deg
 
-    logger.debug(
-        "FFT computed",
-        extra={"fft_size": params.fft_size, "fft_window": params.fft_window},
-    )
-    return FFTResult(
-        frequencies=frequencies,
-        magnitude_db=magnitude_db,
-        phase_deg=phase_deg,
-    )
 
+def _frames(arr: np.ndarray, frame_size: int, hop: int) -> np.ndarray:
+    """Overlapping frames of *arr* as a read-only strided view.
 
-def compute_metrics(signal_data: SignalData, fft_result: FFTResult) -> SignalMetrics:
-    """Derive scalar quality metrics from the computed signal and FFT.
+    Returns shape ``(n_frames, frame_size)``; no sample data is copied.
+    """
+    return sliding_window_view(arr, frame_size, axis=-1)[..., ::hop, :]
 
-    Parameters
-    ----------
-    signal_data:
-        Time-domain data.
-    fft_result:
-        Frequency-domain data.
 
-    Returns
-    -------
-    SignalMetrics
-        RMS, peak, crest factor, SNR, THD, and dominant frequency.
+def _welch_spectrum(
+    composite: np.ndarray, params: SignalParameters
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Welch-averaged ``(magnitude, magnitude_db, phase_deg)`` over the whole signal.
+
+    All segments are windowed and transformed with one batched rFFT.  The
+    mean average is taken over power (|X|²) and reported as its square root;
+    the median is taken over magnitude.  Phase is not meaningful after
+    averaging, so the phase of the first segment is returned — the same value
+    single-segment mode reports.
     """
-    composite = signal_data.composite
-
-    rms = float(np.sqrt(np.mean(composite**2)))
-    peak = float(np.max(np.abs(composite)))
-    crest_factor = peak / rms if rms > 0.0 else 0.0
-
-    # SNR — only meaningful when noise was added.
-    snr_db: float | None = None
-    if np.any(signal_data.noise != 0.0):
-        signal_power = float(np.mean(signal_data.signal**2))
-        noise_power = float(np.mean(signal_data.noise**2))
-        if noise_power > 0.0:
-            snr_db = 10.0 * np.log10(signal_power / noise_power)
-
-    # THD — ratio of harmonic power (H2–H5) to fundamental power.
-    peak_idx = int(np.argmax(fft_result.magnitude_db))
-    fund_linear = 10.0 ** (fft_result.magnitude_db[peak_idx] / 20.0)
-    fund_power = fund_linear**2
-
-    harmonic_power = 0.0
-    for k in range(2, 6):
-        h_idx = peak_idx * k
-        if h_idx < len(fft_result.magnitude_db):
-            h_linear = 10.0 ** (fft_result.magnitude_db[h_idx] / 20.0)
-            harmonic_power += h_linear**2
-
-    if harmonic_power > 0.0 and fund_power > 0.0:
-        thd_db = 10.0 * np.log10(harmonic_power / fund_power)
-    else:
-        thd_db = -100.0
+    segment_size = params.segment_size
+    segments = _frames(composite, segment_size, params.welch_hop)
+    spectra = _rfft(_apply_window(segments, params.fft_window), params.transform_size)
+    magnitude = _normalise_magnitude(_average_segments(spectra, params), segment_size)
+    return magnitude, _to_db(magnitude), np.rad2deg(np.angle(spectra[..., 0, :]))
 
-    peak_freq = float(fft_result.frequencies[peak_idx]) if len(fft_result.frequencies) > 0 else 0.0
 
-    return SignalMetrics(
+def _average_segments(spectra: np.ndarray, params: SignalParameters) -> np.ndarray:
+    """Welch average of the per-segment *spectra* (axis -2) as a raw magnitude."""
+    if params.welch_average == SpectrumAverage.MEDIAN:
+        return np.median(np.abs(spectra), axis=-2)
+    real, imag = np.real(spectra), np.imag(spectra)
+    power = np.mean(real**2 + imag**2, axis=-2, dtype=np.float64)
+    return np.sqrt(power).astype(real.dtype, copy=False)
+
+
+def spectral_metrics(
+    magnitude: np.ndarray, frequencies: np.ndarray, max_harmonic: int = 5
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-row ``(thd_db, peak_freq)`` from 2-D linear spectra.
+
+    The fundamental and harmonics 2 … *max_harmonic* of every row are
+    fetched with a single fancy-index gather.  Bins are floored at
+    ``_LOG_FLOOR`` exactly like the dB spectrum.
+    """
+    rows = np.arange(magnitude.shape[0])
+    n_bins = magnitude.shape[-1]
+    peak_idx = np.argmax(magnitude, axis=-1)
+
+    h_idx = _harmonic_bins(peak_idx, max_harmonic)
+    h_valid = h_idx < n_bins
+    h_mag = magnitude[rows[:, np.newaxis], np.where(h_valid, h_idx, 0)]
+    thd_db = _thd_db(h_mag, h_valid)
+
+    peak_freq = frequencies[rows, peak_idx] if n_bins > 0 else np.zeros(len(rows))
+    return thd_db, peak_freq
+
+
+def _harmonic_bins(peak_idx: np.ndarray, max_harmonic: int) -> np.ndarray:
+    """Bins of the fundamental and harmonics 2 … *max_harmonic*, one row per peak."""
+    if max_harmonic < 2:
+        raise ValueError("max_harmonic must be ≥ 2.")
+    return peak_idx[:, np.newaxis] * np.arange(1, max_harmonic + 1)
+
+
+def _thd_db(h_mag: np.ndarray, h_valid: np.ndarray) -> np.ndarray:
+    """Per-row THD in dB — ratio of harmonic power (H2…Hn) to fundamental power.
+
+    *h_mag* holds the normalised magnitudes of the bins from
+    ``_harmonic_bins``; entries where *h_valid* is false lie above Nyquist
+    and are ignored.
+    """
+    h_power = np.where(h_valid, np.maximum(h_mag.astype(np.float64), _LOG_FLOOR) ** 2, 0.0)
+    fund_power = h_power[:, 0]
+    harmonic_power = np.sum(h_power[:, 1:], axis=-1)
+
+    thd_valid = (harmonic_power > 0.0) & (fund_power > 0.0)
+    thd_db = np.full(len(h_power), -100.0)
+    thd_db[thd_valid] = 10.0 * np.log10(harmonic_power[thd_valid] / fund_power[thd_valid])
+    return thd_db
+
+
+def _peak_search_bins(params: SignalParameters) -> np.ndarray | None:
+    """Candidate bins for the spectral peak of *params*, or ``None`` if unknown.
+
+    The peak of a deterministic waveform sits within the window's main lobe
+    around the nominal frequency, or at DC when the offset dominates, so
+    only those bins need evaluating.  ``None`` when that is not guaranteed
+    (white noise, or additive noise strong enough to rival the fundamental)
+    or when the transform is short enough that the full rFFT is cheaper.
+    """
+    if params.transform_size < _TARGETED_MIN_SIZE:
+        return None
+    if params.signal_type == SignalType.WHITE_NOISE:
+        return None
+    if params.noise_type != NoiseType.NONE:
+        gain_db = params.snr_db + 10.0 * np.log10(params.segment_size)
+        if gain_db < _TARGETED_MIN_GAIN_DB:
+            return None
+    n_bins = params.transform_size // 2 + 1
+    k0 = params.frequency * params.transform_size / params.sampling_rate
+    lo = max(int(np.floor(k0)) - _TARGETED_PEAK_SEARCH, 1)
+    hi = min(int(np.ceil(k0)) + _TARGETED_PEAK_SEARCH, n_bins - 1)
+    return np.concatenate(([0], np.arange(lo, hi + 1)))
+
+
+def _dft_bins(x: np.ndarray, bins: np.ndarray, transform_size: int) -> np.ndarray:
+    """DFT of *x* along its last axis at integer *bins* of a *transform_size*-point transform.
+
+    Equals ``np.fft.rfft(x, n=transform_size, axis=-1)[..., bins]`` (to
+    rounding) at a cost of one matrix product with ``len(bins)`` columns.
+    The samples are split as ``n = hi·B + lo`` with ``B ≈ √N``, so
+
+        X[k] = Σ_hi  e^(−2πi·k·hi·B/M) · Σ_lo x[hi·B + lo] · e^(−2πi·k·lo/M)
+
+    and only ``(N/B + B) · len(bins)`` twiddle factors are evaluated.  Phase
+    arguments are reduced modulo *transform_size* in integer arithmetic,
+    so they stay exact for any signal length.
+    """
+    n = x.shape[-1]
+    block = 1 << max(4, (n.bit_length() + 1) // 2)
+    n_blocks = -(-n // block)
+    if n_blocks * block != n:
+        padded = np.zeros(x.shape[:-1] + (n_blocks * block,))
+        padded[..., :n] = x
+        x = padded
+    x = x.reshape(x.shape[:-1] + (n_blocks, block))
+
+    bins = np.asarray(bins, dtype=np.int64)
+    scale = 2.0 * np.pi / transform_size
+    inner = ((np.arange(block, dtype=np.int64)[:, np.newaxis] * bins) % transform_size) * scale
+    outer = (
+        (np.arange(n_blocks, dtype=np.int64)[:, np.newaxis] * block * bins) % transform_size
+    ) * scale
+    # Σ_lo, as two real matrix products: (..., n_blocks, block) @ (block, K).
+    partial = (x @ np.cos(inner)) - 1j * (x @ np.sin(inner))
+    return np.einsum("...hk,hk->...k", partial, np.exp(-1j * outer))
+
+
+def _targeted_spectral_metrics(
+    composite: np.ndarray, params: SignalParameters, search: np.ndarray, max_harmonic: int
+) -> tuple[float, float]:
+    """``(thd_db, peak_freq)`` of one run from its peak-search and harmonic bins only."""
+    segment_size = params.segment_size
+    transform_size = params.transform_size
+    if params.fft_mode == FFTMode.WELCH:
+        segments = _frames(composite, segment_size, params.welch_hop)
+    else:
+        segments = composite[np.newaxis, :segment_size]
+    windowed = _apply_window(segments, params.fft_window)
+
+    def magnitude_at(bins: np.ndarray) -> np.ndarray:
+        spectra = _dft_bins(windowed, bins, transform_size)
+        return _normalise_magnitude(_average_segments(spectra, params), segment_size)
+
+    peak_idx = search[np.argmax(magnitude_at(search))]
+    h_idx = _harmonic_bins(np.array([peak_idx]), max_harmonic)
+    h_valid = h_idx < transform_size // 2 + 1
+    h_mag = np.zeros(h_idx.shape)
+    h_mag[h_valid] = magnitude_at(h_idx[h_valid])
+    (thd_db,) = _thd_db(h_mag, h_valid)
+
+    # Same arithmetic as np.fft.rfftfreq(transform_size, 1 / sampling_rate)[peak_idx].
+    peak_freq = peak_idx * (1.0 / (transform_size * (1.0 / params.sampling_rate)))
+    return float(thd_db), float(peak_freq)
+
+
+def _measured_spectral_metrics(
+    composite: np.ndarray, group: Sequence[SignalParameters], max_harmonic: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-row ``(thd_db, peak_freq)`` of 2-D *composite* without an ``FFTResult``.
+
+    Rows whose spectral peak location is known (see ``_peak_search_bins``)
+    evaluate only the bins the metrics read.  The others take the full
+    rFFT, but only its linear magnitude — no dB or phase spectrum — and
+    then match ``compute_metrics`` exactly.  All rows must share one
+    ``segment_size`` and ``transform_size``.
+    """
+    thd_db = np.empty(len(group))
+    peak_freq = np.empty(len(group))
+    single = []
+    for i, params in enumerate(group):
+        search = _peak_search_bins(params)
+        if search is not None:
+            thd_db[i], peak_freq[i] = _targeted_spectral_metrics(
+                composite[i], params, search, max_harmonic
+            )
+        elif params.fft_mode == FFTMode.WELCH:
+            segments = _frames(composite[i], params.segment_size, params.welch_hop)
+            spectra = _rfft(_apply_window(segments, params.fft_window), params.transform_size)
+            magnitude = _normalise_magnitude(
+                _average_segments(spectra, params), params.segment_size
+            )
+            frequencies = np.fft.rfftfreq(params.transform_size, d=1.0 / params.sampling_rate)
+            (thd_db[i],), (peak_freq[i],) = spectral_metrics(
+                magnitude[np.newaxis], frequencies[np.newaxis], max_harmonic
+            )
+        else:
+            single.append(i)
+
+    if single:
+        # Single-segment rows share one windowed block and one batched rFFT.
+        segment_size = group[single[0]].segment_size
+        transform_size = group[single[0]].transform_size
+        windowed = np.empty((len(single), segment_size), dtype=composite.dtype)
+        for j, i in enumerate(single):
+            windowed[j] = _apply_window(composite[i, :segment_size], group[i].fft_window)
+        spectra = _rfft(windowed, transform_size)
+        magnitude = _normalise_magnitude(np.abs(spectra), segment_size)
+        frequencies = np.stack(
+            [np.fft.rfftfreq(transform_size, d=1.0 / group[i].sampling_rate) for i in single]
+        )
+        thd_db[single], peak_freq[single] = spectral_metrics(magnitude, frequencies, max_harmonic)
+    return thd_db, peak_freq
+
+
+def sum_squares(x: np.ndarray) -> np.ndarray | np.floating:
+    """Sum of squares along the last axis, accumulated in float64.
+
+    ``einsum`` forms the products on the fly, so no squared temporary is
+    allocated; unlike ``np.dot`` it accumulates float32 input in float64.
+    """
+    return np.einsum("...i,...i->...", x, x, dtype=np.float64)
+
+
+def peak_abs(x: np.ndarray) -> np.ndarray | np.floating:
+    """Largest absolute value along the last axis, without an ``abs`` temporary."""
+    return np.maximum(np.max(x, axis=-1), -np.min(x, axis=-1)).astype(np.float64)
+
+
+def _power_and_peak(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-row mean square and absolute peak of 2-D *x* in one blocked pass.
+
+    Columns are processed ``_REDUCE_BLOCK`` at a time, so each block is
+    reduced for both statistics while it is still in cache.  The block width
+    does not depend on the number of rows, which keeps every row's result
+    identical whether it is reduced alone or as part of a batch.
+    """
+    n_rows, n = x.shape
+    sum_sq = np.zeros(n_rows)
+    peak = np.zeros(n_rows)
+    for start in range(0, n, _REDUCE_BLOCK):
+        block = x[:, start : start + _REDUCE_BLOCK]
+        sum_sq += sum_squares(block)
+        np.maximum(peak, peak_abs(block), out=peak)
+    return sum_sq / max(n, 1), peak
+
+
+def _snr_db(
+    signal_power: np.ndarray, noise_power: np.ndarray, has_noise: np.ndarray
+) -> list[float | None]:
+    """Per-row SNR in dB, or ``None`` where no noise was added."""
+    valid = has_noise & (noise_power > 0.0)
+    snr_db = np.zeros(len(valid))
+    snr_db[valid] = 10.0 * np.log10(signal_power[valid] / noise_power[valid])
+    return [float(v) if ok else None for v, ok in zip(snr_db, valid)]
+
+
+def _metrics_columns(
+    composite: np.ndarray,
+    signal: np.ndarray,
+    noise: np.ndarray,
+    spectral: tuple[np.ndarray, np.ndarray],
+) -> ChannelMetrics:
+    """Compute the metrics of every row of the 2-D input arrays as arrays.
+
+    All reductions run along the last axis, so ``B`` runs (or channels)
+    cost a handful of NumPy calls rather than ``B`` Python-level passes.
+    Sums are accumulated in float64 whatever the sample dtype.  *spectral*
+    holds the per-row ``(thd_db, peak_freq)`` from ``spectral_metrics`` or
+    ``_measured_spectral_metrics``.  ``snr_db`` is ``None`` when no noise
+    was stored and NaN in rows whose noise is silent.
+    """
+    mean_sq, peak = _power_and_peak(composite)
+    rms = np.sqrt(mean_sq)
+    crest_factor = np.divide(peak, rms, out=np.zeros_like(rms), where=rms > 0.0)
+
+    # SNR — only meaningful when noise was added.  A zero-length last axis
+    # is the no-noise sentinel.
+    snr_db = None
+    if noise.shape[-1]:
+        n = signal.shape[-1]
+        signal_power = sum_squares(signal) / n
+        noise_power = sum_squares(noise) / n
+        valid = noise_power > 0.0
+        snr_db = np.full(len(valid), np.nan)
+        snr_db[valid] = 10.0 * np.log10(signal_power[valid] / noise_power[valid])
+    thd_db, peak_freq = spectral
+
+    return ChannelMetrics(
         rms=rms,
         peak=peak,
         crest_factor=crest_factor,
         snr_db=snr_db,
-        thd_db=thd_db,
-        peak_freq=peak_freq,
+        thd_db=np.asarray(thd_db, dtype=np.float64),
+        peak_freq=np.asarray(peak_freq, dtype=np.float64),
+    )
+
+
+def _metrics_block(
+    composite: np.ndarray,
+    signal: np.ndarray,
+    noise: np.ndarray,
+    spectral: tuple[np.ndarray, np.ndarray],
+) -> list[SignalMetrics]:
+    """Split ``_metrics_columns`` into one scalar ``SignalMetrics`` per row."""
+    columns = _metrics_columns(composite, signal, noise, spectral)
+    return [columns.channel(i) for i in range(composite.shape[0])]
+
+
+def _signal_metrics(
+    signal_data: SignalData, spectral: tuple[np.ndarray, np.ndarray]
+) -> ChannelMetrics:
+    """``ChannelMetrics`` of *signal_data*, one row per channel."""
+    return _metrics_columns(
+        np.atleast_2d(signal_data.composite),
+        np.atleast_2d(signal_data.signal),
+        np.atleast_2d(signal_data.noise),
+        spectral,
+    )
+
+
+def _check_single_channel(signal_data: SignalData, alternative: str) -> None:
+    if signal_data.is_multichannel:
+        raise ValueError(f"Multi-channel signals need {alternative}.")
+
+
+def _fft_spectral(fft_result: FFTResult, max_harmonic: int) -> tuple[np.ndarray, np.ndarray]:
+    magnitude = np.atleast_2d(_linear_magnitude(fft_result))
+    return spectral_metrics(
+        magnitude, np.broadcast_to(fft_result.frequencies, magnitude.shape), max_harmonic
+    )
+
+
+def _measured_spectral(
+    signal_data: SignalData, params: SignalParameters, max_harmonic: int
+) -> tuple[np.ndarray, np.ndarray]:
+    composite = np.atleast_2d(signal_data.composite)
+    return _measured_spectral_metrics(composite, [params] * len(composite), max_harmonic)
+
+
+def _linear_magnitude(fft_result: FFTResult) -> np.ndarray:
+    if fft_result.magnitude is not None:
+        return fft_result.magnitude
+    return 10.0 ** (fft_result.magnitude_db / 20.0)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def spawn_rngs(seed: int | None, n: int) -> list[np.random.Generator]:
+    """Return *n* independent generators derived from *seed*.
+
+    Uses ``SeedSequence.spawn``, so the streams do not overlap and the same
+    *seed* always yields the same *n* generators — hand one to each parallel
+    worker (as the ``rng`` argument of ``generate_signal`` and friends) for
+    deterministic, uncorrelated runs.  ``None`` seeds from OS entropy.
+    """
+    return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(n)]
+
+
+def get_window(
+    window_type: WindowType, n: int, dtype: npt.DTypeLike = np.float64
+) -> WindowCoefficients:
+    """Return the cached coefficients for a window of length *n*.
+
+    Parameters
+    ----------
+    window_type:
+        Window function to evaluate.
+    n:
+        Window length in samples.
+    dtype:
+        Floating-point dtype of the returned coefficient array.
+
+    Returns
+    -------
+    WindowCoefficients
+        Shared, read-only coefficients plus coherent gain and ENBW.
+    """
+    return _window_cache.get(WindowType(window_type), int(n), np.dtype(dtype))
+
+
+def window_cache_info() -> WindowCacheInfo:
+    """Return hit / miss counters and the current size of the window cache."""
+    return _window_cache.info()
+
+
+def clear_window_cache() -> None:
+    """Drop all cached windows and reset the hit / miss counters."""
+    _window_cache.clear()
+
+
+def get_fft_backend() -> FFTBackend:
+    """Return the FFT backend every rFFT of the engine runs on.
+
+    Unless one was chosen with :func:`set_fft_backend`, it is named by the
+    ``FFT_BACKEND_ENV`` environment variable, read on first use, and
+    defaults to ``"auto"``: scipy when installed, otherwise NumPy.  An
+    unknown or unavailable name in the environment is logged and ignored.
+    """
+    return _fft_registry.active()
+
+
+def set_fft_backend(name: str | None) -> FFTBackend | None:
+    """Select the FFT backend by name for all subsequent transforms.
+
+    Parameters
+    ----------
+    name:
+        ``"numpy"``, ``"scipy"``, ``"auto"``, or a name added with
+        :func:`register_fft_backend`.  ``None`` drops the selection, so the
+        environment variable (or ``"auto"``) applies again.
+
+    Returns
+    -------
+    FFTBackend | None
+        The backend now in use, or ``None`` if the selection was dropped.
+
+    Raises
+    ------
+    ValueError
+        If *name* is unknown or its backend is not installed.
+    """
+    return _fft_registry.select(name)
+
+
+def register_fft_backend(
+    name: str, loader: Callable[[], Callable[[np.ndarray, int, int], np.ndarray]]
+) -> None:
+    """Add (or replace) an FFT backend.
+
+    Parameters
+    ----------
+    name:
+        Name to select the backend by; ``"auto"`` is reserved.
+    loader:
+        Called without arguments when the backend is selected; returns an
+        ``rfft(x, n, axis)`` callable with the semantics described on
+        :class:`FFTBackend`, or raises ``ImportError`` if its library is
+        missing.
+    """
+    _fft_registry.register(name, loader)
+
+
+def available_fft_backends() -> list[str]:
+    """Return the names of the registered backends whose libraries are installed."""
+    return _fft_registry.available()
+
+
+def generate_signal(
+    params: SignalParameters,
+    *,
+    rng: np.random.Generator | None = None,
+    workspace: SignalWorkspace | None = None,
+    contiguous: bool = False,
+) -> SignalData:
+    """Generate a synthetic time-domain signal from *params*.
+
+    Random draws are reproducible when ``params.seed`` is set or when a
+    seeded *rng* is passed.
+
+    Parameters
+    ----------
+    params:
+        Validated ``SignalParameters`` instance.
+    rng:
+        Optional generator to spawn the random streams from, overriding
+        ``params.seed``.  Reusing one generator across calls avoids seeding
+        from OS entropy on every run.
+    workspace:
+        Optional ``SignalWorkspace`` whose buffers receive the samples, so
+        repeated runs reuse memory instead of allocating.  The returned
+        arrays are then views into the workspace, valid until its next use.
+    contiguous:
+        Back the result with a single ``(3, N)`` ``samples`` buffer (see
+        ``SignalData``), at the cost of writing the noise and composite rows
+        even when they are implied.
+
+    Returns
+    -------
+    SignalData
+        Implicit time axis plus the clean signal, noise, and composite
+        waveform.  Without noise and DC offset the composite is the clean
+        signal array itself; without noise, ``noise`` is zero-size.
+
+    Raises
+    ------
+    ValueError
+        If the run exceeds ``MAX_SAMPLES`` (only possible for streaming
+        parameters — use ``iter_signal_chunks`` for those).
+    """
+    n_samples = _sample_count(params)
+    if n_samples > MAX_SAMPLES:
+        raise ValueError(
+            f"Signal would require {n_samples:,} samples which exceeds the in-memory limit "
+            f"of {MAX_SAMPLES:,}.  Use iter_signal_chunks() to stream it instead."
+        )
+    # Same values as np.linspace(0, duration, n, endpoint=False).
+    time = TimeAxis(dt=params.duration / n_samples, n=n_samples)
+    streams = _random_streams(params, rng)
+    signal_data = _synthesize(params, time, streams, workspace=workspace, contiguous=contiguous)
+
+    logger.debug(
+        "Signal generated",
+        extra={"n_samples": n_samples, "signal_type": params.signal_type},
+    )
+    return signal_data
+
+
+def iter_signal_chunks(
+    params: SignalParameters,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    rng: np.random.Generator | None = None,
+    workspace: SignalWorkspace | None = None,
+    contiguous: bool = False,
+) -> Iterator[SignalData]:
+    """Generate the signal described by *params* as consecutive chunks.
+
+    Each chunk is a ``SignalData`` of at most *chunk_size* samples.  Time is
+    computed from the absolute sample index with the same step as
+    ``generate_signal``, so phase is continuous across chunk boundaries and
+    deterministic waveforms — and seeded white noise — concatenate to exactly
+    the in-memory result.  Only one chunk is alive at a time, which is what
+    makes durations beyond ``MAX_SAMPLES`` possible.
+
+    Additive noise is scaled from the waveform's nominal power (e.g. A²/2 for
+    a sine) because the measured power of the whole signal is not known
+    until the stream ends.
+
+    Parameters
+    ----------
+    params:
+        Validated ``SignalParameters`` instance (``streaming`` need not be set).
+    chunk_size:
+        Maximum number of samples per chunk.
+    rng:
+        Optional generator to spawn the random streams from, as for
+        ``generate_signal``.
+    workspace:
+        Optional ``SignalWorkspace`` reused for every chunk.  Each chunk then
+        overwrites the previous one, so it must be consumed (written,
+        accumulated) before the next is requested — which is how the
+        writers in ``signal_export`` and ``MetricsAccumulator`` use them.
+    contiguous:
+        Back every chunk with a single ``samples`` buffer, as for
+        ``generate_signal``.
+
+    Yields
+    ------
+    SignalData
+        The next chunk of the signal.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be ≥ 1.")
+
+    n_samples = _sample_count(params)
+    step = params.duration / n_samples
+    signal_power = _nominal_power(params)
+    streams = _random_streams(params, rng)
+
+    n_chunks = 0
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        time = TimeAxis(dt=step, n=stop - start, start=start)
+        n_chunks += 1
+        yield _synthesize(params, time, streams, signal_power, workspace, contiguous)
+
+    logger.debug(
+        "Signal streamed",
+        extra={"n_samples": n_samples, "n_chunks": n_chunks, "chunk_size": chunk_size},
+    )
+
+
+def capture_signal(samples: npt.ArrayLike, sample_rate: float) -> SignalData:
+    """Wrap recorded samples as ``SignalData`` for ``compute_fft`` and friends.
+
+    Parameters
+    ----------
+    samples:
+        One channel of shape ``(N,)`` or several of shape ``(channels, N)``.
+        Float32 input is kept as float32; anything else is converted to
+        float64.
+    sample_rate:
+        Sampling rate of the capture in Hz.
+
+    Returns
+    -------
+    SignalData
+        ``signal`` and ``composite`` are the same array and no noise is
+        stored, since a capture cannot be split into signal and noise.
+
+    Raises
+    ------
+    ValueError
+        If *samples* is not 1-D or 2-D, or *sample_rate* is not positive.
+    """
+    composite = np.asarray(samples)
+    if composite.dtype != np.float32:
+        composite = composite.astype(np.float64, copy=False)
+    if composite.ndim not in (1, 2):
+        raise ValueError("samples must have shape (N,) or (channels, N).")
+    if sample_rate <= 0:
+        raise ValueError("sample_rate must be > 0.")
+    return SignalData(
+        time=TimeAxis(dt=1.0 / sample_rate, n=composite.shape[-1]),
+        signal=composite,
+        noise=_no_noise(composite.dtype, composite.shape[:-1]),
+        composite=composite,
+        sample_rate=float(sample_rate),
     )
+
+
+def stack_channels(channels: Sequence[SignalData]) -> SignalData:
+    """Combine single-channel signals into one ``(channels, N)`` signal.
+
+    The time axis is taken from the first channel.  Noise is stored for
+    every channel if any channel has some.
+
+    Raises
+    ------
+    ValueError
+        If *channels* is empty, holds multi-channel data, or its signals
+        differ in length or sample rate.
+    """
+    if not channels:
+        raise ValueError("At least one channel is required.")
+    first = channels[0]
+    for sd in channels:
+        if sd.is_multichannel:
+            raise ValueError("Only single-channel signals can be stacked.")
+        if len(sd.composite) != len(first.composite) or sd.sample_rate != first.sample_rate:
+            raise ValueError("All channels must have the same length and sample rate.")
+
+    signal = np.stack([sd.signal for sd in channels])
+    if any(sd.has_noise for sd in channels):
+        noise = np.stack([sd.noise_samples() for sd in channels])
+    else:
+        noise = _no_noise(signal.dtype, (len(channels),))
+    return SignalData(
+        time=first.time,
+        signal=signal,
+        noise=noise,
+        composite=np.stack([sd.composite for sd in channels]),
+        sample_rate=first.sample_rate,
+    )
+
+
+def compute_fft(signal_data: SignalData, params: SignalParameters) -> FFTResult:
+    """Compute the FFT of the composite signal.
+
+    In ``FFTMode.SINGLE`` only the first ``params.segment_size`` samples are
+    used.  In ``FFTMode.WELCH`` the whole signal is split into segments of
+    ``segment_size`` samples overlapping by ``params.welch_overlap`` and
+    their spectra are averaged (``params.welch_average``), which lowers the
+    variance of the estimate.  Each windowed segment is transformed at
+    ``params.transform_size`` points — larger than the segment when
+    ``params.fft_fast_length`` zero-pads it to a fast length.
+
+    The channels of a multi-channel signal go through the same batched
+    rFFT and come back as one spectrum row per channel.
+
+    Parameters
+    ----------
+    signal_data:
+        Time-domain data returned by ``generate_signal``.
+    params:
+        The same parameter set used to generate the signal (provides
+        the FFT lengths, ``fft_window``, the Welch settings, and
+        ``sampling_rate``).
+
+    Returns
+    -------
+    FFTResult
+        Positive-frequency bins with magnitude (linear and dB) and phase
+        (degrees).
+    """
+    if params.fft_mode == FFTMode.WELCH:
+        magnitude, magnitude_db, phase_deg = _welch_spectrum(signal_data.composite, params)
+    else:
+        segment = signal_data.composite[..., : params.segment_size]
+        windowed = _apply_window(segment, params.fft_window)
+        magnitude, magnitude_db, phase_deg = rfft_spectrum(windowed, params.transform_size)
+    frequencies = np.fft.rfftfreq(params.transform_size, d=1.0 / signal_data.sample_rate)
+
+    logger.debug(
+        "FFT computed",
+        extra={
+            "segment_size": params.segment_size,
+            "transform_size": params.transform_size,
+            "fft_window": params.fft_window,
+            "fft_mode": params.fft_mode,
+        },
+    )
+    return FFTResult(
+        frequencies=frequencies,
+        magnitude_db=magnitude_db,
+        phase_deg=phase_deg,
+        magnitude=magnitude,
+    )
+
+
+def compute_stft(
+    signal_data: SignalData, params: SignalParameters, hop: int | None = None
+) -> Spectrogram:
+    """Compute the short-time Fourier transform of the composite signal.
+
+    Frames of ``params.segment_size`` samples are taken as a strided view of
+    the signal (no copies), multiplied by the cached ``params.fft_window``,
+    and transformed at ``params.transform_size`` points with batched rFFTs of
+    up to ``_STFT_BLOCK_SAMPLES`` samples each.  Magnitudes use the same
+    normalisation as ``compute_fft`` and are stored as float32 to keep long
+    spectrograms compact.
+
+    Parameters
+    ----------
+    signal_data:
+        Time-domain data returned by ``generate_signal``.
+    params:
+        Provides the FFT lengths, ``fft_window``, and — unless *hop* is given —
+        the frame overlap via ``welch_overlap``.
+    hop:
+        Distance between the starts of consecutive frames, in samples.
+
+    Returns
+    -------
+    Spectrogram
+        Frame times, frequency bins, and a ``(frames, bins)`` dB matrix.
+    """
+    segment_size = params.segment_size
+    transform_size = params.transform_size
+    if hop is None:
+        hop = params.welch_hop
+    if hop < 1:
+        raise ValueError("hop must be ≥ 1.")
+
+    frames = _frames(signal_data.composite, segment_size, hop)
+    n_frames = frames.shape[0]
+    magnitude_db = np.empty((n_frames, transform_size // 2 + 1), dtype=np.float32)
+
+    block = max(1, _STFT_BLOCK_SAMPLES // transform_size)
+    for start in range(0, n_frames, block):
+        windowed = _apply_window(frames[start : start + block], params.fft_window)
+        spectra = _rfft(windowed, transform_size)
+        magnitude_db[start : start + block] = _to_db(
+            _normalise_magnitude(np.abs(spectra), segment_size)
+        )
+
+    times = (np.arange(n_frames) * hop + segment_size / 2.0) / signal_data.sample_rate
+    frequencies = np.fft.rfftfreq(transform_size, d=1.0 / signal_data.sample_rate)
+
+    logger.debug(
+        "STFT computed",
+        extra={"segment_size": segment_size, "transform_size": transform_size, "hop": hop},
+    )
+    return Spectrogram(times=times, frequencies=frequencies, magnitude_db=magnitude_db)
+
+
+def compute_metrics(
+    signal_data: SignalData, fft_result: FFTResult, *, max_harmonic: int = DEFAULT_MAX_HARMONIC
+) -> SignalMetrics:
+    """Derive scalar quality metrics from the computed signal and FFT.
+
+    RMS and peak come from a single cache-blocked pass over the composite
+    signal; THD and the dominant frequency from the linear spectrum.
+
+    Parameters
+    ----------
+    signal_data:
+        Time-domain data.
+    fft_result:
+        Frequency-domain data.
+    max_harmonic:
+        Highest harmonic order included in the THD (≥ 2; default 5, i.e. H2–H5).
+
+    Returns
+    -------
+    SignalMetrics
+        RMS, peak, crest factor, SNR, THD, and dominant frequency.
+
+    Raises
+    ------
+    ValueError
+        If *signal_data* is multi-channel; use ``compute_channel_metrics``.
+    """
+    _check_single_channel(signal_data, "compute_channel_metrics")
+    return _signal_metrics(signal_data, _fft_spectral(fft_result, max_harmonic)).channel(0)
+
+
+def compute_channel_metrics(
+    signal_data: SignalData, fft_result: FFTResult, *, max_harmonic: int = DEFAULT_MAX_HARMONIC
+) -> ChannelMetrics:
+    """Derive per-channel quality metrics from the computed signal and FFT.
+
+    The multi-channel counterpart of ``compute_metrics``: all channels are
+    reduced together.  A single-channel signal gives arrays of length 1.
+
+    Parameters
+    ----------
+    signal_data:
+        Time-domain data.
+    fft_result:
+        Frequency-domain data.
+    max_harmonic:
+        Highest harmonic order included in the THD, as for ``compute_metrics``.
+
+    Returns
+    -------
+    ChannelMetrics
+        RMS, peak, crest factor, SNR, THD, and dominant frequency per channel.
+    """
+    return _signal_metrics(signal_data, _fft_spectral(fft_result, max_harmonic))
+
+
+def measure_metrics(
+    signal_data: SignalData,
+    params: SignalParameters,
+    *,
+    max_harmonic: int = DEFAULT_MAX_HARMONIC,
+) -> SignalMetrics:
+    """Derive ``SignalMetrics`` straight from the signal, without an ``FFTResult``.
+
+    For callers that need the metrics but not the spectrum (sweeps, batch
+    jobs).  THD and the dominant frequency depend on a handful of spectral
+    bins only — the peak and its harmonics — so:
+
+    - when the peak is known to lie near ``params.frequency`` (or at DC) and
+      the transform is long, just those bins are evaluated, by a direct DFT
+      at a cost of about one matrix product with a dozen columns.  This
+      holds for every waveform except white noise, as long as additive
+      noise is not strong enough to rival the fundamental;
+    - otherwise the full rFFT is taken, but only its linear magnitude.  The
+      result is then identical to ``compute_metrics(signal_data,
+      compute_fft(signal_data, params))``.
+
+    The targeted bins agree with the full transform to rounding, so both
+    paths give the same metrics up to floating-point noise.  Use
+    ``compute_fft`` + ``compute_metrics`` when the spectrum itself is
+    needed, e.g. for plots.
+
+    Parameters
+    ----------
+    signal_data:
+        Time-domain data returned by ``generate_signal``.
+    params:
+        The same parameter set used to generate the signal.
+    max_harmonic:
+        Highest harmonic order included in the THD, as for ``compute_metrics``.
+
+    Returns
+    -------
+    SignalMetrics
+        RMS, peak, crest factor, SNR, THD, and dominant frequency.
+
+    Raises
+    ------
+    ValueError
+        If *signal_data* is multi-channel; use ``measure_channel_metrics``.
+    """
+    _check_single_channel(signal_data, "measure_channel_metrics")
+    spectral = _measured_spectral(signal_data, params, max_harmonic)
+    return _signal_metrics(signal_data, spectral).channel(0)
+
+
+def measure_channel_metrics(
+    signal_data: SignalData,
+    params: SignalParameters,
+    *,
+    max_harmonic: int = DEFAULT_MAX_HARMONIC,
+) -> ChannelMetrics:
+    """Per-channel ``measure_metrics``: metrics without an ``FFTResult``.
+
+    Every channel is measured against the same *params*, as
+    ``measure_metrics`` does for one channel.
+
+    Parameters
+    ----------
+    signal_data:
+        Time-domain data, single- or multi-channel.
+    params:
+        Parameter set describing the channels' content.
+    max_harmonic:
+        Highest harmonic order included in the THD, as for ``compute_metrics``.
+
+    Returns
+    -------
+    ChannelMetrics
+        RMS, peak, crest factor, SNR, THD, and dominant frequency per channel.
+    """
+    return _signal_metrics(signal_data, _measured_spectral(signal_data, params, max_harmonic))
+
+
+def analyze_batch(
+    params_list: Sequence[SignalParameters],
+    *,
+    rng: np.random.Generator | None = None,
+    max_harmonic: int = DEFAULT_MAX_HARMONIC,
+) -> list[AnalysisResult]:
+    """Run generate → FFT → metrics for many parameter sets at once.
+
+    Parameter sets that share the same sample count, FFT lengths, and dtype are
+    stacked into 2-D arrays: the waveforms are generated together, a single
+    batched rFFT transforms the whole group, and the metrics
+    are computed with vectorized reductions.  Each item is identical to what
+    the scalar ``generate_signal`` / ``compute_fft`` / ``compute_metrics``
+    path returns, random draws included when the item is seeded.
+
+    Parameters
+    ----------
+    params_list:
+        Validated ``SignalParameters`` instances, in any order.
+    rng:
+        Optional generator overriding the items' seeds.  Item ``i`` draws
+        from ``rng.spawn(len(params_list))[i]``, exactly as if that child had
+        been passed to ``generate_signal``.
+    max_harmonic:
+        Highest harmonic included in the THD, as for ``compute_metrics``.
+
+    Returns
+    -------
+    list[AnalysisResult]
+        One result per input, in the same order as *params_list*.  The arrays
+        of items from the same group are row views into shared 2-D blocks.
+    """
+    results: dict[int, AnalysisResult] = {}
+    n_groups = 0
+    for indices, group, group_rngs in _batch_groups(params_list, rng):
+        n_groups += 1
+        results.update(zip(indices, _analyze_group(group, group_rngs, max_harmonic)))
+
+    logger.debug(
+        "Batch analysed",
+        extra={"n_items": len(params_list), "n_groups": n_groups},
+    )
+    return [results[i] for i in range(len(params_list))]
+
+
+def measure_batch(
+    params_list: Sequence[SignalParameters],
+    *,
+    rng: np.random.Generator | None = None,
+    max_harmonic: int = DEFAULT_MAX_HARMONIC,
+) -> list[SignalMetrics]:
+    """Metrics-only ``analyze_batch``: generate → metrics for many parameter sets.
+
+    The signals are generated exactly as by ``analyze_batch``; the metrics
+    are measured as by ``measure_metrics``, so no ``FFTResult`` (dB and
+    phase spectra, frequency axes) is built.  Parameters as for
+    ``analyze_batch``.
+
+    Returns
+    -------
+    list[SignalMetrics]
+        One entry per input, in the same order as *params_list*.
+    """
+    metrics: dict[int, SignalMetrics] = {}
+    for indices, group, group_rngs in _batch_groups(params_list, rng):
+        signals = _generate_group(group, group_rngs)
+        spectral = _measured_spectral_metrics(signals.composite, group, max_harmonic)
+        group_metrics = _metrics_block(signals.composite, signals.raw, signals.noise, spectral)
+        metrics.update(zip(indices, group_metrics))
+
+    logger.debug("Batch measured", extra={"n_items": len(params_list)})
+    return [metrics[i] for i in range(len(params_list))]
+
+
+def _batch_groups(
+    params_list: Sequence[SignalParameters], rng: np.random.Generator | None
+) -> Iterator[tuple[list[int], list[SignalParameters], list[np.random.Generator | None]]]:
+    """Yield ``(indices, params, rngs)`` of each group of identically shaped runs.
+
+    Runs share a group when they have the same sample count, FFT lengths,
+    and dtype.
+    """
+    groups: dict[tuple[int, int, int, str], list[int]] = {}
+    for i, params in enumerate(params_list):
+        key = (
+            _sample_count(params),
+            params.segment_size,
+            params.transform_size,
+            str(params.dtype),
+        )
+        groups.setdefault(key, []).append(i)
+
+    item_rngs: list[np.random.Generator | None] = [None] * len(params_list)
+    if rng is not None:
+        item_rngs[:] = rng.spawn(len(params_list))
+    for indices in groups.values():
+        yield indices, [params_list[i] for i in indices], [item_rngs[i] for i in indices]
+
+
+class _GroupSignals(NamedTuple):
+    steps: np.ndarray  # (B, 1) sample spacing per row
+    raw: np.ndarray  # (B, N)
+    noise: np.ndarray  # (B, N), or (B, 0) when no row is noisy
+    has_noise: np.ndarray  # (B,) bool
+    composite: np.ndarray  # (B, N) — may be raw itself
+
+
+def _generate_group(
+    group: list[SignalParameters], rngs: list[np.random.Generator | None]
+) -> _GroupSignals:
+    """Vectorized signal generation for runs of identical shape."""
+    n_samples = _sample_count(group[0])
+    dtype = np.dtype(group[0].dtype)
+
+    def column(attr: str) -> np.ndarray:
+        return np.array([getattr(p, attr) for p in group], dtype=float)[:, np.newaxis]
+
+    # Random streams are only set up for the runs that draw from them.
+    streams = {
+        i: _random_streams(p, r)
+        for i, (p, r) in enumerate(zip(group, rngs))
+        if p.signal_type == SignalType.WHITE_NOISE or p.noise_type != NoiseType.NONE
+    }
+
+    # Same arithmetic as np.linspace(0, duration, n, endpoint=False) per row.
+    steps = np.array([p.duration / n_samples for p in group])[:, np.newaxis]
+    t = np.arange(n_samples, dtype=float) * steps
+
+    raw = np.empty((len(group), n_samples), dtype=dtype)
+    amplitude = column("amplitude")
+    frequency = column("frequency")
+    phase_deg = column("phase_deg")
+    for signal_type in {p.signal_type for p in group}:
+        rows = [i for i, p in enumerate(group) if p.signal_type == signal_type]
+        if signal_type == SignalType.WHITE_NOISE:
+            for i in rows:
+                raw[i] = streams[i].waveform.standard_normal(n_samples, dtype=raw.dtype)
+                raw[i] *= group[i].amplitude
+        else:
+            raw[rows] = _periodic_waveform(
+                signal_type, t[rows], amplitude[rows], frequency[rows], phase_deg[rows]
+            )
+
+    # Noise rows are only allocated when at least one run is noisy; the
+    # (B, 0) block is the batched form of the no-noise sentinel.
+    noisy = [i for i, p in enumerate(group) if p.noise_type != NoiseType.NONE]
+    has_noise = np.zeros(len(group), dtype=bool)
+    noise = np.zeros_like(raw) if noisy else np.empty((len(group), 0), dtype=raw.dtype)
+    if noisy:
+        signal_power = np.mean(raw[noisy] ** 2, axis=-1, dtype=np.float64)
+        for i, power in zip(noisy, signal_power):
+            row = _additive_noise(group[i], float(power), n_samples, streams[i].noise)
+            if row is not None:
+                noise[i] = row
+                has_noise[i] = True
+
+    dc_offset = column("dc_offset").astype(raw.dtype)
+    if noisy:
+        composite = raw + noise
+        composite += dc_offset
+    elif np.any(dc_offset):
+        composite = raw + dc_offset
+    else:
+        composite = raw
+    return _GroupSignals(steps, raw, noise, has_noise, composite)
+
+
+def _analyze_group(
+    group: list[SignalParameters],
+    rngs: list[np.random.Generator | None],
+    max_harmonic: int,
+) -> list[AnalysisResult]:
+    """Vectorized generate → FFT → metrics for runs of identical shape."""
+    steps, raw, noise, has_noise, composite = _generate_group(group, rngs)
+    n_samples = raw.shape[-1]
+    segment_size = group[0].segment_size
+    transform_size = group[0].transform_size
+
+    # One windowed block and a single batched rFFT for the whole group.
+    windowed = np.empty((len(group), segment_size), dtype=raw.dtype)
+    for window_type in {p.fft_window for p in group}:
+        rows = [i for i, p in enumerate(group) if p.fft_window == window_type]
+        windowed[rows] = _apply_window(composite[rows, :segment_size], window_type)
+    magnitude, magnitude_db, phase_deg_spec = rfft_spectrum(windowed, transform_size)
+
+    # Welch rows average over their own segment grid (the overlap may differ
+    # per row), replacing the single-segment spectra computed above.
+    for i, p in enumerate(group):
+        if p.fft_mode == FFTMode.WELCH:
+            magnitude[i], magnitude_db[i], phase_deg_spec[i] = _welch_spectrum(composite[i], p)
+
+    freq_by_rate: dict[float, np.ndarray] = {}
+    for p in group:
+        if p.sampling_rate not in freq_by_rate:
+            freq_by_rate[p.sampling_rate] = np.fft.rfftfreq(transform_size, d=1.0 / p.sampling_rate)
+    frequencies = np.stack([freq_by_rate[p.sampling_rate] for p in group])
+
+    metrics = _metrics_block(
+        composite, raw, noise, spectral_metrics(magnitude, frequencies, max_harmonic)
+    )
+
+    return [
+        AnalysisResult(
+            signal_data=SignalData(
+                time=TimeAxis(dt=float(steps[i, 0]), n=n_samples),
+                signal=raw[i],
+                noise=noise[i] if has_noise[i] else _no_noise(raw.dtype),
+                composite=composite[i],
+                sample_rate=p.sampling_rate,
+            ),
+            fft_result=FFTResult(
+                frequencies=frequencies[i],
+                magnitude_db=magnitude_db[i],
+                phase_deg=phase_deg_spec[i],
+                magnitude=magnitude[i],
+            ),
+            metrics=metrics[i],
+        )
+        for i, p in enumerate(group)
+    ]
@@ -0,0 +1,736 @@
+# -*- coding: utf-8 -*-
+
+"""Writers for signal analyzer results.
+
+Time-domain writers accept any iterable of ``SignalData`` chunks — either a
+single in-memory result wrapped in a list or the chunks produced by
+``iter_signal_chunks`` — and write them one chunk at a time, so streamed
+signals of any length are exported in constant memory:
+
+    write_time_domain_csv([signal_data], path)
+    write_time_domain_csv(iter_signal_chunks(params), path)
+
+CSV rows are formatted a block of columns at a time: one ``%``-format
+call renders ``_CSV_BLOCK_ROWS`` rows, so the per-value cost is that of C
+string formatting rather than a Python loop, and memory stays bounded by
+the block.  The output is byte-for-byte what ``csv.writer`` produced with
+per-value f-strings (``\r\n`` line endings included).
+
+A complete result (time domain, spectrum, metrics) is written to a
+directory by a ``ResultWriter`` in one of the ``ResultFormat`` layouts:
+
+==========  ===============================================================
+``csv``     ``time_domain.csv``, ``frequency_domain.csv``, ``metrics.csv``
+``npy``     ``time_domain.npy``, ``frequency_domain.npy``, ``result.json``
+``npz``     ``result.npz`` (the two ``.npy`` members), ``result.json``
+``jsonl``   ``time_domain.jsonl``, ``frequency_domain.jsonl``, ``result.json``
+==========  ===============================================================
+
+The binary layouts hold structured arrays of ``TIME_DOMAIN_RECORD`` and
+``FREQUENCY_DOMAIN_RECORD``; ``result.json`` is a small sidecar with the
+``SignalParameters``, the metrics, and the time axis.  ``load_result``
+memory-maps a binary result back without copying, archive members
+included (they are stored uncompressed)::
+
+    with ResultWriter(output_dir, ResultFormat.NPZ) as writer:
+        writer.write_time_domain([signal_data], len(signal_data.composite))
+        writer.write_frequency_domain(fft_result)
+        writer.write_metrics(params, metrics)
+    params, result = load_result(output_dir)
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import struct
+import threading
+import zipfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import asdict
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, NamedTuple, Self, TextIO
+
+import numpy as np
+
+from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.core.signal_engine import (
+    AnalysisResult,
+    FFTResult,
+    SignalData,
+    SignalMetrics,
+    TimeAxis,
+)
+from scaldys_template.core.signal_model import SignalParameters
+
+__all__ = [
+    "FREQUENCY_DOMAIN_COLUMNS",
+    "FREQUENCY_DOMAIN_RECORD",
+    "TIME_DOMAIN_COLUMNS",
+    "TIME_DOMAIN_RECORD",
+    "ResultFormat",
+    "ResultWriter",
+    "SavedResult",
+    "load_result",
+    "read_time_domain_raw",
+    "write_csv_columns",
+    "write_frequency_domain_csv",
+    "write_frequency_domain_rows",
+    "write_metrics_csv",
+    "write_time_domain_csv",
+    "write_time_domain_raw",
+    "write_time_domain_rows",
+]
+
+logger = logging.getLogger(PACKAGE_NAME)
+
+TIME_DOMAIN_COLUMNS = ("time_s", "signal", "noise", "composite")
+
+FREQUENCY_DOMAIN_COLUMNS = ("frequency_hz", "magnitude_db", "phase_deg")
+
+# Rows formatted per block by ``write_csv_columns``: about 6 MiB of text for
+# four eight-decimal columns.
+_CSV_BLOCK_ROWS = 1 << 16
+
+# One column handed to the CSV / JSON Lines writers: anything with a length
+# that yields array-like blocks when sliced.  A ``TimeAxis`` qualifies and
+# is evaluated one block at a time.
+_Column = np.ndarray | TimeAxis | Sequence[float]
+
+# Line terminator of ``csv.writer``'s default dialect.
+_CSV_LINE_TERMINATOR = "\r\n"
+
+# Record layout of the raw binary time-domain format: one little-endian
+# float64 per column, interleaved per sample.
+TIME_DOMAIN_RECORD = np.dtype([(name, "<f8") for name in TIME_DOMAIN_COLUMNS])
+
+# Record layout of the binary spectrum: the CSV columns plus the linear
+# magnitude the metrics are derived from.
+FREQUENCY_DOMAIN_RECORD = np.dtype(
+    [(name, "<f8") for name in (*FREQUENCY_DOMAIN_COLUMNS, "magnitude")]
+)
+
+# Records converted and written per block by the binary writers (2 MiB).
+_RECORD_BLOCK_ROWS = 1 << 16
+
+_RESULT_SIDECAR = "result.json"
+_RESULT_ARCHIVE = "result.npz"
+_TIME_DOMAIN = "time_domain"
+_FREQUENCY_DOMAIN = "frequency_domain"
+
+# Fixed-size part of a ZIP local file header; the file name and extra field
+# lengths are the two little-endian uint16 values at its end.
+_ZIP_LOCAL_HEADER = 30
+
+
+class ResultFormat(StrEnum):
+    """File layout of a result written by ``ResultWriter``."""
+
+    CSV = "csv"
+    NPZ = "npz"
+    NPY = "npy"
+    JSONL = "jsonl"
+
+
+class SavedResult(NamedTuple):
+    """A result read back by ``load_result``."""
+
+    params: SignalParameters
+    result: AnalysisResult
+
+
+def _check_columns(columns: Sequence[_Column]) -> int:
+    n_rows = len(columns[0]) if columns else 0
+    if any(len(column) != n_rows for column in columns):
+        raise ValueError("All columns must have the same length.")
+    return n_rows
+
+
+def _row_blocks(columns: Sequence[_Column], n_rows: int) -> Iterator[np.ndarray]:
+    """Yield float64 ``(rows, columns)`` blocks of at most ``_CSV_BLOCK_ROWS`` rows.
+
+    The blocks share one buffer, so each is only valid until the next.
+    """
+    block = np.empty((min(n_rows, _CSV_BLOCK_ROWS), len(columns)))
+    for start in range(0, n_rows, _CSV_BLOCK_ROWS):
+        stop = min(start + _CSV_BLOCK_ROWS, n_rows)
+        rows = block[: stop - start]
+        for j, column in enumerate(columns):
+            rows[:, j] = column[start:stop]
+        yield rows
+
+
+def write_csv_columns(f: TextIO, columns: Sequence[_Column], formats: Sequence[str]) -> int:
+    """Write equal-length numeric *columns* to the open text file *f* as CSV rows.
+
+    Parameters
+    ----------
+    f:
+        Text file opened with ``newline=""``.
+    columns:
+        One 1-D sequence per CSV column, indexed by slices only (a
+        ``TimeAxis`` is evaluated block by block, never as a whole).
+    formats:
+        One ``%``-style format per column, e.g. ``"%.8f"``.  Values are
+        converted to Python floats first, so the text equals the matching
+        f-string format (``f"{x:.8f}"``) of the original values.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    if len(columns) != len(formats):
+        raise ValueError("One format is required per column.")
+    n_rows = _check_columns(columns)
+    row_format = ",".join(formats) + _CSV_LINE_TERMINATOR
+    f.writelines(
+        (row_format * len(rows)) % tuple(rows.ravel().tolist())
+        for rows in _row_blocks(columns, n_rows)
+    )
+    return n_rows
+
+
+def _write_jsonl_columns(f: TextIO, columns: Sequence[_Column], names: Sequence[str]) -> int:
+    """Write *columns* to *f* as JSON Lines, one ``{name: value}`` object per row.
+
+    Values are written with ``repr``, which round-trips every float64
+    exactly; NaN and infinities are spelled as Python's ``json`` does.
+    """
+    n_rows = _check_columns(columns)
+    row_format = "{" + ", ".join(f'"{name}": %r' for name in names) + "}\n"
+    for rows in _row_blocks(columns, n_rows):
+        text = (row_format * len(rows)) % tuple(rows.ravel().tolist())
+        if not np.isfinite(rows).all():
+            text = text.replace("nan", "NaN").replace("inf", "Infinity")
+        f.write(text)
+    return n_rows
+
+
+def write_time_domain_rows(f: TextIO, chunks: Iterable[SignalData]) -> int:
+    """Append the ``TIME_DOMAIN_COLUMNS`` rows of *chunks* (no header) to *f*.
+
+    Values are written with eight decimals.  Returns the number of rows.
+    """
+    n_rows = 0
+    for chunk in chunks:
+        n_rows += write_csv_columns(
+            f,
+            (chunk.time, chunk.signal, chunk.noise_samples(), chunk.composite),
+            ("%.8f",) * len(TIME_DOMAIN_COLUMNS),
+        )
+    return n_rows
+
+
+def write_frequency_domain_rows(f: TextIO, fft_result: FFTResult) -> int:
+    """Append the ``FREQUENCY_DOMAIN_COLUMNS`` rows of *fft_result* (no header) to *f*.
+
+    Values are written with four decimals.  Returns the number of rows.
+    """
+    return write_csv_columns(
+        f,
+        (fft_result.frequencies, fft_result.magnitude_db, fft_result.phase_deg),
+        ("%.4f",) * len(FREQUENCY_DOMAIN_COLUMNS),
+    )
+
+
+def write_time_domain_csv(chunks: Iterable[SignalData], path: Path) -> int:
+    """Write time-domain samples to *path* as CSV.
+
+    Values are written with eight decimals under a
+    ``time_s,signal,noise,composite`` header.
+
+    Parameters
+    ----------
+    chunks:
+        ``SignalData`` chunks in sample order.
+    path:
+        Destination CSV file.
+
+    Returns
+    -------
+    int
+        Number of sample rows written.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be written.
+    """
+    try:
+        with path.open("w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(TIME_DOMAIN_COLUMNS)
+            n_rows = write_time_domain_rows(f, chunks)
+    except OSError as exc:
+        logger.error("Failed to write time-domain CSV to %s: %s", path, exc)
+        raise
+
+    logger.debug("Time-domain CSV written", extra={"path": str(path), "n_rows": n_rows})
+    return n_rows
+
+
+def write_frequency_domain_csv(fft_result: FFTResult, path: Path) -> int:
+    """Write a spectrum to *path* as CSV.
+
+    Values are written with four decimals under a
+    ``frequency_hz,magnitude_db,phase_deg`` header.
+
+    Parameters
+    ----------
+    fft_result:
+        Single-channel spectrum to write.
+    path:
+        Destination CSV file.
+
+    Returns
+    -------
+    int
+        Number of frequency rows written.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be written.
+    """
+    try:
+        with path.open("w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(FREQUENCY_DOMAIN_COLUMNS)
+            n_rows = write_frequency_domain_rows(f, fft_result)
+    except OSError as exc:
+        logger.error("Failed to write frequency-domain CSV to %s: %s", path, exc)
+        raise
+
+    logger.debug("Frequency-domain CSV written", extra={"path": str(path), "n_rows": n_rows})
+    return n_rows
+
+
+def write_metrics_csv(metrics: SignalMetrics, path: Path) -> None:
+    """Write single-channel *metrics* to *path* as a two-column ``metric,value`` CSV.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be written.
+    """
+    snr_db = f"{metrics.snr_db:.2f}" if metrics.snr_db is not None else "N/A"
+    try:
+        with path.open("w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(
+                [
+                    ["metric", "value"],
+                    ["rms", f"{metrics.rms:.6f}"],
+                    ["peak", f"{metrics.peak:.6f}"],
+                    ["crest_factor", f"{metrics.crest_factor:.4f}"],
+                    ["snr_db", snr_db],
+                    ["thd_db", f"{metrics.thd_db:.2f}"],
+                    ["peak_freq_hz", f"{metrics.peak_freq:.4f}"],
+                ]
+            )
+    except OSError as exc:
+        logger.error("Failed to write metrics CSV to %s: %s", path, exc)
+        raise
+
+
+def _write_time_domain_records(f: IO[bytes], chunks: Iterable[SignalData]) -> tuple[int, bool]:
+    """Write *chunks* to *f* as ``TIME_DOMAIN_RECORD`` bytes.
+
+    Records are assembled ``_RECORD_BLOCK_ROWS`` at a time in one reused
+    buffer, whatever the chunk length.  Returns the number of records and
+    whether any chunk carried noise.
+    """
+    buffer = np.empty(_RECORD_BLOCK_ROWS, dtype=TIME_DOMAIN_RECORD)
+    n_rows = 0
+    has_noise = False
+    for chunk in chunks:
+        noise = chunk.noise_samples()
+        has_noise = has_noise or chunk.has_noise
+        n = len(chunk.composite)
+        for start in range(0, n, _RECORD_BLOCK_ROWS):
+            stop = min(start + _RECORD_BLOCK_ROWS, n)
+            records = buffer[: stop - start]
+            records["time_s"] = chunk.time[start:stop]
+            records["signal"] = chunk.signal[start:stop]
+            records["noise"] = noise[start:stop]
+            records["composite"] = chunk.composite[start:stop]
+            f.write(records.data)
+        n_rows += n
+    return n_rows, has_noise
+
+
+def _frequency_domain_records(fft_result: FFTResult) -> np.ndarray:
+    records = np.empty(len(fft_result.frequencies), dtype=FREQUENCY_DOMAIN_RECORD)
+    records["frequency_hz"] = fft_result.frequencies
+    records["magnitude_db"] = fft_result.magnitude_db
+    records["phase_deg"] = fft_result.phase_deg
+    if fft_result.magnitude is not None:
+        records["magnitude"] = fft_result.magnitude
+    else:
+        records["magnitude"] = 10.0 ** (np.asarray(fft_result.magnitude_db) / 20.0)
+    return records
+
+
+def _write_npy_header(f: IO[bytes], dtype: np.dtype, n_rows: int) -> None:
+    header = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False}
+    np.lib.format.write_array_header_1_0(f, {**header, "shape": (n_rows,)})
+
+
+def write_time_domain_raw(chunks: Iterable[SignalData], path: Path) -> int:
+    """Write time-domain samples to *path* as headerless binary records.
+
+    Each sample is one ``TIME_DOMAIN_RECORD`` (four little-endian float64
+    values).  Use :func:`read_time_domain_raw` to map the file back.
+
+    Parameters
+    ----------
+    chunks:
+        ``SignalData`` chunks in sample order.
+    path:
+        Destination file (conventionally ``*.f64``).
+
+    Returns
+    -------
+    int
+        Number of records written.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be written.
+    """
+    try:
+        with path.open("wb") as f:
+            n_rows, _ = _write_time_domain_records(f, chunks)
+    except OSError as exc:
+        logger.error("Failed to write raw time-domain data to %s: %s", path, exc)
+        raise
+
+    logger.debug("Raw time-domain data written", extra={"path": str(path), "n_rows": n_rows})
+    return n_rows
+
+
+def read_time_domain_raw(path: Path) -> np.ndarray:
+    """Memory-map a file written by :func:`write_time_domain_raw`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only structured array of ``TIME_DOMAIN_RECORD``; individual
+        columns are available as ``records["composite"]`` etc.
+    """
+    if path.stat().st_size == 0:
+        return np.empty(0, dtype=TIME_DOMAIN_RECORD)
+    return np.memmap(path, dtype=TIME_DOMAIN_RECORD, mode="r")
+
+
+class ResultWriter:
+    """Write one analysis result to *directory* in a ``ResultFormat`` layout.
+
+    Call :meth:`write_time_domain`, :meth:`write_frequency_domain`, and
+    :meth:`write_metrics` once each, then :meth:`close` (or use the writer
+    as a context manager).  The two data writers may run concurrently on
+    different threads; :meth:`write_metrics` must follow
+    :meth:`write_time_domain`, whose time axis it records.  The time domain is written
+    chunk by chunk, so a streamed signal never has to be held in memory.
+
+    Parameters
+    ----------
+    directory:
+        Existing output directory.
+    fmt:
+        File layout; see the module docstring.
+    """
+
+    def __init__(self, directory: Path, fmt: ResultFormat = ResultFormat.CSV) -> None:
+        self.directory = directory
+        self.format = ResultFormat(fmt)
+        self._archive: zipfile.ZipFile | None = None
+        # A ZipFile takes one member at a time; held for a whole member write.
+        self._archive_lock = threading.Lock()
+        self._time: TimeAxis | None = None
+        self._sample_rate: float | None = None
+        self._has_noise = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Finish the archive of an ``npz`` result."""
+        with self._archive_lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+
+    def write_time_domain(self, chunks: Iterable[SignalData], n_samples: int) -> Path:
+        """Write the time-domain samples of *chunks* and return the file written.
+
+        Parameters
+        ----------
+        chunks:
+            ``SignalData`` chunks in sample order.
+        n_samples:
+            Total number of samples in *chunks*; the binary layouts record
+            it in the array header before the samples arrive.
+
+        Raises
+        ------
+        ValueError
+            If *chunks* do not hold exactly *n_samples* samples.
+        OSError
+            If the file cannot be written.
+        """
+        chunks = self._observe(chunks)
+        if self.format == ResultFormat.CSV:
+            path = self.directory / f"{_TIME_DOMAIN}.csv"
+            n_rows = write_time_domain_csv(chunks, path)
+        elif self.format == ResultFormat.JSONL:
+            path = self.directory / f"{_TIME_DOMAIN}.jsonl"
+            with self._open_text(path) as f:
+                n_rows = sum(
+                    _write_jsonl_columns(
+                        f,
+                        (chunk.time, chunk.signal, chunk.noise_samples(), chunk.composite),
+                        TIME_DOMAIN_COLUMNS,
+                    )
+                    for chunk in chunks
+                )
+        else:
+            with self._open_binary(f"{_TIME_DOMAIN}.npy") as (path, f):
+                _write_npy_header(f, TIME_DOMAIN_RECORD, n_samples)
+                n_rows, _ = _write_time_domain_records(f, chunks)
+        if n_rows != n_samples:
+            raise ValueError(f"Expected {n_samples} samples, but {n_rows} were written.")
+        logger.debug("Time domain written", extra={"path": str(path), "n_rows": n_rows})
+        return path
+
+    def write_frequency_domain(self, fft_result: FFTResult) -> Path:
+        """Write the spectrum *fft_result* and return the file written.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be written.
+        """
+        if self.format == ResultFormat.CSV:
+            path = self.directory / f"{_FREQUENCY_DOMAIN}.csv"
+            write_frequency_domain_csv(fft_result, path)
+            return path
+        records = _frequency_domain_records(fft_result)
+        if self.format == ResultFormat.JSONL:
+            path = self.directory / f"{_FREQUENCY_DOMAIN}.jsonl"
+            with self._open_text(path) as f:
+                names = FREQUENCY_DOMAIN_RECORD.names
+                assert names is not None  # a structured dtype always has field names
+                _write_jsonl_columns(f, [records[name] for name in names], names)
+        else:
+            with self._open_binary(f"{_FREQUENCY_DOMAIN}.npy") as (path, f):
+                _write_npy_header(f, FREQUENCY_DOMAIN_RECORD, len(records))
+                f.write(records.data)
+        logger.debug("Frequency domain written", extra={"path": str(path)})
+        return path
+
+    def write_metrics(self, params: SignalParameters, metrics: SignalMetrics) -> Path:
+        """Write *metrics* (``metrics.csv``, or the ``result.json`` sidecar).
+
+        The sidecar also records *params* and the time axis of the samples
+        written by :meth:`write_time_domain`, which :func:`load_result` needs.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be written.
+        """
+        if self.format == ResultFormat.CSV:
+            path = self.directory / "metrics.csv"
+            write_metrics_csv(metrics, path)
+            return path
+
+        time = self._time or TimeAxis(dt=1.0 / params.sampling_rate, n=0)
+        meta = {
+            "format": str(self.format),
+            "time": {"dt": time.dt, "n": time.n, "start": time.start},
+            "sample_rate": self._sample_rate or params.sampling_rate,
+            "has_noise": self._has_noise,
+            "metrics": asdict(metrics),
+            "params": params.model_dump(mode="json"),
+        }
+        path = self.directory / _RESULT_SIDECAR
+        try:
+            path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        except OSError as exc:
+            logger.error("Failed to write result sidecar to %s: %s", path, exc)
+            raise
+        return path
+
+    def _observe(self, chunks: Iterable[SignalData]) -> Iterator[SignalData]:
+        """Pass *chunks* through, recording the time axis and noise presence."""
+        n = 0
+        for chunk in chunks:
+            if self._time is None:
+                self._time = chunk.time
+                self._sample_rate = chunk.sample_rate
+            self._has_noise = self._has_noise or chunk.has_noise
+            n += len(chunk.composite)
+            yield chunk
+        if self._time is not None:
+            first = self._time
+            self._time = TimeAxis(dt=first.dt, n=n, start=first.start)
+
+    def _open_text(self, path: Path) -> TextIO:
+        try:
+            return path.open("w", newline="", encoding="utf-8")
+        except OSError as exc:
+            logger.error("Failed to write %s: %s", path, exc)
+            raise
+
+    def _open_binary(self, name: str) -> _BinaryTarget:
+        if self.format == ResultFormat.NPZ:
+            with self._archive_lock:
+                if self._archive is None:
+                    # Stored, not deflated: load_result maps the members in place.
+                    self._archive = zipfile.ZipFile(
+                        self.directory / _RESULT_ARCHIVE, "w", compression=zipfile.ZIP_STORED
+                    )
+                archive = self._archive
+            return _BinaryTarget(
+                self.directory / _RESULT_ARCHIVE,
+                lambda: archive.open(name, "w", force_zip64=True),
+                self._archive_lock,
+            )
+        path = self.directory / name
+        return _BinaryTarget(path, lambda: path.open("wb"))
+
+
+class _BinaryTarget:
+    """Context manager yielding ``(path, file)`` for one binary array.
+
+    If *lock* is given, it is held from opening to closing the file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        opener: Callable[[], IO[bytes]],
+        lock: threading.Lock | None = None,
+    ) -> None:
+        self._path = path
+        self._opener = opener
+        self._lock = lock
+        self._file: IO[bytes] | None = None
+
+    def __enter__(self) -> tuple[Path, IO[bytes]]:
+        if self._lock is not None:
+            self._lock.acquire()
+        try:
+            self._file = self._opener()
+        except OSError as exc:
+            self._release()
+            logger.error("Failed to write %s: %s", self._path, exc)
+            raise
+        return self._path, self._file
+
+    def __exit__(self, *exc_info: object) -> None:
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        if self._lock is not None:
+            self._lock.release()
+
+
+def _map_npz_member(path: Path, name: str) -> np.ndarray:
+    """Memory-map the uncompressed ``.npy`` member *name* of the archive *path*."""
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(name)
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"Archive member {name} is compressed and cannot be memory-mapped.")
+    with path.open("rb") as f:
+        f.seek(info.header_offset)
+        local_header = f.read(_ZIP_LOCAL_HEADER)
+        if local_header[:4] != b"PK\x03\x04":
+            raise ValueError(f"Corrupt archive header for member {name}.")
+        name_len, extra_len = struct.unpack("<HH", local_header[26:30])
+        f.seek(info.header_offset + _ZIP_LOCAL_HEADER + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if not shape or 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    order = "F" if fortran_order else "C"
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order)
+
+
+def load_result(directory: Path) -> SavedResult:
+    """Read back a result written by ``ResultWriter`` in a binary format.
+
+    The arrays of the returned ``AnalysisResult`` are read-only views of
+    memory maps of the result files, so nothing is copied or parsed up
+    front.  Samples and spectra come back as float64 whatever the
+    ``dtype`` of the run.
+
+    Parameters
+    ----------
+    directory:
+        Output directory holding a ``npy`` or ``npz`` result.
+
+    Returns
+    -------
+    SavedResult
+        The parameters the result was computed from, and the result.
+
+    Raises
+    ------
+    ValueError
+        If the directory holds a text (``csv`` / ``jsonl``) result, or its
+        files do not have the expected layout.
+    OSError
+        If a file cannot be read.
+    """
+    meta = json.loads((directory / _RESULT_SIDECAR).read_text(encoding="utf-8"))
+    fmt = ResultFormat(meta["format"])
+    if fmt == ResultFormat.NPY:
+        time_domain, frequency_domain = (
+            np.load(directory / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+            for name in (_TIME_DOMAIN, _FREQUENCY_DOMAIN)
+        )
+    elif fmt == ResultFormat.NPZ:
+        time_domain, frequency_domain = (
+            _map_npz_member(directory / _RESULT_ARCHIVE, f"{name}.npy")
+            for name in (_TIME_DOMAIN, _FREQUENCY_DOMAIN)
+        )
+    else:
+        raise ValueError(f"Only npy and npz results can be loaded, not {fmt}.")
+    if time_domain.dtype != TIME_DOMAIN_RECORD or frequency_domain.dtype != FREQUENCY_DOMAIN_RECORD:
+        raise ValueError(f"Unexpected record layout in {directory}.")
+
+    noise = time_domain["noise"]
+    return SavedResult(
+        params=SignalParameters.model_validate(meta["params"]),
+        result=AnalysisResult(
+            signal_data=SignalData(
+                time=TimeAxis(**meta["time"]),
+                signal=time_domain["signal"],
+                noise=noise if meta["has_noise"] else noise[:0],
+                composite=time_domain["composite"],
+                sample_rate=meta["sample_rate"],
+            ),
+            fft_result=FFTResult(
+                frequencies=frequency_domain["frequency_hz"],
+                magnitude_db=frequency_domain["magnitude_db"],
+                phase_deg=frequency_domain["phase_deg"],
+                magnitude=frequency_domain["magnitude"],
+            ),
+            metrics=SignalMetrics(**meta["metrics"]),
+        ),
+    )
@@ -10,15 +10,24 @@ so it is exercised the same way regardless of how the parameters arrive.
 from __future__ import annotations
 
 from enum import StrEnum
+from typing import Literal
 
 from pydantic import BaseModel, field_validator, model_validator
 
+from scaldys_template.core.fft_length import next_fast_length, prev_fast_length
+
 __all__ = [
     "SignalType",
     "NoiseType",
     "WindowType",
+    "FFTMode",
+    "FastLength",
+    "SpectrumAverage",
+    "SampleDtype",
     "SignalParameters",
     "MAX_SAMPLES",
+    "MAX_DURATION",
+    "MAX_STREAMING_DURATION",
 ]
 
 # ---------------------------------------------------------------------------
@@ -26,6 +35,8 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 MAX_SAMPLES = 10_000_000  # hard ceiling on generated sample count (~40 MB float64)
+MAX_DURATION = 60.0  # seconds — upper duration bound for in-memory runs
+MAX_STREAMING_DURATION = 86_400.0  # seconds — upper duration bound when streaming
 
 
 class SignalType(StrEnum):
@@ -49,6 +60,27 @@ class WindowType(StrEnum):
     BLACKMAN = "blackman"
 
 
+class FFTMode(StrEnum):
+    SINGLE = "single"  # one segment: the first fft_size samples
+    WELCH = "welch"  # averaged over overlapping segments of the whole signal
+
+
+class FastLength(StrEnum):
+    OFF = "off"  # transform exactly fft_size samples
+    PAD = "pad"  # zero-pad each segment up to the next 5-smooth length
+    TRUNCATE = "truncate"  # shorten each segment to the previous 5-smooth length
+
+
+class SpectrumAverage(StrEnum):
+    MEAN = "mean"
+    MEDIAN = "median"
+
+
+class SampleDtype(StrEnum):
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"  # half the memory; spectra become complex64 internally
+
+
 # ---------------------------------------------------------------------------
 # Parameter model
 # ---------------------------------------------------------------------------
@@ -61,11 +93,29 @@ class SignalParameters(BaseModel):
     ----------------
     - ``frequency``: 0.1 – 10 000 Hz
     - ``amplitude``: > 0
-    - ``duration``: 0.001 – 60 s
+    - ``duration``: 0.001 – 60 s  (up to 86 400 s when ``streaming``)
     - ``sampling_rate``: ≥ 2 × frequency  (Nyquist)
     - ``phase_deg``: 0 – 360
-    - ``fft_size``: ≥ 2, power of two, ≤ total sample count
-    - total samples (duration × sampling_rate) ≤ MAX_SAMPLES
+    - ``fft_size``: ≥ 2 and ≤ total sample count, or ``"auto"``
+    - ``welch_overlap``: 0 ≤ overlap < 1  (fraction of ``fft_size``)
+    - ``seed``: ≥ 0, or ``None``
+    - total samples (duration × sampling_rate) ≤ MAX_SAMPLES unless ``streaming``
+    - ``welch_average``: ``MEAN`` when ``streaming`` in ``FFTMode.WELCH``
+
+    ``streaming`` selects chunked generation (``iter_signal_chunks``), which
+    never materialises the whole signal and is therefore exempt from the
+    in-memory limits.
+
+    ``seed`` makes the random draws (white noise and additive noise)
+    reproducible; ``None`` seeds every run from fresh OS entropy.
+
+    ``fft_size`` may be any length.  ``"auto"`` picks the largest 5-smooth
+    length (prime factors 2, 3, 5 only) that fits the signal, so the whole
+    capture is analysed at full FFT speed.  ``fft_fast_length`` adapts an
+    explicit size to a fast one: ``PAD`` zero-pads each segment up to the
+    next 5-smooth length, ``TRUNCATE`` analyses only the largest 5-smooth
+    number of samples.  ``segment_size`` and ``transform_size`` give the
+    resulting lengths.
     """
 
     signal_type: SignalType = SignalType.SINE
@@ -78,7 +128,14 @@ class SignalParameters(BaseModel):
     noise_type: NoiseType = NoiseType.NONE
     snr_db: float = 20.0  # dB — only used when noise_type != NONE
     fft_window: WindowType = WindowType.HANNING
-    fft_size: int = 1024  # 1024 ≤ 4 410 samples at default rate/duration
+    fft_size: int | Literal["auto"] = 1024  # 1024 ≤ 4 410 samples at default rate/duration
+    fft_fast_length: FastLength = FastLength.OFF  # adapt fft_size to a 5-smooth length
+    fft_mode: FFTMode = FFTMode.SINGLE
+    welch_overlap: float = 0.5  # fraction of fft_size shared by adjacent segments
+    welch_average: SpectrumAverage = SpectrumAverage.MEAN
+    streaming: bool = False  # generate in fixed-size chunks (no MAX_SAMPLES cap)
+    dtype: SampleDtype = SampleDtype.FLOAT64  # precision of sample and spectrum arrays
+    seed: int | None = None  # random seed — None draws fresh entropy per run
 
     # ------------------------------------------------------------------
     # Field-level validators
@@ -101,8 +158,8 @@ class SignalParameters(BaseModel):
     @field_validator("duration")
     @classmethod
     def check_duration(cls, v: float) -> float:
-        if not (0.001 <= v <= 60.0):
-            raise ValueError("Duration must be between 0.001 and 60 s.")
+        if not (0.001 <= v <= MAX_STREAMING_DURATION):
+            raise ValueError("Duration must be between 0.001 and 86 400 s.")
         return v
 
     @field_validator("sampling_rate")
@@ -121,11 +178,23 @@ class SignalParameters(BaseModel):
 
     @field_validator("fft_size")
     @classmethod
-    def check_fft_size(cls, v: int) -> int:
-        if v < 2:
+    def check_fft_size(cls, v: int | str) -> int | str:
+        if isinstance(v, int) and v < 2:
             raise ValueError("FFT size must be ≥ 2.")
-        if (v & (v - 1)) != 0:
-            raise ValueError("FFT size must be a power of two (e.g. 256, 512, 1024, …).")
+        return v
+
+    @field_validator("welch_overlap")
+    @classmethod
+    def check_welch_overlap(cls, v: float) -> float:
+        if not (0.0 <= v < 1.0):
+            raise ValueError("Welch overlap must be ≥ 0 and < 1.")
+        return v
+
+    @field_validator("seed")
+    @classmethod
+    def check_seed(cls, v: int | None) -> int | None:
+        if v is not None and v < 0:
+            raise ValueError("Seed must be ≥ 0.")
         return v
 
     # ------------------------------------------------------------------
@@ -141,20 +210,78 @@ class SignalParameters(BaseModel):
                 f"({self.frequency:.1f} Hz).  Minimum required: {2 * self.frequency:.1f} Hz."
             )
 
+        # Duration ceiling for in-memory runs
+        if not self.streaming and self.duration > MAX_DURATION:
+            raise ValueError(
+                f"Duration must be between 0.001 and {MAX_DURATION:.0f} s "
+                "(enable streaming for longer signals)."
+            )
+
+        # A streamed Welch spectrum is a running sum; a median needs every segment
+        if (
+            self.streaming
+            and self.fft_mode == FFTMode.WELCH
+            and self.welch_average == SpectrumAverage.MEDIAN
+        ):
+            raise ValueError(
+                "Median Welch averaging needs every segment at once; use mean averaging "
+                "when streaming."
+            )
+
         total_samples = int(self.duration * self.sampling_rate)
 
         # Memory guard
-        if total_samples > MAX_SAMPLES:
+        if not self.streaming and total_samples > MAX_SAMPLES:
             raise ValueError(
                 f"Signal would require {total_samples:,} samples which exceeds the limit "
-                f"of {MAX_SAMPLES:,}.  Reduce duration or sampling rate."
+                f"of {MAX_SAMPLES:,}.  Reduce duration or sampling rate, or enable streaming."
             )
 
         # FFT size cannot exceed the number of generated samples
-        if self.fft_size > total_samples:
+        if self.fft_size == "auto":
+            if total_samples < 2:
+                raise ValueError(
+                    f"FFT size 'auto' needs at least 2 samples; duration × sampling rate "
+                    f"gives {total_samples}."
+                )
+        elif self.fft_size > total_samples:
             raise ValueError(
                 f"FFT size ({self.fft_size}) must be ≤ total samples "
                 f"({total_samples} = duration × sampling rate)."
             )
 
         return self
+
+    # ------------------------------------------------------------------
+    # Derived FFT lengths
+    # ------------------------------------------------------------------
+
+    @property
+    def segment_size(self) -> int:
+        """Number of signal samples in each FFT segment.
+
+        ``fft_size`` with ``"auto"`` resolved — the largest 5-smooth length
+        not exceeding the sample count (or ``MAX_SAMPLES``) — and shortened
+        to a 5-smooth length under ``FastLength.TRUNCATE``.
+        """
+        if self.fft_size == "auto":
+            total_samples = int(self.duration * self.sampling_rate)
+            return prev_fast_length(min(total_samples, MAX_SAMPLES))
+        if self.fft_fast_length == FastLength.TRUNCATE:
+            return prev_fast_length(self.fft_size)
+        return self.fft_size
+
+    @property
+    def transform_size(self) -> int:
+        """Length of each FFT: ``segment_size``, zero-padded under ``FastLength.PAD``.
+
+        The spectrum has ``transform_size // 2 + 1`` frequency bins.
+        """
+        if self.fft_fast_length == FastLength.PAD:
+            return next_fast_length(self.segment_size)
+        return self.segment_size
+
+    @property
+    def welch_hop(self) -> int:
+        """Samples between the starts of consecutive Welch segments (≥ 1)."""
+        return max(1, round(self.segment_size * (1.0 - self.welch_overlap)))
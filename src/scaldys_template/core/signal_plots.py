@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""Headless PNG rendering of the analysis plots.
+
+``plot_jobs`` describes the time-domain, spectrum, and phase plots of a
+result as picklable ``PlotJob`` values.  A ``PlotRenderer`` renders them with
+the Agg backend, either in the calling process or on a small process pool.
+The pool is started (and matplotlib imported in it) when the renderer is
+created, so that start-up cost overlaps the analysis, and the rendering
+itself overlaps whatever the caller does after :meth:`PlotRenderer.submit`::
+
+    with PlotRenderer(workers=3) as renderer:
+        result = run_analysis(...)
+        renderer.submit(plot_jobs(signal_data, fft_result, params, out))
+        write_results(...)  # runs while the figures render
+        paths = renderer.wait()
+
+Figures are built on ``matplotlib.figure.Figure`` rather than ``pyplot``, so
+no global figure state is shared and every job is independent.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+import numpy as np
+
+from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.core.signal_engine import FFTResult, SignalData, init_pool_worker
+from scaldys_template.core.signal_model import FFTMode, SignalParameters
+
+__all__ = [
+    "PLOT_DPI",
+    "PlotJob",
+    "PlotLine",
+    "PlotRenderer",
+    "default_plot_workers",
+    "plot_jobs",
+    "render_plot",
+]
+
+logger = logging.getLogger(PACKAGE_NAME)
+
+PLOT_DPI = 150
+
+# Upper bound on the points drawn for the time-domain plot.
+_TIME_DOMAIN_POINTS = 4000
+
+
+class PlotLine(NamedTuple):
+    """One line of a plot: *x* and *y* values plus ``Axes.plot`` keyword arguments."""
+
+    x: np.ndarray
+    y: np.ndarray
+    style: dict[str, Any]
+
+
+class PlotJob(NamedTuple):
+    """A line plot to render to the PNG file *path*."""
+
+    path: Path
+    title: str
+    xlabel: str
+    ylabel: str
+    lines: tuple[PlotLine, ...]
+    zero_line: bool = False
+
+
+def default_plot_workers() -> int:
+    """Return the default renderer pool size: one process per plot, at most one per CPU."""
+    return min(3, os.cpu_count() or 1)
+
+
+def plot_jobs(
+    signal_data: SignalData, fft_result: FFTResult, params: SignalParameters, output_dir: Path
+) -> list[PlotJob]:
+    """Return the time-domain, spectrum, and phase plots of a result.
+
+    The time domain is decimated to at most 4000 points, which keeps both the
+    rendering and the data sent to a worker process small.
+    """
+    step = max(1, len(signal_data.time) // _TIME_DOMAIN_POINTS)
+    t = np.asarray(signal_data.time[::step])
+    time_lines = [PlotLine(t, np.asarray(signal_data.composite[::step]), _style(0.8, "Composite"))]
+    if signal_data.noise.any():
+        time_lines.append(
+            PlotLine(
+                t,
+                np.asarray(signal_data.signal[::step]),
+                _style(0.6, "Signal", linestyle="--", alpha=0.7),
+            )
+        )
+    frequencies = np.asarray(fft_result.frequencies)
+    mode = " Welch" if params.fft_mode == FFTMode.WELCH else ""
+    return [
+        PlotJob(
+            output_dir / "time_domain.png",
+            f"{params.signal_type} {params.frequency:.1f} Hz — Time Domain",
+            "Time (s)",
+            "Amplitude",
+            tuple(time_lines),
+        ),
+        PlotJob(
+            output_dir / "spectrum.png",
+            f"FFT Spectrum — {params.transform_size}-pt {params.fft_window} window{mode}",
+            "Frequency (Hz)",
+            "Magnitude (dB)",
+            (PlotLine(frequencies, np.asarray(fft_result.magnitude_db), _style(0.8)),),
+        ),
+        PlotJob(
+            output_dir / "phase.png",
+            "FFT Phase",
+            "Frequency (Hz)",
+            "Phase (°)",
+            (PlotLine(frequencies, np.asarray(fft_result.phase_deg), _style(0.6, alpha=0.8)),),
+            zero_line=True,
+        ),
+    ]
+
+
+def _style(linewidth: float, label: str | None = None, **style: Any) -> dict[str, Any]:
+    if label is not None:
+        style["label"] = label
+    return {"linewidth": linewidth, **style}
+
+
+def render_plot(job: PlotJob) -> Path:
+    """Render *job* with the Agg backend and return the PNG path."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 4))
+    ax = fig.add_subplot()
+    for line in job.lines:
+        ax.plot(line.x, line.y, **line.style)
+    ax.set_xlabel(job.xlabel)
+    ax.set_ylabel(job.ylabel)
+    ax.set_title(job.title)
+    if job.zero_line:
+        ax.axhline(0, color="grey", linewidth=0.5, linestyle="--")
+    if any("label" in line.style for line in job.lines):
+        ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.4)
+    fig.tight_layout()
+    fig.savefig(job.path, dpi=PLOT_DPI)
+    return job.path
+
+
+class PlotRenderer:
+    """Render ``PlotJob`` values, in the background when *workers* > 1.
+
+    With more than one worker, a process pool is started right away and
+    :meth:`submit` hands the jobs to it; :meth:`wait` collects the results.
+    With one worker, :meth:`wait` renders the jobs in the calling process.
+
+    Parameters
+    ----------
+    workers:
+        Number of worker processes.
+
+    Raises
+    ------
+    ValueError
+        If *workers* < 1.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        if workers < 1:
+            raise ValueError("workers must be ≥ 1.")
+        self.workers = workers
+        self._jobs: list[PlotJob] = []
+        self._futures: list[Future[Path]] = []
+        self._executor: ProcessPoolExecutor | None = None
+        if workers > 1:
+            # Spawned, not forked, for the same reason as the sweep pool: the
+            # CLI runs logging threads, and forking them can deadlock.
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_pool_worker,
+            )
+            # One warm-up task per worker starts every process now.
+            for _ in range(workers):
+                self._executor.submit(_warm_up)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def submit(self, jobs: Sequence[PlotJob]) -> None:
+        """Queue *jobs* for rendering; on a pool, rendering starts immediately."""
+        self._jobs.extend(jobs)
+        if self._executor is not None:
+            self._futures.extend(self._executor.submit(render_plot, job) for job in jobs)
+
+    def wait(self) -> list[Path]:
+        """Block until every submitted plot is rendered; return the PNG paths in order.
+
+        Raises
+        ------
+        Exception
+            Whatever a rendering job raised.
+        """
+        try:
+            if self._executor is None:
+                return [render_plot(job) for job in self._jobs]
+            return [future.result() for future in self._futures]
+        finally:
+            self._jobs, self._futures = [], []
+
+    def close(self) -> None:
+        """Cancel outstanding jobs and shut the pool down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def _warm_up() -> None:
+    """Worker task: import the rendering code before the first job arrives."""
+    for module in ("matplotlib.figure", "matplotlib.backends.backend_agg"):
+        importlib.import_module(module)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""Staged compute / export pipeline with per-stage timing.
+
+A ``StagePipeline`` runs export stages on a small writer thread pool as soon
+as their inputs exist, while the caller keeps computing.  Stages may name
+earlier stages they must follow; every stage, foreground or background, is
+timed and logged::
+
+    with StagePipeline() as pipeline:
+        with pipeline.stage("signal"):
+            signal_data = generate_signal(params)
+        pipeline.submit("time_domain", write_time_domain, signal_data)
+        with pipeline.stage("spectrum"):
+            fft_result = compute_fft(signal_data, params)
+        pipeline.submit("plots", render, signal_data, fft_result, after=("time_domain",))
+        outputs = pipeline.wait()
+    for timing in pipeline.timings:
+        print(timing.name, timing.seconds)
+
+NumPy's FFT and array kernels and the file-system calls release the GIL, so
+writer threads overlap with the engine; Python-level CSV formatting does
+not, so for CSV output the overlap is limited to the I/O.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Self
+
+from scaldys_template.__about__ import PACKAGE_NAME
+
+__all__ = [
+    "DEFAULT_WRITER_THREADS",
+    "StagePipeline",
+    "StageTiming",
+]
+
+logger = logging.getLogger(PACKAGE_NAME)
+
+# Enough for the time-domain, frequency-domain, and plot stages at once.
+DEFAULT_WRITER_THREADS = 3
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Wall-clock time of one pipeline stage."""
+
+    name: str
+    seconds: float
+    background: bool  # ran on a writer thread
+
+
+class StagePipeline:
+    """Thread pool of named stages with ordering constraints and timing.
+
+    Stages run in submission order as threads become free.  A stage listed
+    in *after* must have been submitted earlier, which (with the pool's
+    first-in, first-out queue) guarantees that it is already running or done
+    when the dependent stage starts waiting for it, so waiting cannot
+    deadlock the pool.
+
+    Parameters
+    ----------
+    workers:
+        Number of writer threads.
+
+    Raises
+    ------
+    ValueError
+        If *workers* < 1.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WRITER_THREADS) -> None:
+        if workers < 1:
+            raise ValueError("workers must be ≥ 1.")
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="writer")
+        self._futures: dict[str, Future[Any]] = {}
+        self._timings: list[StageTiming] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def timings(self) -> list[StageTiming]:
+        """Timings of the finished stages, in completion order."""
+        with self._lock:
+            return list(self._timings)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the body of the ``with`` block as foreground stage *name*."""
+        start = time.perf_counter()
+        yield
+        self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the time of a stage the caller ran in the foreground."""
+        self._add_timing(StageTiming(name, seconds, background=False))
+
+    def submit(
+        self, name: str, fn: Callable[..., Any], *args: Any, after: Sequence[str] = ()
+    ) -> Future[Any]:
+        """Run ``fn(*args)`` as stage *name* once the stages in *after* have finished.
+
+        Raises
+        ------
+        ValueError
+            If *name* was already submitted, or a stage in *after* was not.
+        """
+        if name in self._futures:
+            raise ValueError(f"Stage {name!r} was already submitted.")
+        unknown = [dependency for dependency in after if dependency not in self._futures]
+        if unknown:
+            raise ValueError(f"Stage {name!r} follows unknown stages {unknown}.")
+        dependencies = [self._futures[dependency] for dependency in after]
+        future = self._executor.submit(self._run, name, fn, args, dependencies)
+        self._futures[name] = future
+        return future
+
+    def wait(self) -> dict[str, Any]:
+        """Block until every submitted stage has finished; return their results by name.
+
+        Raises
+        ------
+        Exception
+            The exception of the first failed stage, in submission order.
+        """
+        return {name: future.result() for name, future in self._futures.items()}
+
+    def close(self) -> None:
+        """Cancel stages that have not started and wait for the running ones."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(
+        self, name: str, fn: Callable[..., Any], args: tuple[Any, ...], dependencies: list[Future]
+    ) -> Any:
+        for dependency in dependencies:
+            dependency.result()  # a failed dependency fails this stage too
+        start = time.perf_counter()
+        result = fn(*args)
+        self._add_timing(StageTiming(name, time.perf_counter() - start, background=True))
+        return result
+
+    def _add_timing(self, timing: StageTiming) -> None:
+        with self._lock:
+            self._timings.append(timing)
+        logger.info(
+            "Stage finished",
+            extra={
+                "stage": timing.name,
+                "seconds": round(timing.seconds, 6),
+                "background": timing.background,
+            },
+        )
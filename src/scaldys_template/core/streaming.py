@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+"""Sliding-window analysis of live sample streams.
+
+A ``StreamingAnalyzer`` keeps the latest ``params.segment_size`` samples of a
+feed in a ring buffer and emits a ``StreamingUpdate`` (spectrum plus
+metrics) every hop::
+
+    analyzer = StreamingAnalyzer(params, hop=1024)
+    for update in analyzer.feed(read_blocks(device)):
+        print(update.time, update.metrics.rms, update.metrics.peak_freq)
+
+Every update follows the ``FFTMode.SINGLE`` conventions of
+``signal_engine.compute_fft`` and ``compute_metrics``, whose window,
+spectrum, and metrics helpers it reuses.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from scaldys_template.core.signal_engine import (
+    DEFAULT_MAX_HARMONIC,
+    FFTResult,
+    SignalMetrics,
+    get_window,
+    peak_abs,
+    rfft_spectrum,
+    spectral_metrics,
+    sum_squares,
+)
+from scaldys_template.core.signal_model import SignalParameters, WindowType
+
+__all__ = [
+    "StreamingAnalyzer",
+    "StreamingUpdate",
+]
+
+# Samples per block whose absolute peak ``StreamingAnalyzer`` keeps, so a
+# write only rescans the blocks it touches rather than the whole window.
+_STREAM_PEAK_BLOCK = 256
+
+
+@dataclass
+class StreamingUpdate:
+    """Spectrum and metrics of the latest window, emitted by ``StreamingAnalyzer``."""
+
+    n_samples: int  # stream samples consumed when the update was emitted
+    time: float  # seconds — n_samples / sampling_rate, the end of the window
+    fft_result: FFTResult
+    metrics: SignalMetrics
+
+
+class StreamingAnalyzer:
+    """Sliding-window spectrum and metrics of a live sample stream.
+
+    Sample blocks of any length (from a generator, a socket, stdin, …) are
+    written into a preallocated ring buffer that holds the latest
+    ``params.segment_size`` samples.  Once the ring is full, and from then
+    on every *hop* samples, a ``StreamingUpdate`` is emitted for the
+    buffered window::
+
+        analyzer = StreamingAnalyzer(params)
+        for update in analyzer.feed(chunk.composite for chunk in iter_signal_chunks(params)):
+            print(update.time, update.metrics.rms, update.metrics.peak_freq)
+
+    The spectrum follows the ``FFTMode.SINGLE`` conventions of
+    ``compute_fft`` — same window, zero padding to ``params.transform_size``,
+    and normalisation — so a window holding the head of a signal gives the
+    same ``FFTResult``.  RMS and peak are not recomputed from the window:
+    the sum of squares is updated with the samples entering and leaving the
+    ring (and re-anchored by an exact sum once per wrap, which bounds
+    round-off drift), and the peak is the maximum of per-block peaks of
+    which only the blocks just written are rescanned.  A live feed has no
+    separate signal and noise, so ``snr_db`` is always ``None``.
+
+    Memory is constant, and each update costs one windowed rFFT whatever
+    the block sizes, which bounds the latency between a sample's arrival
+    and the update covering it.
+
+    Parameters
+    ----------
+    params:
+        Provides the FFT lengths, ``fft_window``, ``sampling_rate``, and the
+        sample ``dtype``.  ``fft_mode`` is ignored: every update is the
+        spectrum of one window.
+    hop:
+        Samples between updates; defaults to the Welch hop,
+        ``segment_size · (1 − welch_overlap)``.
+    max_harmonic:
+        Highest harmonic included in the THD, as for ``compute_metrics``.
+    """
+
+    def __init__(
+        self,
+        params: SignalParameters,
+        *,
+        hop: int | None = None,
+        max_harmonic: int = DEFAULT_MAX_HARMONIC,
+    ) -> None:
+        if hop is None:
+            hop = params.welch_hop
+        if hop < 1:
+            raise ValueError("hop must be ≥ 1.")
+        if max_harmonic < 2:
+            raise ValueError("max_harmonic must be ≥ 2.")
+        self._params = params
+        self._hop = int(hop)
+        self._max_harmonic = max_harmonic
+
+        size = params.segment_size
+        dtype = np.dtype(params.dtype)
+        n_blocks = -(-size // _STREAM_PEAK_BLOCK)
+        # The ring is padded with zeros to whole peak blocks; the padding is
+        # never written and never enters the window.
+        self._ring = np.zeros(n_blocks * _STREAM_PEAK_BLOCK, dtype=dtype)
+        self._block_peaks = np.zeros(n_blocks)
+        self._frame = np.empty(size, dtype=dtype)
+        self._window = (
+            None
+            if params.fft_window == WindowType.RECTANGULAR
+            else get_window(params.fft_window, size, dtype).values
+        )
+        # Shared by every update, so it is made read-only.
+        self._frequencies = np.fft.rfftfreq(params.transform_size, d=1.0 / params.sampling_rate)
+        self._frequencies.flags.writeable = False
+        self.reset()
+
+    @property
+    def hop(self) -> int:
+        """Number of samples between updates."""
+        return self._hop
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples consumed so far."""
+        return self._n_samples
+
+    def reset(self) -> None:
+        """Empty the ring buffer and start over as if no sample had been seen."""
+        self._ring[:] = 0
+        self._block_peaks[:] = 0.0
+        self._pos = 0
+        self._n_samples = 0
+        self._sum_sq = 0.0
+        self._until_update = self._params.segment_size
+
+    def push(self, block: npt.ArrayLike) -> list[StreamingUpdate]:
+        """Consume one block of samples and return the updates it completes.
+
+        A block shorter than the hop may complete none; a block spanning
+        several hops yields one update per hop, each for its own window.
+
+        Raises
+        ------
+        ValueError
+            If *block* is not one-dimensional.
+        """
+        return list(self._consume(block))
+
+    def feed(self, blocks: Iterable[npt.ArrayLike]) -> Iterator[StreamingUpdate]:
+        """Consume *blocks* lazily, yielding each update as soon as it is complete."""
+        for block in blocks:
+            yield from self._consume(block)
+
+    def _consume(self, block: npt.ArrayLike) -> Iterator[StreamingUpdate]:
+        samples = np.asarray(block, dtype=self._ring.dtype)
+        if samples.ndim != 1:
+            raise ValueError("Sample blocks must be one-dimensional.")
+        size = self._params.segment_size
+        start = 0
+        while start < len(samples):
+            # Stop at the next update or the end of the ring, whichever is first.
+            n = min(len(samples) - start, self._until_update, size - self._pos)
+            self._write(samples[start : start + n])
+            start += n
+            self._until_update -= n
+            if self._until_update == 0:
+                self._until_update = self._hop
+                yield self._update()
+
+    def _write(self, samples: np.ndarray) -> None:
+        """Overwrite the oldest samples with *samples*, which must not wrap."""
+        pos, n = self._pos, len(samples)
+        slot = self._ring[pos : pos + n]
+        self._sum_sq += float(sum_squares(samples)) - float(sum_squares(slot))
+        slot[...] = samples
+
+        first, last = pos // _STREAM_PEAK_BLOCK, (pos + n - 1) // _STREAM_PEAK_BLOCK + 1
+        touched = self._ring[first * _STREAM_PEAK_BLOCK : last * _STREAM_PEAK_BLOCK]
+        self._block_peaks[first:last] = peak_abs(touched.reshape(-1, _STREAM_PEAK_BLOCK))
+
+        self._n_samples += n
+        self._pos = pos + n
+        size = self._params.segment_size
+        if self._pos == size:
+            self._pos = 0
+            self._sum_sq = float(sum_squares(self._ring[:size]))
+
+    def _update(self) -> StreamingUpdate:
+        size = self._params.segment_size
+        pos = self._pos
+        # Unroll the ring, oldest sample first, into the preallocated frame.
+        frame = self._frame
+        frame[: size - pos] = self._ring[pos:size]
+        frame[size - pos :] = self._ring[:pos]
+        if self._window is not None:
+            frame *= self._window
+        magnitude, magnitude_db, phase_deg = rfft_spectrum(frame, self._params.transform_size)
+        thd_db, peak_freq = spectral_metrics(
+            magnitude[np.newaxis], self._frequencies[np.newaxis], self._max_harmonic
+        )
+
+        rms = float(np.sqrt(max(self._sum_sq, 0.0) / size))
+        peak = float(self._block_peaks.max())
+        return StreamingUpdate(
+            n_samples=self._n_samples,
+            time=self._n_samples / self._params.sampling_rate,
+            fft_result=FFTResult(
+                frequencies=self._frequencies,
+                magnitude_db=magnitude_db,
+                phase_deg=phase_deg,
+                magnitude=magnitude,
+            ),
+            metrics=SignalMetrics(
+                rms=rms,
+                peak=peak,
+                crest_factor=peak / rms if rms > 0.0 else 0.0,
+                snr_db=None,
+                thd_db=float(thd_db[0]),
+                peak_freq=float(peak_freq[0]),
+            ),
+        )
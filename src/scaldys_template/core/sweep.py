@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+
+"""Parallel parameter sweeps over a process pool.
+
+A ``SweepSpec`` is a base ``SignalParameters`` set plus one or more axes of
+values to vary.  Its points are the Cartesian product of the axes (the last
+axis varies fastest), expanded lazily and validated exactly like a parameter
+file::
+
+    spec = SweepSpec(
+        base=SignalParameters(noise_type="gaussian", seed=1),
+        axes={"frequency": [100, 1000], "snr_db": [10, 20, 40]},
+    )
+    for point in run_sweep(spec, workers=4):
+        print(point.index, point.values, point.metrics.thd_db)
+
+``run_sweep`` hands the points to a ``ProcessPoolExecutor`` in chunks, so
+per-task overhead is paid once per chunk and each chunk is analysed with
+``measure_batch``, which skips the spectra a sweep never reads.  Results are
+yielded as soon as their chunk completes, which is generally not point order.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+from collections.abc import Generator, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.core.signal_engine import (
+    DEFAULT_MAX_HARMONIC,
+    MetricsAccumulator,
+    SignalMetrics,
+    SignalWorkspace,
+    init_pool_worker,
+    iter_signal_chunks,
+    measure_batch,
+)
+from scaldys_template.core.signal_model import SignalParameters
+
+__all__ = [
+    "SweepPoint",
+    "SweepSpec",
+    "load_sweep_spec",
+    "run_sweep",
+]
+
+logger = logging.getLogger(PACKAGE_NAME)
+
+# Upper bound on the points per task: large enough to amortise pickling and
+# scheduling, small enough to keep every worker busy until the end.
+_MAX_CHUNK_SIZE = 64
+
+# Chunks submitted ahead of the results consumed, per worker.
+_CHUNKS_IN_FLIGHT = 2
+
+
+class SweepSpec(BaseModel):
+    """Grid of parameter sets to analyse.
+
+    Fields
+    ------
+    base:
+        Parameters shared by every point.
+    axes:
+        ``SignalParameters`` field name → values to sweep, in nesting order.
+        Every field may be swept; values are validated per point.  If
+        ``base.seed`` is set, every point uses that seed.
+    """
+
+    base: SignalParameters = Field(default_factory=SignalParameters)
+    axes: dict[str, list[Any]]
+
+    model_config = {"extra": "forbid"}
+
+    @field_validator("axes")
+    @classmethod
+    def check_axes(cls, v: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        if not v:
+            raise ValueError("At least one sweep axis is required.")
+        for name, values in v.items():
+            if name not in SignalParameters.model_fields:
+                raise ValueError(f"Unknown sweep parameter '{name}'.")
+            if not values:
+                raise ValueError(f"Sweep axis '{name}' must have at least one value.")
+        return v
+
+    @property
+    def n_points(self) -> int:
+        """Number of points in the grid."""
+        return math.prod(len(values) for values in self.axes.values())
+
+    def points(self) -> Iterator[SignalParameters]:
+        """Yield the validated parameter set of every point, in grid order.
+
+        Raises
+        ------
+        ValueError
+            If a point is not a valid ``SignalParameters`` set; the message
+            names the point and its axis values.
+        """
+        base = self.base.model_dump()
+        names = list(self.axes)
+        for index, values in enumerate(itertools.product(*self.axes.values())):
+            assignment = dict(zip(names, values))
+            try:
+                yield SignalParameters.model_validate({**base, **assignment})
+            except ValidationError as exc:
+                raise ValueError(f"Invalid sweep point {index} {assignment}:\n{exc}") from exc
+
+
+@dataclass
+class SweepPoint:
+    """Outcome of one sweep point."""
+
+    index: int  # position in grid order
+    values: dict[str, Any]  # axis name → value (JSON form) at this point
+    metrics: SignalMetrics
+
+
+def load_sweep_spec(path: Path) -> SweepSpec:
+    """Deserialize a ``SweepSpec`` from the JSON file at *path*.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read.
+    pydantic.ValidationError
+        If the file content fails validation.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        logger.error("Failed to load sweep spec from %s: %s", path, exc)
+        raise
+    spec = SweepSpec.model_validate(json.loads(text))
+    logger.info("Sweep spec loaded from %s", path)
+    return spec
+
+
+def run_sweep(
+    spec: SweepSpec,
+    *,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    max_harmonic: int = DEFAULT_MAX_HARMONIC,
+) -> Iterator[SweepPoint]:
+    """Analyse every point of *spec* and yield the results as they complete.
+
+    Parameters
+    ----------
+    spec:
+        The sweep to run.
+    workers:
+        Number of worker processes; defaults to the CPU count.  With ``1``
+        the points are analysed in the calling process.
+    chunk_size:
+        Points per task.  Defaults to an even split over ``4 × workers``
+        tasks, capped at 64 points.
+    max_harmonic:
+        Highest harmonic included in the THD, as for ``compute_metrics``.
+
+    Yields
+    ------
+    SweepPoint
+        One per grid point, in completion order.  Closing the generator
+        early cancels the points not yet started.
+
+    Raises
+    ------
+    ValueError
+        If *workers* or *chunk_size* is < 1, or a point is invalid.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be ≥ 1.")
+    if chunk_size is None:
+        chunk_size = min(_MAX_CHUNK_SIZE, max(1, math.ceil(spec.n_points / (4 * workers))))
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be ≥ 1.")
+
+    chunks = itertools.batched(enumerate(spec.points()), chunk_size)
+    names = list(spec.axes)
+    logger.info(
+        "Starting sweep",
+        extra={"n_points": spec.n_points, "workers": workers, "chunk_size": chunk_size},
+    )
+
+    completed = (
+        _run_serial(chunks, max_harmonic)
+        if workers == 1
+        else _run_pool(chunks, workers, max_harmonic)
+    )
+    with contextlib.closing(completed):
+        for chunk, metrics in completed:
+            for (index, params), point_metrics in zip(chunk, metrics):
+                values = params.model_dump(mode="json", include=set(names))
+                yield SweepPoint(index, {name: values[name] for name in names}, point_metrics)
+
+    logger.info("Sweep finished", extra={"n_points": spec.n_points})
+
+
+# A chunk of (grid index, parameter set) pairs, and its per-point metrics.
+_Chunk = tuple[tuple[int, SignalParameters], ...]
+_ChunkResult = tuple[_Chunk, list[SignalMetrics]]
+
+
+def _run_serial(chunks: Iterator[_Chunk], max_harmonic: int) -> Generator[_ChunkResult]:
+    """Analyse *chunks* in the calling process."""
+    for chunk in chunks:
+        yield chunk, _analyze_chunk([params for _, params in chunk], max_harmonic)
+
+
+def _run_pool(chunks: Iterator[_Chunk], workers: int, max_harmonic: int) -> Generator[_ChunkResult]:
+    """Analyse *chunks* on a process pool, yielding each as it completes."""
+    # Workers are spawned rather than forked: the CLI and GUI run logging and
+    # worker threads, and forking a multi-threaded process can deadlock.
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_pool_worker,
+    )
+    try:
+        pending: dict[Future[list[SignalMetrics]], _Chunk] = {}
+        exhausted = False
+        while True:
+            # Keep a bounded number of chunks queued so the lazy grid is never
+            # materialised and results are not held back behind submission.
+            while not exhausted and len(pending) < _CHUNKS_IN_FLIGHT * workers:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                params_list = [params for _, params in chunk]
+                pending[executor.submit(_analyze_chunk, params_list, max_harmonic)] = chunk
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _analyze_chunk(params_list: list[SignalParameters], max_harmonic: int) -> list[SignalMetrics]:
+    """Worker task: metrics for each parameter set of one chunk, in order."""
+    in_memory = [params for params in params_list if not params.streaming]
+    batch = iter(measure_batch(in_memory, max_harmonic=max_harmonic))
+
+    metrics: list[SignalMetrics] = []
+    workspace: SignalWorkspace | None = None
+    for params in params_list:
+        if not params.streaming:
+            metrics.append(next(batch))
+            continue
+        workspace = workspace or SignalWorkspace()
+        accumulator = MetricsAccumulator(params)
+        for chunk in iter_signal_chunks(params, workspace=workspace):
+            accumulator.update(chunk)
+        metrics.append(accumulator.result(max_harmonic=max_harmonic))
+    return metrics
@@ -28,14 +28,8 @@ import ttkbootstrap as tb
 from ttkbootstrap.constants import BOTH, LEFT, X, YES  # BOTH, BOTTOM, LEFT, RIGHT, TOP, X, YES
 
 from scaldys_template.__about__ import PACKAGE_NAME
-from scaldys_template.core.signal_engine import (
-    FFTResult,
-    SignalData,
-    SignalMetrics,
-    compute_fft,
-    compute_metrics,
-    generate_signal,
-)
+from scaldys_template.core.analysis_graph import AnalysisGraph, GraphRun, Stage
+from scaldys_template.core.signal_engine import SignalWorkspace
 from scaldys_template.core.signal_model import SignalParameters
 from scaldys_template.tk.ui.analyzer.plot_frame import PlotFrame
 from scaldys_template.tk.ui.analyzer.results_table_frame import ResultsTableFrame
@@ -46,7 +40,7 @@ __all__ = ["AnalyzerFrame"]
 logger = logging.getLogger(PACKAGE_NAME)
 
 # Result queue item types
-_ResultOk = tuple[Literal["ok"], SignalData, FFTResult, SignalMetrics, SignalParameters]
+_ResultOk = tuple[Literal["ok"], GraphRun, SignalParameters]
 _ResultErr = tuple[Literal["error"], str]
 
 
@@ -76,6 +70,13 @@ class AnalyzerFrame(tb.Frame):
         self._result_queue: queue.Queue[_ResultOk | _ResultErr] = queue.Queue()
         self._is_running = False
         self._last_params: SignalParameters | None = None
+        # Only the stages affected by a parameter change are rerun; e.g. a new
+        # FFT window reuses the generated signal.
+        self._graph = AnalysisGraph()
+        # Regenerated signals alternate between two workspaces so a new run
+        # never overwrites the arrays of the result currently on display.
+        self._workspaces = (SignalWorkspace(), SignalWorkspace())
+        self._next_workspace = 0
         self._build()
 
     # ------------------------------------------------------------------
@@ -173,13 +174,16 @@ class AnalyzerFrame(tb.Frame):
         self._progress.start(10)
         logger.info("Analysis started", extra={"signal_type": params.signal_type})
 
+        workspace = self._workspaces[self._next_workspace]
+
         def _worker() -> None:
             try:
-                sd = generate_signal(params)
-                fft = compute_fft(sd, params)
-                mtr = compute_metrics(sd, fft)
-                self._result_queue.put(("ok", sd, fft, mtr, params))
+                run = self._graph.run(params, workspace=workspace)
+                self._result_queue.put(("ok", run, params))
             except Exception as exc:  # noqa: BLE001
+                # A half-finished run may have cached a signal in the workspace
+                # that is not on display; start from scratch next time.
+                self._graph.invalidate()
                 self._result_queue.put(("error", str(exc)))
 
         threading.Thread(target=_worker, daemon=True, name="signal-engine").start()
@@ -197,10 +201,16 @@ class AnalyzerFrame(tb.Frame):
         self._run_btn.configure(state="normal")
 
         if item[0] == "ok":
-            _, sd, fft, mtr, params = item  # type: ignore[misc]
-            self._table_frame.update_results(sd, fft, mtr)
-            self._plot_frame.update_plots(sd, fft, params)
-            logger.info("Analysis complete")
+            _, run, params = item  # type: ignore[misc]
+            if Stage.SIGNAL in run.recomputed:
+                self._next_workspace ^= 1
+            result = run.result
+            self._table_frame.update_results(result.signal_data, result.fft_result, result.metrics)
+            self._plot_frame.update_plots(result.signal_data, result.fft_result, params)
+            logger.info(
+                "Analysis complete",
+                extra={"skipped_stages": [str(stage) for stage in run.skipped]},
+            )
         else:
             msg = item[1]  # type: ignore[index]
             logger.error("Analysis failed: %s", msg)
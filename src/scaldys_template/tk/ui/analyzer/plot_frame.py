@@ -232,7 +232,7 @@ class PlotFrame(ttk.LabelFrame):
         ax.set_xlabel("Frequency (Hz)", fontsize=8)
         ax.set_ylabel("Magnitude (dB)", fontsize=8)
         ax.set_title(
-            f"FFT Magnitude — {params.fft_size}-pt {params.fft_window.capitalize()} window",
+            f"FFT Magnitude — {params.transform_size}-pt {params.fft_window.capitalize()} window",
             fontsize=9,
         )
         ax.set_xlim(left=0, right=fft.frequencies[-1] if len(fft.frequencies) else 1)
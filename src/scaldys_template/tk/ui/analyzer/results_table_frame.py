@@ -25,6 +25,12 @@ from ttkbootstrap.constants import BOTH, CENTER, HEADINGS, X, YES
 
 from scaldys_template.__about__ import PACKAGE_NAME
 from scaldys_template.core.signal_engine import FFTResult, SignalData, SignalMetrics
+from scaldys_template.core.signal_export import (
+    FREQUENCY_DOMAIN_COLUMNS,
+    TIME_DOMAIN_COLUMNS,
+    write_frequency_domain_rows,
+    write_time_domain_rows,
+)
 
 __all__ = ["ResultsTableFrame"]
 
@@ -189,6 +195,7 @@ class ResultsTableFrame(ttk.LabelFrame):
         n = len(sd.time)
         step = max(1, n // _MAX_DISPLAY_ROWS)
         indices = range(0, n, step)
+        noise = sd.noise_samples()
 
         for i in indices:
             tree.insert(
@@ -197,7 +204,7 @@ class ResultsTableFrame(ttk.LabelFrame):
                 values=(
                     f"{sd.time[i]:.6f}",
                     f"{sd.signal[i]:.6f}",
-                    f"{sd.noise[i]:.6f}",
+                    f"{noise[i]:.6f}",
                     f"{sd.composite[i]:.6f}",
                 ),
             )
@@ -236,24 +243,13 @@ class ResultsTableFrame(ttk.LabelFrame):
                 writer = csv.writer(f)
 
                 writer.writerow(["# Time Domain"])
-                writer.writerow(["time_s", "signal", "noise", "composite"])
-                sd = self._signal_data
-                for i in range(len(sd.time)):
-                    writer.writerow(
-                        [
-                            f"{sd.time[i]:.8f}",
-                            f"{sd.signal[i]:.8f}",
-                            f"{sd.noise[i]:.8f}",
-                            f"{sd.composite[i]:.8f}",
-                        ]
-                    )
+                writer.writerow(TIME_DOMAIN_COLUMNS)
+                write_time_domain_rows(f, [self._signal_data])
 
                 writer.writerow([])
                 writer.writerow(["# Frequency Domain"])
-                writer.writerow(["frequency_hz", "magnitude_db", "phase_deg"])
-                fft = self._fft_result
-                for freq, mag, phase in zip(fft.frequencies, fft.magnitude_db, fft.phase_deg):
-                    writer.writerow([f"{freq:.4f}", f"{mag:.4f}", f"{phase:.4f}"])
+                writer.writerow(FREQUENCY_DOMAIN_COLUMNS)
+                write_frequency_domain_rows(f, self._fft_result)
 
             logger.info("Results exported to %s", path)
         except OSError as exc:
@@ -7,13 +7,17 @@ input widgets inside a scrollable ttkbootstrap ``LabelFrame``.  It provides:
 - ``set_parameters(params)`` — populate all widgets from a model instance
 - Live per-field validation on focus-out (red border + tooltip message)
 - Automatic enable/disable of the SNR field based on noise type
+
+Fields without a widget (e.g. the Welch settings) are carried over unchanged
+from the last ``set_parameters()`` call, so parameters loaded from a file
+keep them when the user edits and re-runs.
 """
 
 from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Callable
+from typing import Any, Callable, Literal
 
 import ttkbootstrap as tb
 from ttkbootstrap.constants import (
@@ -44,6 +48,27 @@ _NOISE_TYPE_VALUES: list[NoiseType] = list(NoiseType)
 _WINDOW_TYPE_LABELS: list[str] = ["Rectangular", "Hanning", "Hamming", "Blackman"]
 _WINDOW_TYPE_VALUES: list[WindowType] = list(WindowType)
 
+# SignalParameters fields that have an input widget in this panel.
+_WIDGET_FIELDS: set[str] = {
+    "signal_type",
+    "frequency",
+    "amplitude",
+    "duration",
+    "sampling_rate",
+    "phase_deg",
+    "dc_offset",
+    "noise_type",
+    "snr_db",
+    "fft_window",
+    "fft_size",
+}
+
+
+def _parse_fft_size(raw: str) -> int | Literal["auto"]:
+    """Parse the FFT size entry: an integer, or ``"auto"``."""
+    raw = raw.strip().lower()
+    return "auto" if raw == "auto" else int(raw)
+
 
 class SignalParametersFrame(ttk.LabelFrame):
     """Parameter entry panel backed by ``SignalParameters``.
@@ -76,6 +101,8 @@ class SignalParametersFrame(ttk.LabelFrame):
         self._vars: dict[str, tk.Variable] = {}
         self._widgets: dict[str, Any] = {}
         self._error_labels: dict[str, tb.Label] = {}
+        # Values of the fields that have no widget (see module docstring).
+        self._extra_fields: dict[str, Any] = {}
 
         self._build()
         self._bind_events()
@@ -256,6 +283,7 @@ class SignalParametersFrame(ttk.LabelFrame):
                 _WINDOW_TYPE_LABELS.index(self._vars["fft_window"].get())
             ]
             return SignalParameters(
+                **self._extra_fields,
                 signal_type=signal_type,
                 frequency=float(self._vars["frequency"].get()),
                 amplitude=float(self._vars["amplitude"].get()),
@@ -266,7 +294,7 @@ class SignalParametersFrame(ttk.LabelFrame):
                 noise_type=noise_type,
                 snr_db=float(self._vars["snr_db"].get()),
                 fft_window=fft_window,
-                fft_size=int(self._vars["fft_size"].get()),
+                fft_size=_parse_fft_size(self._vars["fft_size"].get()),
             )
         except (ValueError, IndexError, ValidationError):
             return None
@@ -277,9 +305,9 @@ class SignalParametersFrame(ttk.LabelFrame):
         widget = self._widgets[field]
         try:
             if field == "fft_size":
-                val = int(raw)
-                if (val & (val - 1)) != 0 or val < 2:
-                    raise ValueError("Must be a power of 2 and ≥ 2.")
+                val = _parse_fft_size(raw)
+                if isinstance(val, int) and val < 2:
+                    raise ValueError("Must be ≥ 2 or 'auto'.")
             else:
                 float(raw)
             widget.configure(bootstyle="")
@@ -329,14 +357,14 @@ class SignalParametersFrame(ttk.LabelFrame):
                 "noise_type": noise_type,
                 "snr_db": float(self._vars["snr_db"].get()),
                 "fft_window": fft_window,
-                "fft_size": int(self._vars["fft_size"].get()),
+                "fft_size": _parse_fft_size(self._vars["fft_size"].get()),
             }
         except (ValueError, IndexError) as exc:
             self._status_var.set(f"Input error: {exc}")
             return None
 
         try:
-            params = SignalParameters(**raw)
+            params = SignalParameters(**self._extra_fields, **raw)
         except ValidationError as exc:
             # Show the first error message; highlight the offending widget if possible.
             first = exc.errors()[0]
@@ -358,6 +386,7 @@ class SignalParametersFrame(ttk.LabelFrame):
     def set_parameters(self, params: SignalParameters) -> None:
         """Populate all widgets from *params*."""
         self._clear_status()
+        self._extra_fields = params.model_dump(exclude=_WIDGET_FIELDS)
 
         idx = _SIGNAL_TYPE_VALUES.index(params.signal_type)
         self._vars["signal_type"].set(_SIGNAL_TYPE_LABELS[idx])
@@ -6,6 +6,8 @@ import pytest
 from typer.testing import CliRunner
 
 from scaldys_template.cli.cli import app
+from scaldys_template.core.result_cache import ResultCache
+from scaldys_template.core.signal_export import load_result
 from scaldys_template.core.signal_model import SignalParameters
 
 runner = CliRunner()
@@ -18,6 +20,7 @@ def _write_params(path: Path, **overrides) -> None:
 
 
 @pytest.mark.integration
+@pytest.mark.usefixtures("isolated_app_location")
 class TestAnalyzeCLI:
     def test_analyze_with_defaults_exits_zero(self, tmp_path: Path):
         out = tmp_path / "out"
@@ -40,6 +43,99 @@ class TestAnalyzeCLI:
         )
         assert result.exit_code == 0, result.output
 
+    def test_analyze_streaming_params_file(self, tmp_path: Path):
+        params_file = tmp_path / "params.json"
+        _write_params(params_file, duration=0.5, fft_size=1024, streaming=True)
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app, ["analyze", str(params_file), "--output", str(out), "--no-plots"]
+        )
+        assert result.exit_code == 0, result.output
+        with (out / "time_domain.csv").open(encoding="utf-8") as f:
+            n_lines = sum(1 for _ in f)
+        assert n_lines == int(0.5 * 44100.0) + 1
+
+    def test_analyze_welch_options(self, tmp_path: Path):
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app,
+            [
+                "analyze",
+                "--output",
+                str(out),
+                "--no-plots",
+                "--fft-mode",
+                "welch",
+                "--overlap",
+                "0.75",
+                "--average",
+                "median",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "welch" in result.output
+
+    @pytest.mark.parametrize(
+        ("options", "n_bins"),
+        [
+            (["--fft-size", "auto"], 4374 // 2 + 1),  # 4 410 samples at the defaults
+            (["--fft-size", "1009", "--fast-length", "pad"], 1024 // 2 + 1),
+            (["--fft-size", "1009", "--fast-length", "truncate"], 1000 // 2 + 1),
+        ],
+    )
+    def test_analyze_fft_size_options(self, tmp_path: Path, options: list[str], n_bins: int):
+        out = tmp_path / "out"
+        result = runner.invoke(app, ["analyze", "--output", str(out), "--no-plots", *options])
+        assert result.exit_code == 0, result.output
+        with (out / "frequency_domain.csv").open(encoding="utf-8") as f:
+            n_lines = sum(1 for _ in f)
+        assert n_lines == n_bins + 1
+
+    def test_analyze_invalid_fft_size_exits_nonzero(self, tmp_path: Path):
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app, ["analyze", "--output", str(out), "--no-plots", "--fft-size", "fast"]
+        )
+        assert result.exit_code != 0
+
+    def test_analyze_invalid_overlap_exits_nonzero(self, tmp_path: Path):
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app, ["analyze", "--output", str(out), "--no-plots", "--overlap", "1.5"]
+        )
+        assert result.exit_code != 0
+
+    def test_analyze_seed_reproduces_noise(self, tmp_path: Path):
+        params_file = tmp_path / "params.json"
+        _write_params(params_file, noise_type="gaussian", duration=0.05, fft_size=256)
+        outputs = []
+        for name in ("a", "b"):
+            out = tmp_path / name
+            result = runner.invoke(
+                app,
+                ["analyze", str(params_file), "--output", str(out), "--no-plots", "--seed", "7"],
+            )
+            assert result.exit_code == 0, result.output
+            outputs.append((out / "time_domain.csv").read_bytes())
+        assert outputs[0] == outputs[1]
+
+    def test_analyze_repeat_run_uses_cache(self, tmp_path: Path):
+        hits, outputs = [], []
+        for name in ("a", "b"):
+            out = tmp_path / name
+            result = runner.invoke(app, ["analyze", "--output", str(out), "--no-plots"])
+            assert result.exit_code == 0, result.output
+            hits.append("Cached result found" in result.output)
+            outputs.append([(out / f).read_bytes() for f in ("time_domain.csv", "metrics.csv")])
+        assert hits == [False, True]
+        assert outputs[0] == outputs[1]
+
+    def test_analyze_no_cache_stores_nothing(self, tmp_path: Path):
+        out = tmp_path / "out"
+        result = runner.invoke(app, ["analyze", "--output", str(out), "--no-plots", "--no-cache"])
+        assert result.exit_code == 0, result.output
+        assert ResultCache().stats().entries == 0
+
     def test_analyze_fails_without_force_on_existing_output(self, tmp_path: Path):
         out = tmp_path / "out"
         out.mkdir()
@@ -83,3 +179,69 @@ class TestAnalyzeCLI:
         out = tmp_path / "out"
         result = runner.invoke(app, ["analyze", str(bad_file), "--output", str(out), "--no-plots"])
         assert result.exit_code != 0
+
+    @pytest.mark.parametrize(
+        ("fmt", "files"),
+        [
+            ("npy", {"time_domain.npy", "frequency_domain.npy", "result.json"}),
+            ("npz", {"result.npz", "result.json"}),
+            ("jsonl", {"time_domain.jsonl", "frequency_domain.jsonl", "result.json"}),
+        ],
+    )
+    def test_analyze_format_option(self, tmp_path: Path, fmt, files):
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app, ["analyze", "--output", str(out), "--no-plots", "--format", fmt]
+        )
+        assert result.exit_code == 0, result.output
+        assert {p.name for p in out.iterdir()} == files
+
+    def test_analyze_streaming_binary_result_loads(self, tmp_path: Path):
+        params_file = tmp_path / "params.json"
+        _write_params(params_file, duration=0.5, fft_size=1024, streaming=True)
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app,
+            ["analyze", str(params_file), "--output", str(out), "--no-plots", "--format", "npz"],
+        )
+        assert result.exit_code == 0, result.output
+        params, saved = load_result(out)
+        assert params.streaming
+        assert len(saved.signal_data.composite) == saved.signal_data.time.n == 22050
+        assert saved.metrics.rms > 0.0
+
+    def test_analyze_invalid_format_exits_nonzero(self, tmp_path: Path):
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app, ["analyze", "--output", str(out), "--no-plots", "--format", "xls"]
+        )
+        assert result.exit_code != 0
+
+    def test_analyze_renders_plots_and_reports_timing(self, tmp_path: Path):
+        out = tmp_path / "out"
+        result = runner.invoke(app, ["analyze", "--output", str(out), "--plot-workers", "1"])
+        assert result.exit_code == 0, result.output
+        for name in ("time_domain.png", "spectrum.png", "phase.png"):
+            assert (out / name).stat().st_size > 0
+        for stage in ("Signal", "Write time domain", "Write metrics", "Render plots"):
+            assert stage in result.output
+        assert "Total time" in result.output
+
+    def test_analyze_invalid_plot_workers_exits_nonzero(self, tmp_path: Path):
+        out = tmp_path / "out"
+        result = runner.invoke(app, ["analyze", "--output", str(out), "--plot-workers", "0"])
+        assert result.exit_code != 0
+
+    @pytest.mark.parametrize("fmt", ["csv", "npz"])
+    def test_analyze_pipeline_matches_cached_run(self, tmp_path: Path, fmt):
+        outputs = []
+        for i in range(2):
+            out = tmp_path / f"out{i}"
+            result = runner.invoke(
+                app, ["analyze", "--output", str(out), "--no-plots", "--format", fmt]
+            )
+            assert result.exit_code == 0, result.output
+            assert "Cache lookup" in result.output
+            assert ("Store cache" in result.output) == (i == 0)  # second run is a cache hit
+            outputs.append({p.name: p.read_bytes() for p in out.iterdir()})
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,37 @@
+"""Integration tests for the ``cache`` CLI command group."""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from scaldys_template.cli.cli import app
+from scaldys_template.core.result_cache import ResultCache
+
+runner = CliRunner()
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("isolated_app_location")
+class TestCacheCLI:
+    def _analyze(self, out: Path) -> None:
+        result = runner.invoke(app, ["analyze", "--output", str(out), "--no-plots"])
+        assert result.exit_code == 0, result.output
+
+    def test_stats_reports_entries(self, tmp_path: Path):
+        self._analyze(tmp_path / "out")
+        result = runner.invoke(app, ["cache", "stats"])
+        assert result.exit_code == 0, result.output
+        assert "Entries:   1" in result.output
+
+    def test_bare_cache_shows_stats(self):
+        result = runner.invoke(app, ["cache"])
+        assert result.exit_code == 0, result.output
+        assert "Entries:   0" in result.output
+
+    def test_clear_removes_entries(self, tmp_path: Path):
+        self._analyze(tmp_path / "out")
+        result = runner.invoke(app, ["cache", "clear"])
+        assert result.exit_code == 0, result.output
+        assert "Removed 1" in result.output
+        assert ResultCache().stats().entries == 0
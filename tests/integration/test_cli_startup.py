@@ -0,0 +1,72 @@
+"""Integration tests for the CLI start-up cost, measured with ``python -X importtime``."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Lightweight commands must not load these; they belong to the analysis,
+# plotting, and GUI commands only.
+_HEAVY_MODULES = ("numpy", "matplotlib", "tkinter", "scaldys_template.tk", "scaldys_template.core")
+
+# Runs the CLI entry point with every AppLocation directory redirected to
+# argv[1] (as the isolated_app_location fixture does in-process), so that
+# logging and settings never touch the real app-data folder.
+_RUN_CLI = """
+import sys
+from pathlib import Path
+from scaldys_template.common.app_location import AppLocation
+root = Path(sys.argv.pop(1))
+AppLocation.get_directory = staticmethod(lambda dir_type=AppLocation.AppDir: root / str(dir_type))
+from scaldys_template.__main__ import main
+sys.argv[0] = "scaldys-template"
+main()
+"""
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)")
+
+
+def _import_times(tmp_path: Path, *args: str) -> dict[str, int]:
+    """Helper: run the CLI with *args*; return the self import time (µs) of every module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUN_CLI, str(tmp_path), *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    return {m[2]: int(m[1]) for m in map(_IMPORT_LINE.match, result.stderr.splitlines()) if m}
+
+
+@pytest.fixture(scope="module")
+def full_import_us(tmp_path_factory: pytest.TempPathFactory) -> int:
+    """Import time of the whole CLI: ``--help`` loads every command."""
+    return sum(_import_times(tmp_path_factory.mktemp("full"), "--help").values())
+
+
+@pytest.mark.integration
+class TestCliStartup:
+    @pytest.mark.parametrize("args", [("--version",), ("settings",), ("gui", "--help")])
+    def test_lightweight_commands_skip_heavy_modules(self, tmp_path: Path, args):
+        modules = _import_times(tmp_path, *args)
+        loaded = [m for m in modules if m.startswith(_HEAVY_MODULES)]
+        assert loaded == []
+
+    # Largest share of the full CLI import time a lightweight command may
+    # spend.  Relative, so the bound holds on fast and slow machines alike;
+    # settings needs pydantic for AppSettings, --version nothing beyond Typer.
+    @pytest.mark.parametrize(("args", "max_share"), [(("--version",), 0.5), (("settings",), 0.75)])
+    def test_lightweight_commands_import_budget(
+        self, tmp_path: Path, args, max_share, full_import_us
+    ):
+        light_us = sum(_import_times(tmp_path, *args).values())
+        assert light_us < max_share * full_import_us
+
+    def test_analyze_loads_its_own_dependencies(self, tmp_path: Path):
+        modules = _import_times(tmp_path, "analyze", "--help")
+        assert "numpy" in modules
+        assert "scaldys_template.core.signal_engine" in modules
+        assert "scaldys_template.tk" not in modules
@@ -0,0 +1,61 @@
+"""Integration tests for the ``sweep`` CLI command."""
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from scaldys_template.cli.cli import app
+
+runner = CliRunner()
+
+
+def _write_spec(path: Path, **axes) -> None:
+    base = {"sampling_rate": 8000.0, "duration": 0.1, "fft_size": 512}
+    path.write_text(json.dumps({"base": base, "axes": axes}), encoding="utf-8")
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("isolated_app_location")
+class TestSweepCLI:
+    def test_sweep_writes_one_row_per_point(self, tmp_path: Path):
+        spec_file = tmp_path / "spec.json"
+        _write_spec(spec_file, frequency=[100.0, 200.0], fft_window=["hanning", "blackman"])
+        out = tmp_path / "metrics.csv"
+        result = runner.invoke(
+            app, ["sweep", str(spec_file), "--workers", "2", "--output", str(out)]
+        )
+        assert result.exit_code == 0, result.output
+
+        with out.open(encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["point"] for row in rows] == ["0", "1", "2", "3"]
+        assert rows[1]["frequency"] == "100.0"
+        assert rows[1]["fft_window"] == "blackman"
+        assert float(rows[2]["peak_freq_hz"]) == pytest.approx(200.0, abs=16.0)
+
+    def test_sweep_invalid_point_exits_nonzero(self, tmp_path: Path):
+        spec_file = tmp_path / "spec.json"
+        _write_spec(spec_file, frequency=[100.0, -1.0])
+        result = runner.invoke(
+            app, ["sweep", str(spec_file), "--workers", "1", "--output", str(tmp_path / "m.csv")]
+        )
+        assert result.exit_code != 0
+
+    def test_sweep_invalid_spec_exits_nonzero(self, tmp_path: Path):
+        spec_file = tmp_path / "spec.json"
+        _write_spec(spec_file, not_a_field=[1])
+        result = runner.invoke(app, ["sweep", str(spec_file)])
+        assert result.exit_code != 0
+
+    def test_sweep_fails_without_force_on_existing_output(self, tmp_path: Path):
+        spec_file = tmp_path / "spec.json"
+        _write_spec(spec_file, frequency=[100.0])
+        out = tmp_path / "metrics.csv"
+        out.write_text("", encoding="utf-8")
+        result = runner.invoke(app, ["sweep", str(spec_file), "--output", str(out)])
+        assert result.exit_code != 0
+        result = runner.invoke(app, ["sweep", str(spec_file), "--output", str(out), "--force"])
+        assert result.exit_code == 0, result.output
@@ -71,6 +71,35 @@ class TestAppSettingsLogLevel:
         assert settings.log_level is None
 
 
+@pytest.mark.unit
+class TestAppSettingsFFTBackend:
+    def test_fft_backend_is_none_when_unset(self, isolated_app_location):
+        assert AppSettings().fft_backend is None
+
+    @pytest.mark.parametrize("name", ["auto", "numpy", "scipy"])
+    def test_set_valid_fft_backend(self, isolated_app_location, name: str):
+        settings = AppSettings()
+        settings.fft_backend = name
+        assert settings.fft_backend == name
+
+    def test_set_invalid_fft_backend_raises_validation_error(self, isolated_app_location):
+        settings = AppSettings()
+        with pytest.raises(ValidationError):
+            settings.fft_backend = "fftw"
+
+    def test_setting_one_field_keeps_the_other(self, isolated_app_location):
+        settings = AppSettings()
+        settings.fft_backend = "numpy"
+        settings.log_level = "debug"
+        assert settings.fft_backend == "numpy"
+
+    def test_save_and_reload_preserves_fft_backend(self, isolated_app_location):
+        s1 = AppSettings()
+        s1.fft_backend = "numpy"
+        s1.save()
+        assert AppSettings().fft_backend == "numpy"
+
+
 # ---------------------------------------------------------------------------
 # Persistence (save / reload)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for scaldys.common.lazy_exports.
+
+Patterns demonstrated
+----------------------
+- Building a throwaway module registered in sys.modules (monkeypatch.setitem)
+- Asserting an import is deferred until first attribute access
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+
+import pytest
+
+from scaldys_template.common.lazy_exports import lazy_exports
+
+
+@pytest.fixture
+def package(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """A fake package re-exporting ``sqrt`` from ``math`` and ``dedent`` from ``textwrap``."""
+    module = types.ModuleType("fake_package")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    exports = {"sqrt": "math", "dedent": "textwrap"}
+    getattr_, dir_ = lazy_exports(module.__name__, exports)
+    module.__getattr__ = getattr_  # type: ignore[attr-defined]
+    module.__dir__ = dir_  # type: ignore[method-assign]
+    return module
+
+
+@pytest.mark.unit
+class TestLazyExports:
+    def test_name_is_imported_and_cached_on_first_access(self, package):
+        import math
+
+        assert "sqrt" not in vars(package)
+        assert package.sqrt is math.sqrt
+        assert vars(package)["sqrt"] is math.sqrt
+
+    def test_unknown_name_raises_attribute_error(self, package):
+        with pytest.raises(AttributeError, match="fake_package.*missing"):
+            _ = package.missing
+
+    def test_dir_lists_exports_before_access(self, package):
+        assert {"sqrt", "dedent"} <= set(dir(package))
+
+    def test_packages_use_the_helper(self):
+        from scaldys_template.cli import commands
+
+        assert "ARG_TYPE_VERBOSE" in dir(commands)
+        assert commands.ARG_TYPE_VERBOSE is not None
@@ -11,11 +11,14 @@ no real filesystem writes beyond what tmp_path provides.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from scaldys_template.__about__ import PACKAGE_NAME
+from scaldys_template.core.signal_model import SignalParameters
 
 
 # ---------------------------------------------------------------------------
@@ -66,3 +69,33 @@ def sample_config_file(tmp_path: Path) -> Path:
 def sample_output_dir(tmp_path: Path) -> Path:
     """Return a path to a non-existing output directory inside tmp_path."""
     return tmp_path / "output"
+
+
+# ---------------------------------------------------------------------------
+# Signal parameters
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def make_params() -> Callable[..., SignalParameters]:
+    """
+    Return a factory for small, fast ``SignalParameters``.
+
+    The defaults (a 100 Hz tone sampled at 8 kHz for 0.1 s, 512-point FFT)
+    keep every engine call in the millisecond range.  Keyword arguments
+    override them:
+
+        def test_something(make_params):
+            params = make_params(noise_type=NoiseType.GAUSSIAN, seed=1)
+    """
+
+    def _make(**overrides: Any) -> SignalParameters:
+        defaults: dict[str, Any] = {
+            "frequency": 100.0,
+            "sampling_rate": 8000.0,
+            "duration": 0.1,
+            "fft_size": 512,
+        }
+        return SignalParameters(**{**defaults, **overrides})
+
+    return _make
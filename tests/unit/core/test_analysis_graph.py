@@ -0,0 +1,114 @@
+"""Unit tests for the incremental analysis graph."""
+
+import numpy as np
+import pytest
+
+from scaldys_template.core.analysis_graph import (
+    SIGNAL_FIELDS,
+    SPECTRUM_FIELDS,
+    AnalysisGraph,
+    Stage,
+)
+from scaldys_template.core.signal_engine import (
+    SignalWorkspace,
+    compute_fft,
+    compute_metrics,
+    generate_signal,
+)
+from scaldys_template.core.signal_model import NoiseType, SignalParameters, WindowType
+
+
+@pytest.mark.unit
+class TestFieldGroups:
+    def test_every_parameter_belongs_to_exactly_one_stage(self):
+        assert SIGNAL_FIELDS | SPECTRUM_FIELDS == set(SignalParameters.model_fields)
+        assert not SIGNAL_FIELDS & SPECTRUM_FIELDS
+
+
+@pytest.mark.unit
+class TestAnalysisGraph:
+    def test_first_run_computes_every_stage(self, make_params):
+        run = AnalysisGraph().run(make_params())
+        assert run.recomputed == (Stage.SIGNAL, Stage.SPECTRUM, Stage.METRICS)
+        assert run.skipped == ()
+
+    def test_unchanged_parameters_reuse_everything(self, make_params):
+        graph = AnalysisGraph()
+        first = graph.run(make_params())
+        second = graph.run(make_params())
+        assert second.recomputed == ()
+        assert second.skipped == (Stage.SIGNAL, Stage.SPECTRUM, Stage.METRICS)
+        assert second.result.signal_data is first.result.signal_data
+        assert second.result.metrics is first.result.metrics
+
+    def test_fft_change_reuses_signal(self, make_params):
+        graph = AnalysisGraph()
+        first = graph.run(make_params())
+        params = make_params(fft_window=WindowType.BLACKMAN, fft_size=256)
+        run = graph.run(params)
+
+        assert run.skipped == (Stage.SIGNAL,)
+        assert run.result.signal_data is first.result.signal_data
+        expected = compute_fft(run.result.signal_data, params)
+        np.testing.assert_array_equal(run.result.fft_result.magnitude_db, expected.magnitude_db)
+        assert run.result.metrics == compute_metrics(run.result.signal_data, expected)
+
+    def test_signal_change_reruns_everything(self, make_params):
+        graph = AnalysisGraph()
+        graph.run(make_params())
+        run = graph.run(make_params(amplitude=2.0))
+        assert run.recomputed == (Stage.SIGNAL, Stage.SPECTRUM, Stage.METRICS)
+        assert run.result.metrics.peak == pytest.approx(2.0, abs=0.01)
+
+    def test_unseeded_noise_is_always_regenerated(self, make_params):
+        graph = AnalysisGraph()
+        params = make_params(noise_type=NoiseType.GAUSSIAN)
+        graph.run(params)
+        assert Stage.SIGNAL in graph.run(params).recomputed
+
+    def test_seeded_noise_is_reused(self, make_params):
+        graph = AnalysisGraph()
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=3)
+        graph.run(params)
+        assert graph.run(params).recomputed == ()
+
+    def test_stale_stages_does_not_run_anything(self, make_params):
+        graph = AnalysisGraph()
+        assert graph.stale_stages(make_params()) == (Stage.SIGNAL, Stage.SPECTRUM, Stage.METRICS)
+        graph.run(make_params())
+        assert graph.stale_stages(make_params(welch_overlap=0.25)) == (
+            Stage.SPECTRUM,
+            Stage.METRICS,
+        )
+        assert graph.stale_stages(make_params()) == ()
+
+    def test_invalidate_reruns_downstream_stages(self, make_params):
+        graph = AnalysisGraph()
+        graph.run(make_params())
+        graph.invalidate(Stage.SPECTRUM)
+        assert graph.run(make_params()).recomputed == (Stage.SPECTRUM, Stage.METRICS)
+        graph.invalidate()
+        assert graph.run(make_params()).recomputed == (Stage.SIGNAL, Stage.SPECTRUM, Stage.METRICS)
+
+    def test_signal_stage_uses_workspace(self, make_params):
+        workspace = SignalWorkspace()
+        run = AnalysisGraph().run(make_params(), workspace=workspace)
+        other = generate_signal(make_params(frequency=200.0), workspace=workspace)
+        assert np.shares_memory(run.result.signal_data.signal, other.signal)
+
+    def test_on_stage_reports_each_output_in_order(self, make_params):
+        graph = AnalysisGraph()
+        graph.run(make_params())
+        seen = []
+        run = graph.run(
+            make_params(fft_window=WindowType.BLACKMAN),
+            on_stage=lambda stage, output: seen.append((stage, output)),
+        )
+        result = run.result
+        assert seen == [
+            (Stage.SIGNAL, result.signal_data),
+            (Stage.SPECTRUM, result.fft_result),
+            (Stage.METRICS, result.metrics),
+        ]
+        assert set(run.timings) == {Stage.SPECTRUM, Stage.METRICS}
+        assert all(seconds >= 0.0 for seconds in run.timings.values())
@@ -0,0 +1,35 @@
+"""Unit tests for the fast FFT length helpers."""
+
+import pytest
+
+from scaldys_template.core.fft_length import is_fast_length, next_fast_length, prev_fast_length
+
+_LIMIT = 5000
+_FAST = [n for n in range(1, 2 * _LIMIT) if is_fast_length(n)]
+
+
+@pytest.mark.unit
+class TestFastLength:
+    def test_is_fast_length(self):
+        assert [n for n in range(1, 21) if is_fast_length(n)] == [
+            1, 2, 3, 4, 5, 6, 8, 9, 10, 12, 15, 16, 18, 20,
+        ]  # fmt: skip
+        assert not is_fast_length(0)
+        assert not is_fast_length(1009)
+
+    def test_next_fast_length_matches_brute_force(self):
+        for n in range(1, _LIMIT):
+            assert next_fast_length(n) == min(m for m in _FAST if m >= n)
+
+    def test_prev_fast_length_matches_brute_force(self):
+        for n in range(1, _LIMIT):
+            assert prev_fast_length(n) == max(m for m in _FAST if m <= n)
+
+    def test_large_lengths(self):
+        assert next_fast_length(10_000_019) == 10_077_696  # 2⁹ · 3⁹
+        assert prev_fast_length(10_000_019) == 10_000_000
+
+    @pytest.mark.parametrize("fn", [next_fast_length, prev_fast_length])
+    def test_non_positive_raises(self, fn):
+        with pytest.raises(ValueError, match="≥ 1"):
+            fn(0)
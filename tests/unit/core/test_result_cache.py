@@ -0,0 +1,140 @@
+"""Unit tests for the on-disk analysis result cache."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scaldys_template.core.analysis_graph import AnalysisGraph
+from scaldys_template.core.result_cache import ResultCache, result_key
+from scaldys_template.core.signal_model import NoiseType, SignalParameters
+
+
+def _store(cache: ResultCache, params: SignalParameters):
+    result = AnalysisGraph().run(params).result
+    assert cache.put(params, result)
+    return result
+
+
+@pytest.mark.unit
+class TestResultKey:
+    def test_equal_parameters_give_equal_keys(self):
+        a = SignalParameters(frequency=50.0, amplitude=2.0)
+        b = SignalParameters.model_validate({"amplitude": 2.0, "frequency": 50.0})
+        assert result_key(a) == result_key(b)
+
+    def test_any_change_gives_new_key(self, make_params):
+        base = make_params(seed=1)
+        keys = {
+            result_key(base),
+            result_key(make_params(seed=2)),
+            result_key(make_params(seed=1, fft_size=256)),
+            result_key(base, max_harmonic=3),
+        }
+        assert len(keys) == 4
+
+
+@pytest.mark.unit
+class TestResultCache:
+    def test_miss_on_empty_cache(self, make_params, tmp_path: Path):
+        assert ResultCache(tmp_path / "cache").get(make_params()) is None
+
+    def test_round_trip_is_exact(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=7)
+        stored = _store(cache, params)
+        loaded = cache.get(params)
+
+        assert loaded is not None
+        assert loaded.metrics == stored.metrics
+        assert loaded.signal_data.time == stored.signal_data.time
+        for name in ("signal", "noise", "composite"):
+            np.testing.assert_array_equal(
+                getattr(loaded.signal_data, name), getattr(stored.signal_data, name)
+            )
+        for name in ("frequencies", "magnitude_db", "phase_deg", "magnitude"):
+            np.testing.assert_array_equal(
+                getattr(loaded.fft_result, name), getattr(stored.fft_result, name)
+            )
+
+    def test_hit_is_memory_mapped_and_read_only(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        _store(cache, make_params())
+        loaded = cache.get(make_params())
+        assert loaded is not None
+        composite = loaded.signal_data.composite
+        assert isinstance(composite, np.memmap)
+        assert not composite.flags.writeable
+
+    def test_hit_rows_share_one_sample_block(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=7)
+        _store(cache, params)
+        result = cache.get(params)
+        assert result is not None
+        loaded = result.signal_data
+        assert loaded.samples is not None
+        assert loaded.samples.shape == (3, len(loaded.signal))
+        for row in (loaded.signal, loaded.noise, loaded.composite):
+            assert np.shares_memory(row, loaded.samples)
+
+    def test_noiseless_result_keeps_noise_sentinel(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        _store(cache, make_params())
+        result = cache.get(make_params())
+        assert result is not None
+        loaded = result.signal_data
+        assert not loaded.has_noise
+        assert loaded.noise_samples().shape == loaded.signal.shape
+
+    def test_unseeded_noise_is_not_cached(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        params = make_params(noise_type=NoiseType.GAUSSIAN)
+        assert not cache.put(params, AnalysisGraph().run(params).result)
+        assert cache.get(params) is None
+        assert cache.stats().entries == 0
+
+    def test_stats_and_clear(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        _store(cache, make_params())
+        _store(cache, make_params(frequency=200.0))
+        stats = cache.stats()
+        assert stats.entries == 2
+        assert stats.total_bytes > 0
+        assert cache.clear() == 2
+        assert cache.stats().entries == 0
+
+    def test_evicts_least_recently_used(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        first, second = make_params(), make_params(frequency=200.0)
+        _store(cache, first)
+        _store(cache, second)
+        entry_size = cache.stats().total_bytes // 2
+
+        # Make *first* the most recently used entry.
+        for offset, params in ((100, second), (200, first)):
+            meta = tmp_path / result_key(params) / "meta.json"
+            os.utime(meta, (meta.stat().st_atime, meta.stat().st_mtime + offset))
+
+        cache.max_bytes = int(entry_size * 1.5)
+        assert cache.evict() == 1
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+
+    def test_oversized_result_is_not_stored(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path, max_bytes=1024)
+        params = make_params()
+        assert not cache.put(params, AnalysisGraph().run(params).result)
+
+    def test_corrupt_entry_is_discarded(self, make_params, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        _store(cache, make_params())
+        entry = tmp_path / result_key(make_params())
+        (entry / "samples.npy").write_bytes(b"garbage")
+        assert cache.get(make_params()) is None
+        assert not entry.exists()
+
+    def test_negative_max_bytes_raises(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="max_bytes"):
+            ResultCache(tmp_path, max_bytes=-1)
@@ -0,0 +1,180 @@
+"""Unit tests for the shared-memory SignalData transport."""
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from scaldys_template.core.shared_transport import (
+    AnalysisResultDescriptor,
+    SharedArena,
+    SignalDataDescriptor,
+    attach_array,
+    attach_result,
+    attach_signal_data,
+    store_result,
+)
+from scaldys_template.core.signal_engine import (
+    AnalysisResult,
+    compute_fft,
+    compute_metrics,
+    generate_signal,
+)
+from scaldys_template.core.signal_model import NoiseType, SignalParameters
+
+
+def _analyze(params: SignalParameters) -> AnalysisResult:
+    sd = generate_signal(params)
+    fft = compute_fft(sd, params)
+    return AnalysisResult(sd, fft, compute_metrics(sd, fft))
+
+
+# Worker functions run in spawned processes, so they live at module level.
+
+
+def _peak_in_worker(desc: SignalDataDescriptor) -> float:
+    return float(np.max(np.abs(attach_signal_data(desc).composite)))
+
+
+def _analyze_in_worker(
+    params: SignalParameters, slots: AnalysisResultDescriptor
+) -> AnalysisResultDescriptor:
+    return store_result(slots, _analyze(params))
+
+
+def _assert_same(a: AnalysisResult, b: AnalysisResult) -> None:
+    for name in ("signal", "noise", "composite"):
+        np.testing.assert_array_equal(getattr(a.signal_data, name), getattr(b.signal_data, name))
+    for name in ("frequencies", "magnitude_db", "phase_deg", "magnitude"):
+        np.testing.assert_array_equal(getattr(a.fft_result, name), getattr(b.fft_result, name))
+    assert a.signal_data.time == b.signal_data.time
+    assert a.metrics == b.metrics
+
+
+@pytest.mark.unit
+class TestSharedArena:
+    def test_share_and_attach_round_trip(self, make_params):
+        result = _analyze(make_params(noise_type=NoiseType.GAUSSIAN))
+        with SharedArena() as arena:
+            desc = arena.share_result(result)
+            _assert_same(attach_result(desc), result)
+
+    def test_descriptors_are_small(self, make_params):
+        result = _analyze(make_params(duration=2.0))
+        with SharedArena() as arena:
+            desc = arena.share_result(result)
+            assert len(pickle.dumps(desc)) < 2048
+            assert len(pickle.dumps(result)) > 100_000
+
+    def test_attached_arrays_are_read_only_by_default(self):
+        with SharedArena() as arena:
+            desc = arena.share_array(np.arange(8.0))
+            view = attach_array(desc)
+            assert not view.flags.writeable
+            attach_array(desc, writeable=True)[0] = 42.0
+            assert view[0] == 42.0
+
+    def test_arrays_are_aligned(self, make_params):
+        sd = generate_signal(make_params(duration=0.100125, noise_type=NoiseType.GAUSSIAN))
+        with SharedArena() as arena:
+            desc = arena.share_signal_data(sd)
+            assert desc.samples is not None
+            assert desc.samples.offset % 64 == 0
+            assert desc.samples.shape == (3, len(sd.signal))
+            row_bytes = sd.signal.nbytes
+            offsets = [d.offset for d in (desc.signal, desc.noise, desc.composite)]
+            assert offsets == [desc.samples.offset + i * row_bytes for i in range(3)]
+
+    def test_shared_signal_is_one_contiguous_block(self, make_params):
+        sd = generate_signal(make_params(noise_type=NoiseType.GAUSSIAN), contiguous=True)
+        with SharedArena() as arena:
+            shared = attach_signal_data(arena.share_signal_data(sd))
+            assert shared.samples is not None
+            assert shared.samples.flags.c_contiguous
+            np.testing.assert_array_equal(shared.samples, sd.samples)
+            for row in (shared.signal, shared.noise, shared.composite):
+                assert np.shares_memory(row, shared.samples)
+
+    def test_noiseless_signal_keeps_empty_noise(self, make_params):
+        sd = generate_signal(make_params())
+        with SharedArena() as arena:
+            shared = attach_signal_data(arena.share_signal_data(sd))
+            assert not shared.has_noise
+            np.testing.assert_array_equal(shared.composite, sd.composite)
+
+    def test_close_unlinks_blocks(self):
+        arena = SharedArena()
+        desc = arena.share_array(np.ones(16))
+        view = attach_array(desc)
+        arena.close()
+
+        assert arena.closed and arena.n_blocks == 0
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(desc.block, track=False)
+        np.testing.assert_array_equal(view, 1.0)  # existing views stay mapped
+
+    def test_closed_arena_refuses_new_blocks(self):
+        arena = SharedArena()
+        arena.close()
+        arena.close()  # idempotent
+        with pytest.raises(RuntimeError, match="closed"):
+            arena.share_array(np.ones(4))
+
+    def test_shutdown_event_blocks_new_allocations(self):
+        from scaldys_template.__main__ import _shutdown_event
+
+        with SharedArena() as arena:
+            _shutdown_event.set()
+            try:
+                with pytest.raises(RuntimeError, match="Shutdown"):
+                    arena.share_array(np.ones(4))
+            finally:
+                _shutdown_event.clear()
+            assert arena.n_blocks == 0
+
+    def test_garbage_collected_arena_unlinks_blocks(self):
+        arena = SharedArena()
+        name = arena.share_array(np.ones(4)).block
+        del arena
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name, track=False)
+
+
+@pytest.mark.unit
+class TestStoreResult:
+    @pytest.mark.parametrize("dtype", ["float64", "float32"])
+    @pytest.mark.parametrize("noise_type", [NoiseType.NONE, NoiseType.GAUSSIAN])
+    def test_allocated_slots_fit_engine_output(self, make_params, dtype, noise_type):
+        params = make_params(dtype=dtype, noise_type=noise_type)
+        result = _analyze(params)
+        with SharedArena() as arena:
+            filled = store_result(arena.allocate_result(params), result)
+            _assert_same(attach_result(filled), result)
+
+    def test_unfilled_slot_cannot_be_attached(self, make_params):
+        with SharedArena() as arena, pytest.raises(ValueError, match="store_result"):
+            attach_result(arena.allocate_result(make_params()))
+
+    def test_shape_mismatch_raises(self, make_params):
+        with SharedArena() as arena:
+            slots = arena.allocate_result(make_params())
+            with pytest.raises(ValueError, match="does not fit"):
+                store_result(slots, _analyze(make_params(duration=0.5)))
+
+
+@pytest.mark.unit
+class TestAcrossProcesses:
+    def test_worker_reads_and_writes_shared_memory(self, make_params):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=5)
+        expected = _analyze(params)
+        spawn = multiprocessing.get_context("spawn")
+        with SharedArena() as arena, ProcessPoolExecutor(1, mp_context=spawn) as pool:
+            desc = arena.share_signal_data(expected.signal_data)
+            peak = pool.submit(_peak_in_worker, desc).result()
+            assert peak == pytest.approx(np.max(np.abs(expected.signal_data.composite)))
+
+            filled = pool.submit(_analyze_in_worker, params, arena.allocate_result(params))
+            _assert_same(attach_result(filled.result()), expected)
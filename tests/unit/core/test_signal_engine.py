@@ -1,68 +1,114 @@
 """Unit tests for the signal engine (generate, FFT, metrics)."""
 
+import functools
+import time
+import tracemalloc
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
 import pytest
 
+from scaldys_template.core import signal_engine
 from scaldys_template.core.signal_engine import (
+    FFT_BACKEND_ENV,
+    FFT_WORKERS_ENV,
+    FFTResult,
+    MetricsAccumulator,
+    SignalWorkspace,
+    TimeAxis,
+    _apply_window,
+    _dft_bins,
+    analyze_batch,
+    available_fft_backends,
+    capture_signal,
+    clear_window_cache,
+    compute_channel_metrics,
     compute_fft,
     compute_metrics,
+    compute_stft,
     generate_signal,
+    get_fft_backend,
+    get_window,
+    iter_signal_chunks,
+    measure_batch,
+    measure_channel_metrics,
+    measure_metrics,
+    register_fft_backend,
+    set_fft_backend,
+    spawn_rngs,
+    stack_channels,
+    window_cache_info,
 )
-from scaldys_template.core.signal_model import NoiseType, SignalParameters, SignalType
+from scaldys_template.core.signal_model import (
+    FastLength,
+    FFTMode,
+    NoiseType,
+    SignalParameters,
+    SignalType,
+    SpectrumAverage,
+    WindowType,
+)
+from scaldys_template.core.streaming import StreamingAnalyzer
 
 
-def _params(**kwargs: Any) -> SignalParameters:
-    """Helper: create parameters with sane defaults overridden by *kwargs*."""
-    defaults: dict[str, Any] = dict(
-        frequency=100.0,
-        sampling_rate=8000.0,
-        duration=0.1,
-        fft_size=512,
-    )
-    defaults.update(kwargs)
-    return SignalParameters(**defaults)
+@pytest.fixture(params=["numpy", "scipy"])
+def fft_backend(request: pytest.FixtureRequest):
+    """Run the test once per FFT backend; backends that are not installed are skipped."""
+    try:
+        backend = set_fft_backend(request.param)
+    except ValueError:
+        pytest.skip(f"FFT backend '{request.param}' is not installed")
+    yield backend
+    set_fft_backend(None)
+
+
+@pytest.fixture
+def fft_registry(monkeypatch: pytest.MonkeyPatch):
+    """A fresh FFT backend registry, with the environment variable unset."""
+    monkeypatch.delenv(FFT_BACKEND_ENV, raising=False)
+    registry = signal_engine._FFTBackendRegistry()
+    monkeypatch.setattr(signal_engine, "_fft_registry", registry)
+    return registry
 
 
 @pytest.mark.unit
 class TestGenerateSignal:
-    def test_output_shapes_match_expected_sample_count(self):
-        params = _params(duration=0.1, sampling_rate=8000.0)
+    def test_output_shapes_match_expected_sample_count(self, make_params):
+        params = make_params(duration=0.1, sampling_rate=8000.0)
         sd = generate_signal(params)
         n = int(0.1 * 8000.0)
         assert len(sd.time) == n
         assert len(sd.signal) == n
-        assert len(sd.noise) == n
         assert len(sd.composite) == n
 
-    def test_time_axis_starts_at_zero(self):
-        sd = generate_signal(_params())
+    def test_time_axis_starts_at_zero(self, make_params):
+        sd = generate_signal(make_params())
         assert sd.time[0] == pytest.approx(0.0)
 
-    def test_time_axis_ends_before_duration(self):
-        params = _params(duration=0.1)
+    def test_time_axis_ends_before_duration(self, make_params):
+        params = make_params(duration=0.1)
         sd = generate_signal(params)
         assert sd.time[-1] < params.duration
 
-    def test_sine_amplitude_matches(self):
-        params = _params(amplitude=2.0, signal_type=SignalType.SINE)
+    def test_sine_amplitude_matches(self, make_params):
+        params = make_params(amplitude=2.0, signal_type=SignalType.SINE)
         sd = generate_signal(params)
         # Peak should be close to amplitude (within 1 sample rounding)
         assert np.max(np.abs(sd.signal)) == pytest.approx(2.0, abs=0.01)
 
-    def test_no_noise_by_default(self):
-        sd = generate_signal(_params())
+    def test_no_noise_by_default(self, make_params):
+        sd = generate_signal(make_params())
         assert np.all(sd.noise == 0.0)
 
-    def test_composite_equals_signal_plus_noise_plus_dc(self):
-        params = _params(dc_offset=0.5, noise_type=NoiseType.GAUSSIAN, snr_db=20.0)
+    def test_composite_equals_signal_plus_noise_plus_dc(self, make_params):
+        params = make_params(dc_offset=0.5, noise_type=NoiseType.GAUSSIAN, snr_db=20.0)
         sd = generate_signal(params)
         expected = sd.signal + sd.noise + params.dc_offset
         np.testing.assert_allclose(sd.composite, expected)
 
-    def test_gaussian_noise_has_correct_snr(self):
-        params = _params(noise_type=NoiseType.GAUSSIAN, snr_db=20.0, amplitude=1.0)
+    def test_gaussian_noise_has_correct_snr(self, make_params):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, snr_db=20.0, amplitude=1.0)
         sd = generate_signal(params)
         signal_power = np.mean(sd.signal**2)
         noise_power = np.mean(sd.noise**2)
@@ -70,22 +116,278 @@ class TestGenerateSignal:
         # Allow ±3 dB tolerance (stochastic)
         assert abs(measured_snr - 20.0) < 3.0
 
-    def test_all_signal_types_produce_output(self):
+    def test_all_signal_types_produce_output(self, make_params):
         for st in SignalType:
-            params = _params(signal_type=st)
+            params = make_params(signal_type=st)
             sd = generate_signal(params)
             assert len(sd.composite) > 0
 
-    def test_dc_offset_shifts_mean(self):
-        params = _params(dc_offset=5.0, signal_type=SignalType.SINE)
+    def test_dc_offset_shifts_mean(self, make_params):
+        params = make_params(dc_offset=5.0, signal_type=SignalType.SINE)
         sd = generate_signal(params)
         assert np.mean(sd.composite) == pytest.approx(5.0, abs=0.01)
 
 
 @pytest.mark.unit
+class TestLazySignalData:
+    def test_time_axis_matches_linspace(self, make_params):
+        params = make_params(duration=0.1, sampling_rate=8000.0)
+        sd = generate_signal(params)
+        expected = np.linspace(0.0, params.duration, 800, endpoint=False)
+        assert isinstance(sd.time, TimeAxis)
+        np.testing.assert_array_equal(np.asarray(sd.time), expected)
+        np.testing.assert_array_equal(sd.time[10:500:7], expected[10:500:7])
+        np.testing.assert_array_equal(sd.time[::-3], expected[::-3])
+        assert sd.time[-1] == expected[-1]
+
+    def test_time_axis_index_out_of_range(self, make_params):
+        sd = generate_signal(make_params())
+        with pytest.raises(IndexError):
+            sd.time[len(sd.time)]
+
+    def test_clean_signal_shares_one_array(self, make_params):
+        sd = generate_signal(make_params(noise_type=NoiseType.NONE, dc_offset=0.0))
+        assert sd.composite is sd.signal
+        assert not sd.has_noise
+        assert sd.noise.size == 0
+        assert not sd.noise.flags.writeable
+
+    def test_dc_offset_allocates_separate_composite(self, make_params):
+        sd = generate_signal(make_params(dc_offset=0.5))
+        assert sd.composite is not sd.signal
+        np.testing.assert_array_equal(sd.composite, sd.signal + 0.5)
+
+    def test_noise_samples_expands_sentinel_without_copying(self, make_params):
+        sd = generate_signal(make_params())
+        noise = sd.noise_samples()
+        assert noise.shape == sd.signal.shape
+        assert noise.strides == (0,)
+        assert np.all(noise == 0.0)
+
+        noisy = generate_signal(make_params(noise_type=NoiseType.GAUSSIAN))
+        assert noisy.has_noise
+        assert noisy.noise_samples() is noisy.noise
+
+    def test_stored_arrays_of_clean_run_fit_in_one_buffer(self, make_params):
+        params = make_params(duration=10.0, sampling_rate=10_000.0)
+        tracemalloc.start()
+        try:
+            sd = generate_signal(params)
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert sd.composite is sd.signal
+        assert current < 1.1 * sd.signal.nbytes
+
+
+@pytest.mark.unit
+class TestSignalWorkspace:
+    @pytest.mark.parametrize(
+        "signal_type",
+        [SignalType.SINE, SignalType.SQUARE, SignalType.SAWTOOTH, SignalType.TRIANGLE],
+    )
+    @pytest.mark.parametrize("dtype", ["float64", "float32"])
+    def test_matches_fresh_generation(self, signal_type, dtype, make_params):
+        params = make_params(signal_type=signal_type, phase_deg=45.0, dc_offset=0.3, dtype=dtype)
+        expected = generate_signal(params)
+        sd = generate_signal(params, workspace=SignalWorkspace())
+        np.testing.assert_array_equal(sd.signal, expected.signal)
+        np.testing.assert_array_equal(sd.composite, expected.composite)
+        assert sd.composite.dtype == np.dtype(dtype)
+
+    def test_results_are_views_into_reused_buffers(self, make_params):
+        workspace = SignalWorkspace()
+        first = generate_signal(make_params(noise_type=NoiseType.GAUSSIAN), workspace=workspace)
+        second = generate_signal(make_params(frequency=200.0), workspace=workspace)
+        assert np.shares_memory(first.signal, second.signal)
+        assert workspace.capacity == len(second.signal)
+
+    def test_grows_and_switches_dtype(self, make_params):
+        workspace = SignalWorkspace(100)
+        sd = generate_signal(make_params(duration=0.2, dtype="float32"), workspace=workspace)
+        assert workspace.capacity == 1600
+        assert sd.signal.dtype == np.float32
+        sd = generate_signal(make_params(), workspace=workspace)
+        assert len(sd.signal) == 800
+        assert sd.signal.dtype == np.float64
+
+    def test_repeated_run_allocates_nothing(self, make_params):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, dc_offset=0.1, duration=1.0)
+        workspace = SignalWorkspace()
+        generate_signal(params, workspace=workspace)
+        tracemalloc.start()
+        try:
+            generate_signal(params, workspace=workspace)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 0.05 * workspace.nbytes
+
+    def test_streamed_chunks_reuse_one_workspace(self, make_params):
+        params = make_params(signal_type=SignalType.TRIANGLE, dc_offset=0.1)
+        workspace = SignalWorkspace()
+        chunks = [
+            c.composite.copy()
+            for c in iter_signal_chunks(params, chunk_size=97, workspace=workspace)
+        ]
+        np.testing.assert_array_equal(np.concatenate(chunks), generate_signal(params).composite)
+        assert workspace.capacity == 97
+
+    @pytest.mark.slow
+    def test_benchmark_against_fresh_buffers(self, make_params):
+        params = make_params(
+            sampling_rate=500_000.0, duration=10.0, noise_type=NoiseType.GAUSSIAN, dc_offset=0.1
+        )
+        workspace = SignalWorkspace()
+        generate_signal(params, workspace=workspace)
+
+        def measure(**kwargs: Any) -> tuple[float, int]:
+            tracemalloc.start()
+            try:
+                start = time.perf_counter()
+                generate_signal(params, **kwargs)
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return elapsed, peak
+
+        fresh_time, fresh_peak = min(measure() for _ in range(3))
+        reused_time, reused_peak = min(measure(workspace=workspace) for _ in range(3))
+        assert reused_peak < 0.01 * fresh_peak
+        assert reused_time < 1.25 * fresh_time
+
+
+@pytest.mark.unit
+class TestContiguousSamples:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"dc_offset": 0.3},
+            {"noise_type": NoiseType.GAUSSIAN, "seed": 5},
+            {"signal_type": SignalType.WHITE_NOISE, "seed": 5},
+            {"noise_type": NoiseType.UNIFORM, "seed": 5, "dtype": "float32"},
+        ],
+    )
+    def test_matches_default_layout(self, kwargs, make_params):
+        params = make_params(**kwargs)
+        expected = generate_signal(params)
+        sd = generate_signal(params, contiguous=True)
+        np.testing.assert_array_equal(sd.signal, expected.signal)
+        np.testing.assert_array_equal(sd.noise, expected.noise)
+        np.testing.assert_array_equal(sd.composite, expected.composite)
+        assert sd.has_noise == expected.has_noise
+
+    def test_rows_are_views_of_one_block(self, make_params):
+        sd = generate_signal(make_params(noise_type=NoiseType.GAUSSIAN), contiguous=True)
+        assert sd.samples is not None
+        assert sd.samples.shape == (3, len(sd.signal))
+        assert sd.samples.flags.c_contiguous
+        for row in (sd.signal, sd.noise, sd.composite):
+            assert np.shares_memory(row, sd.samples)
+
+    def test_noiseless_block_has_zero_noise_row(self, make_params):
+        sd = generate_signal(make_params(), contiguous=True)
+        assert not sd.has_noise
+        assert sd.noise.size == 0
+        assert sd.samples is not None
+        assert not sd.samples[1].any()
+        np.testing.assert_array_equal(sd.samples[2], sd.signal)
+
+    def test_default_layout_has_no_block(self, make_params):
+        assert generate_signal(make_params()).samples is None
+
+    def test_contiguous_copies_once(self, make_params):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=1, dc_offset=0.1)
+        sd = generate_signal(params)
+        packed = sd.contiguous()
+        assert packed.samples is not None
+        assert packed.contiguous() is packed
+        np.testing.assert_array_equal(
+            packed.samples, generate_signal(params, contiguous=True).samples
+        )
+
+    def test_workspace_block_is_contiguous(self, make_params):
+        workspace = SignalWorkspace(1000)
+        sd = generate_signal(make_params(), workspace=workspace, contiguous=True)
+        assert sd.samples is not None
+        assert sd.samples.flags.c_contiguous
+        assert not sd.samples[1].any()
+
+    def test_streamed_chunks(self, make_params):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=2)
+        chunks = list(iter_signal_chunks(params, chunk_size=300, contiguous=True))
+        blocks = [c.samples for c in chunks if c.samples is not None]
+        assert len(blocks) == len(chunks)
+        assert all(b.shape == (3, len(c.signal)) for b, c in zip(blocks, chunks))
+        np.testing.assert_array_equal(
+            np.concatenate(blocks, axis=1),
+            generate_signal(params, contiguous=True).samples,
+        )
+
+
+@pytest.mark.unit
+class TestRandomStreams:
+    def test_same_seed_reproduces_noise(self, make_params):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=123)
+        first, second = generate_signal(params), generate_signal(params)
+        np.testing.assert_array_equal(first.composite, second.composite)
+
+    def test_different_or_missing_seeds_differ(self, make_params):
+        a = generate_signal(make_params(noise_type=NoiseType.UNIFORM, seed=1))
+        b = generate_signal(make_params(noise_type=NoiseType.UNIFORM, seed=2))
+        c = generate_signal(make_params(noise_type=NoiseType.UNIFORM))
+        d = generate_signal(make_params(noise_type=NoiseType.UNIFORM))
+        assert not np.array_equal(a.noise, b.noise)
+        assert not np.array_equal(c.noise, d.noise)
+
+    def test_injected_generator_is_reproducible_and_advances(self, make_params):
+        params = make_params(signal_type=SignalType.WHITE_NOISE)
+        rng_a, rng_b = np.random.default_rng(9), np.random.default_rng(9)
+        first = generate_signal(params, rng=rng_a)
+        np.testing.assert_array_equal(first.signal, generate_signal(params, rng=rng_b).signal)
+        assert not np.array_equal(first.signal, generate_signal(params, rng=rng_a).signal)
+
+    def test_seeded_white_noise_streams_like_in_memory(self, make_params):
+        params = make_params(signal_type=SignalType.WHITE_NOISE, seed=5)
+        chunks = [c.signal.copy() for c in iter_signal_chunks(params, chunk_size=77)]
+        np.testing.assert_array_equal(np.concatenate(chunks), generate_signal(params).signal)
+
+    def test_seeded_batch_matches_scalar_path(self, make_params):
+        params_list = [
+            make_params(signal_type=st, noise_type=nt, seed=seed)
+            for st in (SignalType.SINE, SignalType.WHITE_NOISE)
+            for nt in (NoiseType.GAUSSIAN, NoiseType.UNIFORM)
+            for seed in (1, 2)
+        ]
+        for params, result in zip(params_list, analyze_batch(params_list)):
+            sd = generate_signal(params)
+            np.testing.assert_array_equal(result.signal_data.composite, sd.composite)
+            assert result.metrics == compute_metrics(sd, compute_fft(sd, params))
+
+    def test_batch_rng_matches_spawned_children(self, make_params):
+        params_list = [
+            make_params(noise_type=NoiseType.GAUSSIAN, frequency=f) for f in (100.0, 200.0)
+        ]
+        results = analyze_batch(params_list, rng=np.random.default_rng(3))
+        children = np.random.default_rng(3).spawn(2)
+        for params, result, child in zip(params_list, results, children):
+            sd = generate_signal(params, rng=child)
+            np.testing.assert_array_equal(result.signal_data.noise, sd.noise)
+
+    def test_spawn_rngs_gives_independent_deterministic_streams(self):
+        first = [g.random(4) for g in spawn_rngs(11, 3)]
+        second = [g.random(4) for g in spawn_rngs(11, 3)]
+        np.testing.assert_array_equal(first, second)
+        assert not np.array_equal(first[0], first[1])
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fft_backend")
 class TestComputeFFT:
-    def test_frequency_bins_length(self):
-        params = _params(fft_size=512)
+    def test_frequency_bins_length(self, make_params):
+        params = make_params(fft_size=512)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         # rfft gives fft_size // 2 + 1 bins
@@ -93,82 +395,897 @@ class TestComputeFFT:
         assert len(fft.magnitude_db) == len(fft.frequencies)
         assert len(fft.phase_deg) == len(fft.frequencies)
 
-    def test_dc_offset_appears_at_bin_zero(self):
-        params = _params(dc_offset=1.0, signal_type=SignalType.SINE, fft_size=512)
+    def test_dc_offset_appears_at_bin_zero(self, make_params):
+        params = make_params(dc_offset=1.0, signal_type=SignalType.SINE, fft_size=512)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         # Bin 0 (DC) should not be -inf
         assert np.isfinite(fft.magnitude_db[0])
 
-    def test_sine_peak_near_correct_frequency(self):
+    def test_sine_peak_near_correct_frequency(self, make_params):
         freq = 1000.0
-        params = _params(frequency=freq, sampling_rate=16000.0, fft_size=1024, duration=0.1)
+        params = make_params(frequency=freq, sampling_rate=16000.0, fft_size=1024, duration=0.1)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         peak_idx = int(np.argmax(fft.magnitude_db))
         peak_freq = fft.frequencies[peak_idx]
         # Peak bin should be within one bin width of true frequency
-        bin_width = sd.sample_rate / params.fft_size
+        bin_width = sd.sample_rate / params.transform_size
         assert abs(peak_freq - freq) <= bin_width
 
-    def test_magnitude_is_finite(self):
-        sd = generate_signal(_params())
-        fft = compute_fft(sd, _params())
+    def test_magnitude_is_finite(self, make_params):
+        sd = generate_signal(make_params())
+        fft = compute_fft(sd, make_params())
         assert np.all(np.isfinite(fft.magnitude_db))
 
-    def test_phase_in_expected_range(self):
-        sd = generate_signal(_params())
-        fft = compute_fft(sd, _params())
+    def test_phase_in_expected_range(self, make_params):
+        sd = generate_signal(make_params())
+        fft = compute_fft(sd, make_params())
         assert np.all(fft.phase_deg >= -180.0)
         assert np.all(fft.phase_deg <= 180.0)
 
 
+@pytest.mark.unit
+@pytest.mark.usefixtures("fft_backend")
+class TestFFTLengths:
+    def test_arbitrary_size_reads_full_scale_sine(self, make_params):
+        # 800-point rFFT at 8 kHz → 10 Hz bins; 100 Hz falls on bin 10.
+        params = make_params(fft_size=800, fft_window=WindowType.RECTANGULAR)
+        fft = compute_fft(generate_signal(params), params)
+        assert len(fft.frequencies) == 401
+        assert fft.frequencies[10] == pytest.approx(100.0)
+        assert fft.magnitude is not None
+        assert fft.magnitude[10] == pytest.approx(1.0)
+
+    def test_pad_zero_pads_to_fast_length(self, make_params):
+        params = make_params(fft_size=797, fft_fast_length=FastLength.PAD)
+        sd = generate_signal(params)
+        fft = compute_fft(sd, params)
+        assert len(fft.frequencies) == 800 // 2 + 1
+        windowed = _apply_window(sd.composite[:797], params.fft_window)
+        expected = np.abs(np.fft.rfft(windowed, n=800)) / (797 / 2.0)
+        assert fft.magnitude is not None
+        np.testing.assert_allclose(fft.magnitude, expected, rtol=1e-12)
+
+    def test_truncate_matches_explicit_fast_size(self, make_params):
+        truncated = make_params(fft_size=797, fft_fast_length=FastLength.TRUNCATE)
+        explicit = make_params(fft_size=768)
+        sd = generate_signal(explicit)
+        np.testing.assert_array_equal(
+            compute_fft(sd, truncated).magnitude_db, compute_fft(sd, explicit).magnitude_db
+        )
+
+    def test_auto_uses_whole_capture(self, make_params):
+        params = make_params(fft_size="auto", duration=0.1009)  # 807 samples → 800
+        fft = compute_fft(generate_signal(params), params)
+        assert len(fft.frequencies) == 401
+
+    @pytest.mark.parametrize("policy", list(FastLength))
+    def test_welch_and_stft_follow_transform_size(self, policy, make_params):
+        params = make_params(fft_size=250, fft_fast_length=policy, fft_mode=FFTMode.WELCH)
+        sd = generate_signal(params)
+        n_bins = params.transform_size // 2 + 1
+        assert len(compute_fft(sd, params).frequencies) == n_bins
+        assert compute_stft(sd, params).magnitude_db.shape[1] == n_bins
+
+    def test_batch_matches_scalar_path(self, make_params):
+        params_list = [
+            make_params(fft_size=797, fft_fast_length=FastLength.PAD),
+            make_params(fft_size=797),
+            make_params(fft_size="auto", frequency=300.0),
+        ]
+        for params, result in zip(params_list, analyze_batch(params_list)):
+            sd = generate_signal(params)
+            fft = compute_fft(sd, params)
+            np.testing.assert_array_equal(result.fft_result.magnitude_db, fft.magnitude_db)
+            np.testing.assert_array_equal(result.fft_result.frequencies, fft.frequencies)
+
+    def test_accumulator_keeps_segment_size_samples(self, make_params):
+        params = make_params(fft_size=797, fft_fast_length=FastLength.PAD)
+        acc = MetricsAccumulator(params)
+        for chunk in iter_signal_chunks(params, chunk_size=300):
+            acc.update(chunk)
+        assert len(acc.head().composite) == 797
+        np.testing.assert_array_equal(
+            acc.fft_result().magnitude_db,
+            compute_fft(generate_signal(params), params).magnitude_db,
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fft_backend")
+class TestWelch:
+    @pytest.fixture
+    def welch_params(self, make_params) -> Callable[..., SignalParameters]:
+        """Factory for Welch parameters: 1 s of signal in 256-point segments."""
+        return functools.partial(make_params, fft_mode=FFTMode.WELCH, duration=1.0, fft_size=256)
+
+    def test_result_has_single_segment_shape(self, welch_params):
+        params = welch_params()
+        fft = compute_fft(generate_signal(params), params)
+        assert len(fft.frequencies) == 256 // 2 + 1
+        assert fft.magnitude_db.shape == fft.frequencies.shape == fft.phase_deg.shape
+
+    def test_single_segment_welch_equals_single_mode(self, make_params):
+        params = make_params(fft_size=512, duration=512 / 8000.0)
+        welch = params.model_copy(update={"fft_mode": FFTMode.WELCH})
+        sd = generate_signal(params)
+        np.testing.assert_allclose(
+            compute_fft(sd, welch).magnitude_db, compute_fft(sd, params).magnitude_db
+        )
+
+    def test_matches_frame_by_frame_average(self, welch_params):
+        params = welch_params(noise_type=NoiseType.GAUSSIAN, welch_overlap=0.75)
+        sd = generate_signal(params)
+        hop = 64
+        starts = range(0, len(sd.composite) - 256 + 1, hop)
+        power = np.mean(
+            [np.abs(np.fft.rfft(sd.composite[s : s + 256] * np.hanning(256))) ** 2 for s in starts],
+            axis=0,
+        )
+        expected = 20.0 * np.log10(np.sqrt(power) / 128.0)
+        np.testing.assert_allclose(compute_fft(sd, params).magnitude_db, expected, rtol=1e-9)
+
+    def test_averaging_reduces_noise_floor_variance(self, welch_params):
+        params = welch_params(noise_type=NoiseType.GAUSSIAN, snr_db=0.0, frequency=1000.0)
+        single = params.model_copy(update={"fft_mode": FFTMode.SINGLE})
+        sd = generate_signal(params)
+        floor = slice(len(compute_fft(sd, params).frequencies) // 2, None)
+        assert np.std(compute_fft(sd, params).magnitude_db[floor]) < np.std(
+            compute_fft(sd, single).magnitude_db[floor]
+        )
+
+    def test_median_average(self, welch_params):
+        params = welch_params(welch_average=SpectrumAverage.MEDIAN)
+        fft = compute_fft(generate_signal(params), params)
+        bin_width = params.sampling_rate / params.transform_size
+        assert abs(fft.frequencies[np.argmax(fft.magnitude_db)] - params.frequency) <= bin_width
+
+    def test_batch_matches_scalar(self, welch_params):
+        params = welch_params(welch_overlap=0.25)
+        (result,) = analyze_batch([params])
+        fft = compute_fft(generate_signal(params), params)
+        np.testing.assert_array_equal(result.fft_result.magnitude_db, fft.magnitude_db)
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fft_backend")
+class TestComputeSTFT:
+    def test_shapes_and_dtype(self, make_params):
+        params = make_params(duration=0.5, fft_size=256, welch_overlap=0.5)
+        spec = compute_stft(generate_signal(params), params)
+        n_frames = (4000 - 256) // 128 + 1
+        assert spec.magnitude_db.shape == (n_frames, 129)
+        assert spec.magnitude_db.dtype == np.float32
+        assert spec.times.shape == (n_frames,)
+        assert len(spec.frequencies) == 129
+
+    def test_frame_times_are_frame_centres(self, make_params):
+        params = make_params(fft_size=256)
+        spec = compute_stft(generate_signal(params), params, hop=100)
+        np.testing.assert_allclose(spec.times[:3], np.array([128, 228, 328]) / 8000.0)
+
+    def test_first_frame_matches_compute_fft(self, make_params):
+        params = make_params(fft_size=512, fft_window=WindowType.HAMMING)
+        sd = generate_signal(params)
+        spec = compute_stft(sd, params)
+        np.testing.assert_allclose(
+            spec.magnitude_db[0], compute_fft(sd, params).magnitude_db, rtol=1e-5
+        )
+
+    def test_tracks_frequency_change_over_time(self, make_params):
+        low = generate_signal(make_params(frequency=500.0, duration=0.25))
+        high = generate_signal(make_params(frequency=2000.0, duration=0.25))
+        sd = type(low)(
+            time=TimeAxis(dt=low.time.dt, n=len(low.composite) + len(high.composite)),
+            signal=np.concatenate([low.signal, high.signal]),
+            noise=np.concatenate([low.noise, high.noise]),
+            composite=np.concatenate([low.composite, high.composite]),
+            sample_rate=8000.0,
+        )
+        params = make_params(duration=0.5, fft_size=256)
+        spec = compute_stft(sd, params, hop=256)
+        peaks = spec.frequencies[np.argmax(spec.magnitude_db, axis=1)]
+        bin_width = 8000.0 / 256
+        assert abs(peaks[0] - 500.0) <= bin_width
+        assert abs(peaks[-1] - 2000.0) <= bin_width
+
+    def test_blocked_transform_matches_single_block(
+        self, monkeypatch: pytest.MonkeyPatch, make_params
+    ):
+        import scaldys_template.core.signal_engine as engine
+
+        params = make_params(duration=0.5, fft_size=128)
+        sd = generate_signal(params)
+        expected = compute_stft(sd, params, hop=32).magnitude_db
+        monkeypatch.setattr(engine, "_STFT_BLOCK_SAMPLES", 128 * 7)
+        np.testing.assert_array_equal(compute_stft(sd, params, hop=32).magnitude_db, expected)
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fft_backend")
+class TestFloat32Precision:
+    def test_pipeline_stays_in_float32(self, make_params):
+        params = make_params(dtype="float32", noise_type=NoiseType.GAUSSIAN, dc_offset=0.1)
+        sd = generate_signal(params)
+        fft = compute_fft(sd, params)
+        assert sd.signal.dtype == sd.noise.dtype == sd.composite.dtype == np.float32
+        assert fft.magnitude_db.dtype == fft.phase_deg.dtype == np.float32
+
+    def test_welch_and_streaming_honour_dtype(self, make_params):
+        params = make_params(
+            dtype="float32", fft_mode=FFTMode.WELCH, signal_type=SignalType.WHITE_NOISE
+        )
+        assert compute_fft(generate_signal(params), params).magnitude_db.dtype == np.float32
+        assert next(iter_signal_chunks(params)).composite.dtype == np.float32
+        (result,) = analyze_batch([params])
+        assert result.signal_data.composite.dtype == np.float32
+
+    @pytest.mark.parametrize(
+        "signal_type",
+        [SignalType.SINE, SignalType.SQUARE, SignalType.SAWTOOTH, SignalType.TRIANGLE],
+    )
+    def test_metric_deviation_from_float64_is_bounded(self, signal_type, make_params):
+        # 1 s at 48 kHz: long enough that float32 time stamps would visibly
+        # distort the waveform if the phase argument were not float64.
+        params64 = make_params(
+            signal_type=signal_type,
+            frequency=997.0,
+            sampling_rate=48_000.0,
+            duration=1.0,
+            fft_size=4096,
+            dc_offset=0.3,
+        )
+        params32 = params64.model_copy(update={"dtype": "float32"})
+        sd64, sd32 = generate_signal(params64), generate_signal(params32)
+        fft64, fft32 = compute_fft(sd64, params64), compute_fft(sd32, params32)
+        m64, m32 = compute_metrics(sd64, fft64), compute_metrics(sd32, fft32)
+
+        assert np.max(np.abs(sd32.composite - sd64.composite)) < 1e-6
+        assert m32.rms == pytest.approx(m64.rms, rel=1e-6)
+        assert m32.peak == pytest.approx(m64.peak, rel=1e-6)
+        assert m32.crest_factor == pytest.approx(m64.crest_factor, rel=1e-6)
+        # A clean sine's THD sits at the float32 rounding floor, so only
+        # approximate agreement is expected there.
+        thd_tol = 1e-3 if m64.thd_db > -100.0 else 0.1
+        assert m32.thd_db == pytest.approx(m64.thd_db, abs=thd_tol)
+        assert m32.peak_freq == m64.peak_freq
+
+        # Spectral agreement well above the float32 rounding floor (~-140 dB).
+        strong = fft64.magnitude_db > -80.0
+        assert np.max(np.abs(fft32.magnitude_db[strong] - fft64.magnitude_db[strong])) < 1e-3
+
+
 @pytest.mark.unit
 class TestComputeMetrics:
-    def test_rms_sine_is_amplitude_over_sqrt2(self):
+    def test_rms_sine_is_amplitude_over_sqrt2(self, make_params):
         amplitude = 2.0
-        params = _params(amplitude=amplitude, signal_type=SignalType.SINE)
+        params = make_params(amplitude=amplitude, signal_type=SignalType.SINE)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         metrics = compute_metrics(sd, fft)
         expected_rms = amplitude / (2.0**0.5)
         assert metrics.rms == pytest.approx(expected_rms, rel=0.01)
 
-    def test_peak_equals_amplitude_for_clean_sine(self):
+    def test_peak_equals_amplitude_for_clean_sine(self, make_params):
         amplitude = 3.0
-        params = _params(amplitude=amplitude, signal_type=SignalType.SINE)
+        params = make_params(amplitude=amplitude, signal_type=SignalType.SINE)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         metrics = compute_metrics(sd, fft)
         assert metrics.peak == pytest.approx(amplitude, abs=0.01)
 
-    def test_crest_factor_sine_is_sqrt2(self):
-        params = _params(signal_type=SignalType.SINE)
+    def test_crest_factor_sine_is_sqrt2(self, make_params):
+        params = make_params(signal_type=SignalType.SINE)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         metrics = compute_metrics(sd, fft)
         assert metrics.crest_factor == pytest.approx(2.0**0.5, rel=0.02)
 
-    def test_snr_is_none_without_noise(self):
-        params = _params(noise_type=NoiseType.NONE)
+    def test_snr_is_none_without_noise(self, make_params):
+        params = make_params(noise_type=NoiseType.NONE)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         metrics = compute_metrics(sd, fft)
         assert metrics.snr_db is None
 
-    def test_snr_is_float_with_noise(self):
-        params = _params(noise_type=NoiseType.GAUSSIAN, snr_db=30.0)
+    def test_snr_is_float_with_noise(self, make_params):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, snr_db=30.0)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         metrics = compute_metrics(sd, fft)
         assert metrics.snr_db is not None
         assert isinstance(metrics.snr_db, float)
 
-    def test_peak_freq_near_fundamental(self):
+    def test_peak_freq_near_fundamental(self, make_params):
         freq = 500.0
-        params = _params(frequency=freq, sampling_rate=8000.0, fft_size=512, duration=0.1)
+        params = make_params(frequency=freq, sampling_rate=8000.0, fft_size=512, duration=0.1)
         sd = generate_signal(params)
         fft = compute_fft(sd, params)
         metrics = compute_metrics(sd, fft)
-        bin_width = params.sampling_rate / params.fft_size
+        bin_width = params.sampling_rate / params.transform_size
         assert abs(metrics.peak_freq - freq) <= bin_width
+
+    def test_fft_result_keeps_linear_magnitude(self, make_params):
+        params = make_params(fft_window=WindowType.RECTANGULAR, frequency=500.0, fft_size=512)
+        fft = compute_fft(generate_signal(params), params)
+        assert fft.magnitude is not None
+        np.testing.assert_allclose(
+            20.0 * np.log10(np.maximum(fft.magnitude, 1e-12)), fft.magnitude_db, rtol=1e-12
+        )
+        assert np.max(fft.magnitude) == pytest.approx(1.0, rel=1e-9)
+
+    def test_metrics_match_reference_formulas(self, make_params):
+        params = make_params(
+            noise_type=NoiseType.GAUSSIAN, duration=3.0, dc_offset=0.2, seed=4, dtype="float32"
+        )
+        sd = generate_signal(params)
+        metrics = compute_metrics(sd, compute_fft(sd, params))
+        composite = sd.composite.astype(np.float64)
+        assert metrics.rms == pytest.approx(np.sqrt(np.mean(composite**2)), rel=1e-12)
+        assert metrics.peak == np.max(np.abs(composite))
+
+    def test_thd_without_linear_magnitude_falls_back_to_db(self, make_params):
+        params = make_params(signal_type=SignalType.SQUARE)
+        sd = generate_signal(params)
+        fft = compute_fft(sd, params)
+        db_only = FFTResult(fft.frequencies, fft.magnitude_db, fft.phase_deg)
+        assert compute_metrics(sd, db_only).thd_db == pytest.approx(
+            compute_metrics(sd, fft).thd_db, rel=1e-9
+        )
+
+    def test_thd_grows_with_harmonic_count_for_square_wave(self, make_params):
+        params = make_params(signal_type=SignalType.SQUARE, frequency=125.0, fft_size=512)
+        sd = generate_signal(params)
+        fft = compute_fft(sd, params)
+        thd = [compute_metrics(sd, fft, max_harmonic=n).thd_db for n in (3, 5, 9)]
+        assert thd[0] < thd[1] < thd[2]
+        assert compute_metrics(sd, fft).thd_db == thd[1]
+
+    def test_max_harmonic_below_two_raises(self, make_params):
+        params = make_params()
+        sd = generate_signal(params)
+        with pytest.raises(ValueError, match="max_harmonic"):
+            compute_metrics(sd, compute_fft(sd, params), max_harmonic=1)
+
+    @pytest.mark.slow
+    def test_large_fft_metrics_allocate_no_signal_sized_temporaries(self, make_params):
+        params = make_params(
+            sampling_rate=1_048_576.0,
+            frequency=1000.0,
+            duration=4.0,
+            fft_size=1 << 20,
+            noise_type=NoiseType.GAUSSIAN,
+        )
+        sd = generate_signal(params)
+        fft = compute_fft(sd, params)
+        tracemalloc.start()
+        try:
+            compute_metrics(sd, fft)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 0.01 * sd.composite.nbytes
+
+
+@pytest.fixture
+def channel_params(make_params) -> list[SignalParameters]:
+    """Three channels of one capture with different content."""
+    return [
+        make_params(frequency=100.0),
+        make_params(frequency=250.0, signal_type=SignalType.SQUARE, dc_offset=0.1),
+        make_params(frequency=400.0, noise_type=NoiseType.GAUSSIAN, snr_db=20.0, seed=2),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fft_backend")
+class TestMultiChannel:
+    @pytest.mark.parametrize("mode", [FFTMode.SINGLE, FFTMode.WELCH])
+    def test_fft_rows_match_single_channel_runs(self, mode, make_params, channel_params):
+        channels = [
+            generate_signal(p.model_copy(update={"fft_mode": mode})) for p in channel_params
+        ]
+        params = make_params(fft_mode=mode)
+        stacked = stack_channels(channels)
+        fft = compute_fft(stacked, params)
+
+        assert fft.magnitude is not None
+        assert fft.magnitude_db.shape == (3, 257)
+        assert fft.frequencies.shape == (257,)
+        for row, sd in enumerate(channels):
+            expected = compute_fft(sd, params)
+            np.testing.assert_array_equal(fft.magnitude[row], expected.magnitude)
+            np.testing.assert_array_equal(fft.magnitude_db[row], expected.magnitude_db)
+            np.testing.assert_array_equal(fft.phase_deg[row], expected.phase_deg)
+
+    def test_metrics_are_per_channel_arrays(self, make_params, channel_params):
+        params = make_params()
+        channels = [generate_signal(p) for p in channel_params]
+        stacked = stack_channels(channels)
+        metrics = compute_channel_metrics(stacked, compute_fft(stacked, params))
+
+        assert metrics.rms.shape == (3,)
+        assert metrics.n_channels == 3
+        for row, sd in enumerate(channels):
+            expected = compute_metrics(sd, compute_fft(sd, params))
+            assert metrics.rms[row] == expected.rms
+            assert metrics.peak[row] == expected.peak
+            assert metrics.crest_factor[row] == expected.crest_factor
+            assert metrics.thd_db[row] == expected.thd_db
+            assert metrics.peak_freq[row] == expected.peak_freq
+        # Only the third channel has noise.
+        assert metrics.snr_db is not None
+        assert np.isnan(metrics.snr_db[:2]).all()
+        assert metrics.snr_db[2] == pytest.approx(
+            compute_metrics(channels[2], compute_fft(channels[2], params)).snr_db
+        )
+
+    def test_measure_metrics_matches_per_channel(self, make_params, channel_params):
+        params = make_params()
+        channels = [generate_signal(p) for p in channel_params]
+        metrics = measure_channel_metrics(stack_channels(channels), params)
+        for row, sd in enumerate(channels):
+            assert metrics.channel(row) == measure_metrics(sd, params)
+
+    def test_scalar_metrics_reject_multichannel(self, make_params, channel_params):
+        params = make_params()
+        stacked = stack_channels([generate_signal(p) for p in channel_params])
+        with pytest.raises(ValueError, match="compute_channel_metrics"):
+            compute_metrics(stacked, compute_fft(stacked, params))
+        with pytest.raises(ValueError, match="measure_channel_metrics"):
+            measure_metrics(stacked, params)
+
+    def test_noiseless_capture_has_no_snr(self, make_params):
+        samples = np.sin(2 * np.pi * 100.0 * np.arange(800) / 8000.0)
+        sd = capture_signal(np.stack([samples, 0.5 * samples]), 8000.0)
+        assert sd.is_multichannel and sd.n_channels == 2
+        assert sd.noise.shape == (2, 0)
+        metrics = compute_channel_metrics(sd, compute_fft(sd, make_params()))
+        assert metrics.snr_db is None
+        np.testing.assert_allclose(metrics.rms, [np.sqrt(0.5), 0.5 * np.sqrt(0.5)], rtol=1e-3)
+
+    def test_capture_signal_dtypes_and_shapes(self):
+        assert capture_signal(np.zeros(8, dtype=np.float32), 1.0).composite.dtype == np.float32
+        single = capture_signal([1, 2, 3], 10.0)
+        assert single.composite.dtype == np.float64
+        assert not single.is_multichannel and single.n_channels == 1
+        assert len(single.time) == 3
+        with pytest.raises(ValueError, match="channels, N"):
+            capture_signal(np.zeros((2, 2, 2)), 1.0)
+        with pytest.raises(ValueError, match="sample_rate"):
+            capture_signal(np.zeros(4), 0.0)
+
+    def test_channel_and_contiguous_views(self, channel_params):
+        channels = [generate_signal(p) for p in channel_params]
+        stacked = stack_channels(channels)
+        np.testing.assert_array_equal(stacked.channel(1).composite, channels[1].composite)
+        np.testing.assert_array_equal(stacked.channel(0).noise_samples(), 0.0)
+
+        block = stacked.contiguous()
+        assert block.samples is not None
+        assert block.samples.shape == (3, 3, len(channels[0].composite))
+        np.testing.assert_array_equal(block.composite, stacked.composite)
+        with pytest.raises(ValueError, match="multi-channel"):
+            channels[0].channel(0)
+
+    def test_stack_channels_validates_inputs(self, make_params):
+        a = generate_signal(make_params())
+        with pytest.raises(ValueError, match="At least one"):
+            stack_channels([])
+        with pytest.raises(ValueError, match="same length"):
+            stack_channels([a, generate_signal(make_params(duration=0.2))])
+        with pytest.raises(ValueError, match="single-channel"):
+            stack_channels([stack_channels([a])])
+
+
+def _missing_loader():
+    raise ImportError("not installed")
+
+
+def _counting_loader(calls: list[int]):
+    def loader():
+        def rfft(x, n, axis):
+            calls.append(n)
+            return np.fft.rfft(x, n=n, axis=axis)
+
+        return rfft
+
+    return loader
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fft_registry")
+class TestFFTBackendRegistry:
+    def test_auto_falls_back_to_numpy(self, fft_registry):
+        fft_registry._loaders["scipy"] = _missing_loader
+        assert get_fft_backend().name == "numpy"
+        assert available_fft_backends() == ["numpy"]
+
+    def test_auto_prefers_scipy_when_installed(self, fft_registry, make_params):
+        calls: list[int] = []
+        fft_registry._loaders["scipy"] = _counting_loader(calls)
+        assert get_fft_backend().name == "scipy"
+        compute_fft(generate_signal(make_params()), make_params())
+        assert calls == [512]
+
+    def test_registered_backend_is_used_by_every_call_site(self, make_params):
+        calls: list[int] = []
+        register_fft_backend("counting", _counting_loader(calls))
+        backend = set_fft_backend("counting")
+        assert backend is not None and backend.name == "counting"
+
+        params = make_params(fft_mode=FFTMode.WELCH)
+        sd = generate_signal(params)
+        for run in (
+            lambda: compute_fft(sd, params),
+            lambda: compute_stft(sd, params),
+            lambda: measure_metrics(sd, params),
+            lambda: analyze_batch([params]),
+            lambda: StreamingAnalyzer(params).push(sd.composite),
+        ):
+            before = len(calls)
+            run()
+            assert len(calls) > before
+
+    def test_environment_variable_selects_backend(self, monkeypatch):
+        register_fft_backend("counting", _counting_loader([]))
+        monkeypatch.setenv(FFT_BACKEND_ENV, "counting")
+        assert get_fft_backend().name == "counting"
+
+    def test_explicit_selection_overrides_environment(self, monkeypatch):
+        monkeypatch.setenv(FFT_BACKEND_ENV, "scipy")
+        backend = set_fft_backend("numpy")
+        assert backend is not None and backend.name == "numpy"
+        assert get_fft_backend().name == "numpy"
+
+    def test_unknown_environment_value_is_ignored(self, monkeypatch, caplog, fft_registry):
+        fft_registry._loaders["scipy"] = _missing_loader
+        monkeypatch.setenv(FFT_BACKEND_ENV, "fftw")
+        with caplog.at_level("WARNING", logger="scaldys_template"):
+            assert get_fft_backend().name == "numpy"
+        assert FFT_BACKEND_ENV in caplog.text
+
+    def test_invalid_selection_raises(self, fft_registry):
+        fft_registry._loaders["scipy"] = _missing_loader
+        with pytest.raises(ValueError, match="Unknown FFT backend"):
+            set_fft_backend("fftw")
+        with pytest.raises(ValueError, match="not available"):
+            set_fft_backend("scipy")
+        with pytest.raises(ValueError, match="reserved"):
+            register_fft_backend("auto", _counting_loader([]))
+
+    def test_backends_agree(self, make_params):
+        params = make_params(signal_type=SignalType.SQUARE, fft_mode=FFTMode.WELCH)
+        sd = generate_signal(params)
+        results = {}
+        for name in available_fft_backends():
+            set_fft_backend(name)
+            results[name] = compute_fft(sd, params)
+        reference = results.pop("numpy")
+        for fft in results.values():
+            np.testing.assert_allclose(fft.magnitude, reference.magnitude, atol=1e-12)
+
+    def test_fft_workers_from_environment(self, monkeypatch, caplog):
+        monkeypatch.setenv(FFT_WORKERS_ENV, "3")
+        assert signal_engine._fft_workers() == 3
+        monkeypatch.delenv(FFT_WORKERS_ENV)
+        assert signal_engine._fft_workers() >= 1
+        monkeypatch.setenv(FFT_WORKERS_ENV, "0")
+        with caplog.at_level("WARNING", logger="scaldys_template"):
+            assert signal_engine._fft_workers() >= 1
+        assert FFT_WORKERS_ENV in caplog.text
+
+    def test_pool_workers_default_to_one_fft_thread(self, monkeypatch):
+        monkeypatch.delenv(FFT_WORKERS_ENV, raising=False)
+        signal_engine.init_pool_worker()
+        assert signal_engine._fft_workers() == 1
+        monkeypatch.setenv(FFT_WORKERS_ENV, "2")
+        signal_engine.init_pool_worker()
+        assert signal_engine._fft_workers() == 2
+
+
+@pytest.mark.unit
+class TestWindowCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        clear_window_cache()
+        yield
+        clear_window_cache()
+
+    def test_coefficients_match_numpy_windows(self):
+        np.testing.assert_array_equal(get_window(WindowType.HANNING, 64).values, np.hanning(64))
+        np.testing.assert_array_equal(get_window(WindowType.HAMMING, 64).values, np.hamming(64))
+        np.testing.assert_array_equal(get_window(WindowType.BLACKMAN, 64).values, np.blackman(64))
+
+    def test_repeated_lookup_hits_cache(self):
+        first = get_window(WindowType.HANNING, 512)
+        second = get_window(WindowType.HANNING, 512)
+        assert first is second
+        info = window_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_dtype_is_part_of_the_key(self):
+        w64 = get_window(WindowType.HANNING, 128, np.float64)
+        w32 = get_window(WindowType.HANNING, 128, np.float32)
+        assert w64.values.dtype == np.float64
+        assert w32.values.dtype == np.float32
+        assert window_cache_info().misses == 2
+
+    def test_cached_values_are_read_only(self):
+        w = get_window(WindowType.BLACKMAN, 32)
+        with pytest.raises(ValueError):
+            w.values[0] = 1.0
+
+    def test_cache_is_bounded(self):
+        maxsize = window_cache_info().maxsize
+        for n in range(2, maxsize + 12):
+            get_window(WindowType.HAMMING, n)
+        assert window_cache_info().currsize == maxsize
+
+    def test_hanning_constants(self):
+        w = get_window(WindowType.HANNING, 4096)
+        assert w.coherent_gain == pytest.approx(0.5, rel=1e-3)
+        assert w.enbw == pytest.approx(1.5, rel=1e-3)
+
+    def test_rectangular_window_skips_multiply(self):
+        arr = np.arange(16, dtype=float)
+        assert _apply_window(arr, WindowType.RECTANGULAR) is arr
+        assert window_cache_info().misses == 0
+
+    def test_compute_fft_matches_uncached_window(self, make_params):
+        params = make_params(fft_window=WindowType.BLACKMAN)
+        sd = generate_signal(params)
+        fft = compute_fft(sd, params)
+        spectrum = np.fft.rfft(
+            sd.composite[: params.segment_size] * np.blackman(params.segment_size)
+        )
+        expected = np.rad2deg(np.angle(spectrum))
+        np.testing.assert_array_equal(fft.phase_deg, expected)
+
+
+@pytest.mark.unit
+class TestAnalyzeBatch:
+    @pytest.fixture
+    def deterministic_params(self, make_params) -> list[SignalParameters]:
+        return [
+            make_params(signal_type=st, frequency=freq, fft_window=window, dc_offset=0.25)
+            for st in (SignalType.SINE, SignalType.SQUARE, SignalType.SAWTOOTH, SignalType.TRIANGLE)
+            for freq in (100.0, 250.0)
+            for window in (WindowType.RECTANGULAR, WindowType.HANNING)
+        ]
+
+    def test_empty_batch_returns_empty_list(self):
+        assert analyze_batch([]) == []
+
+    def test_results_identical_to_scalar_path(self, deterministic_params):
+        params_list = deterministic_params
+        for params, result in zip(params_list, analyze_batch(params_list)):
+            sd = generate_signal(params)
+            fft = compute_fft(sd, params)
+            np.testing.assert_array_equal(result.signal_data.time, sd.time)
+            np.testing.assert_array_equal(result.signal_data.composite, sd.composite)
+            np.testing.assert_array_equal(result.fft_result.frequencies, fft.frequencies)
+            np.testing.assert_array_equal(result.fft_result.magnitude_db, fft.magnitude_db)
+            np.testing.assert_array_equal(result.fft_result.phase_deg, fft.phase_deg)
+            assert result.metrics == compute_metrics(sd, fft)
+
+    def test_mixed_shapes_preserve_input_order(self, make_params):
+        params_list = [
+            make_params(fft_size=256, frequency=100.0),
+            make_params(duration=0.2, fft_size=1024, frequency=200.0),
+            make_params(fft_size=256, frequency=300.0),
+            make_params(sampling_rate=4000.0, duration=0.2, fft_size=256, frequency=400.0),
+        ]
+        results = analyze_batch(params_list)
+        assert len(results) == len(params_list)
+        for params, result in zip(params_list, results):
+            assert len(result.fft_result.frequencies) == params.transform_size // 2 + 1
+            bin_width = params.sampling_rate / params.transform_size
+            assert abs(result.metrics.peak_freq - params.frequency) <= bin_width
+
+    def test_noisy_items_get_noise_and_snr(self, make_params):
+        params_list = [
+            make_params(noise_type=NoiseType.GAUSSIAN, snr_db=20.0),
+            make_params(noise_type=NoiseType.NONE),
+            make_params(signal_type=SignalType.WHITE_NOISE),
+        ]
+        noisy, clean, white = analyze_batch(params_list)
+        assert noisy.metrics.snr_db is not None
+        assert abs(noisy.metrics.snr_db - 20.0) < 3.0
+        assert clean.metrics.snr_db is None
+        assert np.all(clean.signal_data.noise == 0.0)
+        assert np.std(white.signal_data.signal) == pytest.approx(1.0, rel=0.2)
+
+
+@pytest.mark.unit
+class TestMeasureMetrics:
+    """``measure_metrics`` / ``measure_batch`` against the full-spectrum path."""
+
+    @staticmethod
+    def _full(params: SignalParameters) -> tuple[Any, Any]:
+        sd = generate_signal(params)
+        return sd, compute_metrics(sd, compute_fft(sd, params))
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"signal_type": SignalType.WHITE_NOISE, "seed": 1},
+            {"noise_type": NoiseType.GAUSSIAN, "seed": 1, "dc_offset": 0.2},
+            {"fft_mode": FFTMode.WELCH, "welch_average": SpectrumAverage.MEDIAN},
+            {"fft_size": 797, "fft_fast_length": FastLength.PAD, "dtype": "float32"},
+        ],
+    )
+    def test_short_transforms_match_exactly(self, kwargs, make_params):
+        params = make_params(**kwargs)
+        sd, expected = self._full(params)
+        assert measure_metrics(sd, params) == expected
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"signal_type": SignalType.SQUARE},
+            {"signal_type": SignalType.SAWTOOTH, "fft_window": WindowType.BLACKMAN},
+            {"signal_type": SignalType.TRIANGLE, "fft_window": WindowType.RECTANGULAR},
+            {"dc_offset": 3.0},  # DC bin dominates
+            {"noise_type": NoiseType.GAUSSIAN, "snr_db": 0.0, "seed": 4},
+            {"fft_mode": FFTMode.WELCH, "fft_size": 1 << 16, "duration": 4.0},
+            {"fft_size": 80_021, "fft_fast_length": FastLength.PAD},
+        ],
+    )
+    def test_long_transforms_use_targeted_bins(self, kwargs, make_params):
+        defaults = {"frequency": 440.0, "sampling_rate": 48_000.0, "duration": 2.0}
+        params = make_params(**{**defaults, "fft_size": "auto", **kwargs})
+        assert params.transform_size >= 1 << 16
+        sd, expected = self._full(params)
+        metrics = measure_metrics(sd, params)
+        assert metrics.peak_freq == expected.peak_freq
+        assert metrics.thd_db == pytest.approx(expected.thd_db, abs=1e-6)
+        assert metrics.rms == expected.rms
+        assert metrics.snr_db == expected.snr_db
+
+    def test_dft_bins_match_rfft(self):
+        x = np.random.default_rng(0).standard_normal((2, 1000))
+        bins = np.array([0, 1, 17, 500, 511])
+        np.testing.assert_allclose(
+            _dft_bins(x, bins, 1024), np.fft.rfft(x, n=1024, axis=-1)[:, bins], atol=1e-10
+        )
+
+    def test_batch_matches_analyze_batch(self, make_params):
+        params_list = [
+            make_params(frequency=100.0),
+            make_params(frequency=300.0, noise_type=NoiseType.UNIFORM, seed=2),
+            make_params(fft_mode=FFTMode.WELCH, seed=3, signal_type=SignalType.WHITE_NOISE),
+            make_params(sampling_rate=48_000.0, duration=2.0, fft_size="auto"),
+        ]
+        measured = measure_batch(params_list)
+        for metrics, result in zip(measured, analyze_batch(params_list)):
+            assert metrics.peak_freq == result.metrics.peak_freq
+            assert metrics.thd_db == pytest.approx(result.metrics.thd_db, abs=1e-6)
+            assert metrics.rms == result.metrics.rms
+        assert measured[:3] == [r.metrics for r in analyze_batch(params_list[:3])]
+
+    def test_accumulator_without_spectrum(self, make_params):
+        params = make_params(
+            sampling_rate=48_000.0, duration=2.0, fft_size=1 << 16, signal_type=SignalType.SAWTOOTH
+        )
+        acc = MetricsAccumulator(params)
+        for chunk in iter_signal_chunks(params, chunk_size=10_000):
+            acc.update(chunk)
+        measured = acc.result()
+        full = acc.result(acc.fft_result())
+        assert measured.peak_freq == full.peak_freq
+        assert measured.thd_db == pytest.approx(full.thd_db, abs=1e-6)
+
+    def test_invalid_max_harmonic_raises(self, make_params):
+        params = make_params()
+        with pytest.raises(ValueError, match="max_harmonic"):
+            measure_metrics(generate_signal(params), params, max_harmonic=1)
+
+    @pytest.mark.slow
+    def test_benchmark_against_full_spectrum(self, make_params):
+        params = make_params(
+            frequency=1000.0, sampling_rate=48_000.0, duration=22.0, fft_size=1 << 20
+        )
+        sd = generate_signal(params)
+
+        def measure(fn) -> float:
+            fn()
+            start = time.perf_counter()
+            for _ in range(3):
+                fn()
+            return time.perf_counter() - start
+
+        full_time = measure(lambda: compute_metrics(sd, compute_fft(sd, params)))
+        measured_time = measure(lambda: measure_metrics(sd, params))
+        assert measured_time < 0.5 * full_time
+
+
+@pytest.mark.unit
+class TestStreaming:
+    def test_chunks_cover_every_sample(self, make_params):
+        params = make_params(duration=0.1, sampling_rate=8000.0)
+        chunks = list(iter_signal_chunks(params, chunk_size=300))
+        assert [len(c.composite) for c in chunks] == [300, 300, 200]
+
+    @pytest.mark.parametrize("signal_type", [SignalType.SINE, SignalType.TRIANGLE])
+    def test_concatenated_chunks_match_in_memory_signal(self, signal_type, make_params):
+        params = make_params(signal_type=signal_type, phase_deg=30.0, dc_offset=0.1)
+        sd = generate_signal(params)
+        chunks = list(iter_signal_chunks(params, chunk_size=97))
+        np.testing.assert_array_equal(np.concatenate([c.time for c in chunks]), sd.time)
+        np.testing.assert_array_equal(np.concatenate([c.composite for c in chunks]), sd.composite)
+
+    def test_generate_signal_rejects_streaming_sized_runs(self, make_params):
+        params = make_params(duration=1000.0, sampling_rate=20_000.0, streaming=True)
+        with pytest.raises(ValueError, match="iter_signal_chunks"):
+            generate_signal(params)
+
+    def test_streamed_noise_has_requested_snr(self, make_params):
+        params = make_params(noise_type=NoiseType.UNIFORM, snr_db=15.0, duration=1.0)
+        acc = MetricsAccumulator(params)
+        for chunk in iter_signal_chunks(params, chunk_size=1000):
+            acc.update(chunk)
+        metrics = acc.result()
+        assert metrics.snr_db is not None
+        assert abs(metrics.snr_db - 15.0) < 1.0
+
+
+@pytest.mark.unit
+class TestMetricsAccumulator:
+    def test_matches_in_memory_metrics(self, make_params):
+        params = make_params(signal_type=SignalType.SQUARE, dc_offset=0.2)
+        sd = generate_signal(params)
+        expected = compute_metrics(sd, compute_fft(sd, params))
+
+        acc = MetricsAccumulator(params)
+        for _ in acc.consume(iter_signal_chunks(params, chunk_size=128)):
+            pass
+        metrics = acc.result()
+
+        assert acc.n_samples == len(sd.composite)
+        assert metrics.rms == pytest.approx(expected.rms, rel=1e-12)
+        assert metrics.peak == expected.peak
+        assert metrics.thd_db == pytest.approx(expected.thd_db, rel=1e-12)
+        assert metrics.peak_freq == expected.peak_freq
+        assert metrics.snr_db is None
+
+    def test_head_holds_leading_fft_segment(self, make_params):
+        params = make_params(fft_size=512)
+        acc = MetricsAccumulator(params)
+        for chunk in iter_signal_chunks(params, chunk_size=100):
+            acc.update(chunk)
+        sd = generate_signal(params)
+        np.testing.assert_array_equal(acc.head().composite, sd.composite[:512])
+
+    @pytest.mark.parametrize("overlap", [0.0, 0.5, 0.75])
+    def test_welch_spectrum_matches_in_memory(self, overlap, make_params):
+        params = make_params(
+            fft_mode=FFTMode.WELCH, welch_overlap=overlap, noise_type=NoiseType.GAUSSIAN, seed=3
+        )
+        sd = generate_signal(params)
+        expected = compute_fft(sd, params)
+
+        acc = MetricsAccumulator(params)
+        for _ in acc.consume(iter_signal_chunks(params, chunk_size=300)):
+            pass
+        fft_result = acc.fft_result()
+
+        assert fft_result.magnitude is not None and expected.magnitude is not None
+        np.testing.assert_allclose(fft_result.magnitude, expected.magnitude, rtol=1e-9)
+        np.testing.assert_array_equal(fft_result.phase_deg, expected.phase_deg)
+        np.testing.assert_array_equal(fft_result.frequencies, expected.frequencies)
+        assert acc.result().thd_db == pytest.approx(compute_metrics(sd, expected).thd_db)
+
+    def test_welch_median_is_rejected(self, make_params):
+        params = make_params(fft_mode=FFTMode.WELCH, welch_average=SpectrumAverage.MEDIAN)
+        with pytest.raises(ValueError, match="Median"):
+            MetricsAccumulator(params)
+
+    def test_fft_requires_enough_samples(self, make_params):
+        params = make_params(fft_size=512)
+        acc = MetricsAccumulator(params)
+        acc.update(next(iter_signal_chunks(params, chunk_size=100)))
+        with pytest.raises(ValueError, match="512"):
+            acc.fft_result()
@@ -0,0 +1,239 @@
+"""Unit tests for the signal result writers."""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scaldys_template.core import signal_export
+from scaldys_template.core.signal_engine import (
+    compute_fft,
+    compute_metrics,
+    generate_signal,
+    iter_signal_chunks,
+)
+from scaldys_template.core.signal_export import (
+    FREQUENCY_DOMAIN_COLUMNS,
+    TIME_DOMAIN_COLUMNS,
+    ResultFormat,
+    ResultWriter,
+    load_result,
+    read_time_domain_raw,
+    write_csv_columns,
+    write_frequency_domain_csv,
+    write_time_domain_csv,
+    write_time_domain_raw,
+)
+from scaldys_template.core.signal_model import NoiseType, SignalParameters
+
+
+def _reference_csv(header, columns, decimals: int) -> bytes:
+    """Helper: the row-by-row ``csv.writer`` output the bulk writer must reproduce."""
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for row in zip(*(np.asarray(c) for c in columns)):
+        writer.writerow([f"{value:.{decimals}f}" for value in row])
+    return buffer.getvalue().encode("utf-8")
+
+
+@pytest.mark.unit
+class TestTimeDomainCsv:
+    def test_header_and_row_count(self, make_params, tmp_path: Path):
+        params = make_params()
+        path = tmp_path / "td.csv"
+        n = write_time_domain_csv([generate_signal(params)], path)
+        with path.open(encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert n == 800
+        assert tuple(rows[0]) == TIME_DOMAIN_COLUMNS
+        assert len(rows) == n + 1
+
+    def test_values_use_eight_decimals(self, make_params, tmp_path: Path):
+        params = make_params()
+        sd = generate_signal(params)
+        path = tmp_path / "td.csv"
+        write_time_domain_csv([sd], path)
+        with path.open(encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[2] == [
+            f"{sd.time[1]:.8f}",
+            f"{sd.signal[1]:.8f}",
+            f"{sd.noise_samples()[1]:.8f}",
+            f"{sd.composite[1]:.8f}",
+        ]
+
+    def test_chunked_output_matches_single_block(self, make_params, tmp_path: Path):
+        params = make_params()
+        whole = tmp_path / "whole.csv"
+        chunked = tmp_path / "chunked.csv"
+        write_time_domain_csv([generate_signal(params)], whole)
+        write_time_domain_csv(iter_signal_chunks(params, chunk_size=64), chunked)
+        assert whole.read_bytes() == chunked.read_bytes()
+
+    def test_unwritable_path_raises_oserror(self, tmp_path: Path):
+        with pytest.raises(OSError):
+            write_time_domain_csv([], tmp_path / "missing" / "td.csv")
+
+    @pytest.mark.parametrize("dtype", ["float64", "float32"])
+    def test_bytes_match_row_by_row_writer(self, make_params, tmp_path: Path, monkeypatch, dtype):
+        # Small blocks, so the signal spans many of them.
+        monkeypatch.setattr(signal_export, "_CSV_BLOCK_ROWS", 37)
+        params = make_params(noise_type=NoiseType.GAUSSIAN, dc_offset=-0.25, dtype=dtype, seed=1)
+        sd = generate_signal(params)
+        path = tmp_path / "td.csv"
+        write_time_domain_csv([sd], path)
+        expected = _reference_csv(
+            TIME_DOMAIN_COLUMNS, (sd.time, sd.signal, sd.noise, sd.composite), 8
+        )
+        assert path.read_bytes() == expected
+
+
+@pytest.mark.unit
+class TestFrequencyDomainCsv:
+    def test_bytes_match_row_by_row_writer(self, make_params, tmp_path: Path):
+        params = make_params(noise_type=NoiseType.UNIFORM, seed=2)
+        fft = compute_fft(generate_signal(params), params)
+        path = tmp_path / "fd.csv"
+        assert write_frequency_domain_csv(fft, path) == len(fft.frequencies)
+        expected = _reference_csv(
+            FREQUENCY_DOMAIN_COLUMNS, (fft.frequencies, fft.magnitude_db, fft.phase_deg), 4
+        )
+        assert path.read_bytes() == expected
+
+
+@pytest.mark.unit
+class TestWriteCsvColumns:
+    def test_special_values_format_like_fstrings(self):
+        values = np.array([np.nan, np.inf, -np.inf, -0.0, 1e300, -1.23456789e-9])
+        buffer = io.StringIO(newline="")
+        assert write_csv_columns(buffer, [values, values], ["%.3f", "%.8f"]) == 6
+        expected = "".join(f"{v:.3f},{v:.8f}\r\n" for v in values)
+        assert buffer.getvalue() == expected
+
+    def test_mismatched_columns_raise(self):
+        with pytest.raises(ValueError, match="same length"):
+            write_csv_columns(io.StringIO(), [np.zeros(2), np.zeros(3)], ["%f", "%f"])
+        with pytest.raises(ValueError, match="format"):
+            write_csv_columns(io.StringIO(), [np.zeros(2)], ["%f", "%f"])
+
+
+@pytest.mark.unit
+class TestTimeDomainRaw:
+    def test_round_trip(self, make_params, tmp_path: Path):
+        params = make_params(noise_type=NoiseType.GAUSSIAN)
+        chunks = list(iter_signal_chunks(params, chunk_size=150))
+        path = tmp_path / "td.f64"
+        assert write_time_domain_raw(chunks, path) == 800
+
+        records = read_time_domain_raw(path)
+        assert len(records) == 800
+        np.testing.assert_array_equal(
+            records["composite"], np.concatenate([c.composite for c in chunks])
+        )
+        np.testing.assert_array_equal(records["noise"], np.concatenate([c.noise for c in chunks]))
+
+    def test_empty_stream(self, tmp_path: Path):
+        path = tmp_path / "td.f64"
+        assert write_time_domain_raw([], path) == 0
+        assert len(read_time_domain_raw(path)) == 0
+
+
+def _write_result(directory: Path, fmt: ResultFormat, params: SignalParameters, chunk_size=None):
+    """Helper: write the analysis of *params* with a ``ResultWriter``; return its parts."""
+    sd = generate_signal(params)
+    fft_result = compute_fft(sd, params)
+    metrics = compute_metrics(sd, fft_result)
+    chunks = [sd] if chunk_size is None else list(iter_signal_chunks(params, chunk_size))
+    with ResultWriter(directory, fmt) as writer:
+        writer.write_time_domain(chunks, len(sd.composite))
+        writer.write_frequency_domain(fft_result)
+        writer.write_metrics(params, metrics)
+    return sd, fft_result, metrics
+
+
+@pytest.mark.unit
+class TestResultWriter:
+    @pytest.mark.parametrize("fmt", [ResultFormat.NPY, ResultFormat.NPZ])
+    def test_binary_round_trip_is_memory_mapped(self, make_params, tmp_path: Path, fmt):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=5)
+        sd, fft_result, metrics = _write_result(tmp_path, fmt, params)
+
+        loaded_params, result = load_result(tmp_path)
+        assert loaded_params == params
+        assert result.metrics == metrics
+        loaded = result.signal_data
+        assert loaded.time.n == len(sd.composite) and loaded.sample_rate == sd.sample_rate
+        np.testing.assert_array_equal(loaded.time, sd.time)
+        for name in ("signal", "noise", "composite"):
+            np.testing.assert_array_equal(getattr(loaded, name), getattr(sd, name))
+            assert isinstance(getattr(loaded, name).base, np.memmap)
+        for name in ("frequencies", "magnitude_db", "phase_deg", "magnitude"):
+            np.testing.assert_array_equal(
+                getattr(result.fft_result, name), getattr(fft_result, name)
+            )
+            assert isinstance(getattr(result.fft_result, name).base, np.memmap)
+
+    def test_noiseless_result_loads_without_noise(self, make_params, tmp_path: Path):
+        sd, _, _ = _write_result(tmp_path, ResultFormat.NPZ, make_params())
+        _, result = load_result(tmp_path)
+        assert not result.signal_data.has_noise
+        np.testing.assert_array_equal(result.signal_data.noise_samples(), sd.noise_samples())
+
+    def test_chunked_time_domain_matches_whole(self, make_params, tmp_path: Path):
+        params = make_params(noise_type=NoiseType.GAUSSIAN, seed=2)
+        whole, chunked = tmp_path / "whole", tmp_path / "chunked"
+        whole.mkdir()
+        chunked.mkdir()
+        _write_result(whole, ResultFormat.NPY, params)
+        _write_result(chunked, ResultFormat.NPY, params, chunk_size=150)
+        assert (whole / "time_domain.npy").read_bytes() == (
+            chunked / "time_domain.npy"
+        ).read_bytes()
+        assert load_result(chunked).result.signal_data.time.n == 800
+
+    def test_sample_count_mismatch_raises(self, make_params, tmp_path: Path):
+        sd = generate_signal(make_params())
+        with (
+            ResultWriter(tmp_path, ResultFormat.NPY) as writer,
+            pytest.raises(ValueError, match="Expected 401 samples"),
+        ):
+            writer.write_time_domain([sd], 401)
+
+    def test_jsonl_rows_parse(self, make_params, tmp_path: Path):
+        params = make_params()
+        sd, fft_result, metrics = _write_result(tmp_path, ResultFormat.JSONL, params)
+
+        with (tmp_path / "time_domain.jsonl").open(encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert len(rows) == len(sd.composite)
+        assert list(rows[0]) == list(TIME_DOMAIN_COLUMNS)
+        assert [row["composite"] for row in rows] == sd.composite.tolist()
+        with (tmp_path / "frequency_domain.jsonl").open(encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert [row["magnitude_db"] for row in rows] == fft_result.magnitude_db.tolist()
+
+        meta = json.loads((tmp_path / "result.json").read_text(encoding="utf-8"))
+        assert meta["metrics"]["rms"] == metrics.rms
+        with pytest.raises(ValueError, match="npy and npz"):
+            load_result(tmp_path)
+
+    def test_jsonl_spells_non_finite_values_like_json(self, tmp_path: Path):
+        buffer = io.StringIO()
+        signal_export._write_jsonl_columns(
+            buffer, [np.array([np.nan, np.inf, -np.inf, 1.5])], ["value"]
+        )
+        values = [json.loads(line)["value"] for line in buffer.getvalue().splitlines()]
+        assert np.isnan(values[0]) and values[1:] == [np.inf, -np.inf, 1.5]
+
+    def test_csv_format_writes_the_csv_files(self, make_params, tmp_path: Path):
+        params = make_params()
+        _write_result(tmp_path, ResultFormat.CSV, params)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "frequency_domain.csv",
+            "metrics.csv",
+            "time_domain.csv",
+        ]
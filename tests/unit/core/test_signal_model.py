@@ -4,9 +4,14 @@ import pytest
 from pydantic import ValidationError
 
 from scaldys_template.core.signal_model import (
+    MAX_SAMPLES,
+    FastLength,
+    FFTMode,
     NoiseType,
+    SampleDtype,
     SignalParameters,
     SignalType,
+    SpectrumAverage,
     WindowType,
 )
 
@@ -43,14 +48,22 @@ class TestFieldValidators:
         with pytest.raises(ValidationError, match="Duration"):
             SignalParameters(duration=61.0)
 
-    def test_fft_size_not_power_of_two_raises(self):
-        with pytest.raises(ValidationError, match="power of two"):
-            SignalParameters(fft_size=1000)
+    def test_fft_size_need_not_be_power_of_two(self):
+        p = SignalParameters(fft_size=1000)
+        assert p.segment_size == p.transform_size == 1000
+
+    def test_fft_size_unknown_string_raises(self):
+        with pytest.raises(ValidationError):
+            SignalParameters.model_validate({"fft_size": "fast"})
 
     def test_fft_size_one_raises(self):
         with pytest.raises(ValidationError, match="≥ 2"):
             SignalParameters(fft_size=1)
 
+    def test_welch_overlap_of_one_raises(self):
+        with pytest.raises(ValidationError, match="overlap"):
+            SignalParameters(welch_overlap=1.0)
+
     def test_phase_out_of_range_raises(self):
         with pytest.raises(ValidationError, match="Phase"):
             SignalParameters(phase_deg=361.0)
@@ -74,6 +87,24 @@ class TestCrossFieldValidators:
         with pytest.raises(ValidationError, match="FFT size"):
             SignalParameters(frequency=100.0, sampling_rate=1000.0, duration=0.001, fft_size=16)
 
+    def test_sample_count_above_max_samples_raises(self):
+        with pytest.raises(ValidationError, match="exceeds the limit"):
+            SignalParameters(duration=60.0, sampling_rate=200_000.0)
+
+    def test_streaming_lifts_sample_limit(self):
+        p = SignalParameters(duration=3600.0, sampling_rate=44100.0, streaming=True)
+        assert int(p.duration * p.sampling_rate) > MAX_SAMPLES
+
+    def test_streaming_duration_still_bounded(self):
+        with pytest.raises(ValidationError, match="Duration"):
+            SignalParameters(duration=100_000.0, streaming=True)
+
+    def test_streaming_rejects_median_welch(self):
+        with pytest.raises(ValidationError, match="Median Welch"):
+            SignalParameters(
+                streaming=True, fft_mode=FFTMode.WELCH, welch_average=SpectrumAverage.MEDIAN
+            )
+
     def test_valid_complex_parameters(self):
         p = SignalParameters(
             signal_type=SignalType.SQUARE,
@@ -91,6 +122,40 @@ class TestCrossFieldValidators:
         assert p.signal_type == SignalType.SQUARE
 
 
+@pytest.mark.unit
+class TestFFTLengths:
+    def test_auto_uses_largest_fast_length_of_capture(self):
+        # 0.1 s at 44.1 kHz → 4 410 samples; 4 374 = 2 · 3⁷
+        p = SignalParameters(fft_size="auto")
+        assert p.segment_size == p.transform_size == 4374
+
+    def test_auto_survives_round_trip(self):
+        p = SignalParameters(fft_size="auto")
+        assert SignalParameters.model_validate_json(p.model_dump_json()).fft_size == "auto"
+
+    def test_auto_with_too_few_samples_raises(self):
+        with pytest.raises(ValidationError, match="at least 2 samples"):
+            SignalParameters(frequency=100.0, sampling_rate=1000.0, duration=0.001, fft_size="auto")
+
+    def test_pad_rounds_transform_up(self):
+        p = SignalParameters(fft_size=1009, fft_fast_length=FastLength.PAD)
+        assert p.segment_size == 1009
+        assert p.transform_size == 1024
+
+    def test_truncate_rounds_segment_down(self):
+        p = SignalParameters(fft_size=1009, fft_fast_length=FastLength.TRUNCATE)
+        assert p.segment_size == p.transform_size == 1000
+
+    def test_fast_sizes_are_unchanged(self):
+        for policy in FastLength:
+            p = SignalParameters(fft_size=1000, fft_fast_length=policy)
+            assert p.segment_size == p.transform_size == 1000
+
+    def test_welch_hop_follows_overlap(self):
+        assert SignalParameters(fft_size=1000, welch_overlap=0.5).welch_hop == 500
+        assert SignalParameters(fft_size=1000, welch_overlap=0.75).welch_hop == 250
+
+
 @pytest.mark.unit
 class TestSerialization:
     def test_round_trip_json(self):
@@ -99,6 +164,24 @@ class TestSerialization:
         restored = SignalParameters.model_validate_json(json_str)
         assert restored == original
 
+    def test_dtype_round_trips(self):
+        original = SignalParameters(dtype=SampleDtype.FLOAT32)
+        restored = SignalParameters.model_validate_json(original.model_dump_json())
+        assert restored.dtype == SampleDtype.FLOAT32
+
+    def test_unknown_dtype_raises(self):
+        with pytest.raises(ValidationError):
+            SignalParameters.model_validate({"dtype": "float16"})
+
+    def test_seed_defaults_to_none_and_round_trips(self):
+        assert SignalParameters().seed is None
+        restored = SignalParameters.model_validate_json(SignalParameters(seed=42).model_dump_json())
+        assert restored.seed == 42
+
+    def test_negative_seed_raises(self):
+        with pytest.raises(ValidationError, match="Seed"):
+            SignalParameters(seed=-1)
+
     def test_all_signal_types_serialise(self):
         for st in SignalType:
             p = SignalParameters(signal_type=st)
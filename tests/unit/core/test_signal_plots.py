@@ -0,0 +1,57 @@
+"""Unit tests for the headless plot renderer."""
+
+from pathlib import Path
+
+import pytest
+
+from scaldys_template.core.signal_engine import compute_fft, generate_signal
+from scaldys_template.core.signal_model import FFTMode, NoiseType, SignalParameters
+from scaldys_template.core.signal_plots import PlotRenderer, plot_jobs
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _jobs(output_dir: Path, **kwargs):
+    params = SignalParameters(sampling_rate=8000.0, duration=2.0, fft_size=256, **kwargs)
+    sd = generate_signal(params)
+    return plot_jobs(sd, compute_fft(sd, params), params, output_dir)
+
+
+@pytest.mark.unit
+class TestPlotJobs:
+    def test_three_plots_with_decimated_time_domain(self, tmp_path: Path):
+        jobs = _jobs(tmp_path)
+        assert [job.path.name for job in jobs] == ["time_domain.png", "spectrum.png", "phase.png"]
+        (composite,) = jobs[0].lines
+        assert len(composite.x) == 4000
+        assert len(jobs[1].lines[0].x) == 129
+        assert jobs[2].zero_line
+
+    def test_noisy_signal_adds_clean_signal_line(self, tmp_path: Path):
+        jobs = _jobs(tmp_path, noise_type=NoiseType.GAUSSIAN, seed=1, fft_mode=FFTMode.WELCH)
+        assert [line.style["label"] for line in jobs[0].lines] == ["Composite", "Signal"]
+        assert jobs[1].title.endswith("Welch")
+
+
+@pytest.mark.unit
+class TestPlotRenderer:
+    def test_in_process_renders_on_wait(self, tmp_path: Path):
+        jobs = _jobs(tmp_path)
+        with PlotRenderer() as renderer:
+            renderer.submit(jobs)
+            assert not any(job.path.exists() for job in jobs)
+            paths = renderer.wait()
+        assert paths == [job.path for job in jobs]
+        assert all(path.read_bytes().startswith(_PNG_SIGNATURE) for path in paths)
+
+    def test_pool_renders_the_same_files(self, tmp_path: Path):
+        jobs = _jobs(tmp_path)
+        with PlotRenderer(workers=2) as renderer:
+            renderer.submit(jobs)
+            paths = renderer.wait()
+        assert paths == [job.path for job in jobs]
+        assert all(path.read_bytes().startswith(_PNG_SIGNATURE) for path in paths)
+
+    def test_invalid_workers_raises(self):
+        with pytest.raises(ValueError, match="workers"):
+            PlotRenderer(workers=0)
@@ -0,0 +1,70 @@
+"""Unit tests for the staged export pipeline."""
+
+import threading
+
+import pytest
+
+from scaldys_template.core.stage_pipeline import StagePipeline
+
+
+@pytest.mark.unit
+class TestStagePipeline:
+    def test_stages_run_on_writer_threads_and_return_results(self):
+        with StagePipeline(workers=2) as pipeline:
+            pipeline.submit("a", lambda: threading.current_thread().name)
+            pipeline.submit("b", lambda x, y: x + y, 1, 2)
+            outputs = pipeline.wait()
+        assert outputs["a"].startswith("writer")
+        assert outputs["b"] == 3
+
+    def test_after_waits_for_dependency(self):
+        release = threading.Event()
+        order = []
+
+        def first():
+            release.wait(5.0)
+            order.append("first")
+
+        with StagePipeline(workers=2) as pipeline:
+            pipeline.submit("first", first)
+            pipeline.submit("second", order.append, "second", after=("first",))
+            release.set()
+            pipeline.wait()
+        assert order == ["first", "second"]
+
+    def test_failed_stage_fails_dependents_and_wait(self):
+        def fail():
+            raise OSError("disk full")
+
+        with StagePipeline() as pipeline:
+            pipeline.submit("write", fail)
+            dependent = pipeline.submit("after", lambda: None, after=("write",))
+            with pytest.raises(OSError, match="disk full"):
+                pipeline.wait()
+            with pytest.raises(OSError):
+                dependent.result()
+
+    def test_timings_cover_foreground_and_background_stages(self):
+        with StagePipeline() as pipeline:
+            with pipeline.stage("compute"):
+                pass
+            pipeline.record("engine", 0.25)
+            pipeline.submit("write", lambda: None)
+            pipeline.wait()
+        timings = {t.name: t for t in pipeline.timings}
+        assert set(timings) == {"compute", "engine", "write"}
+        assert timings["engine"].seconds == 0.25
+        assert not timings["compute"].background
+        assert timings["write"].background
+
+    def test_invalid_submissions_raise(self):
+        with StagePipeline() as pipeline:
+            pipeline.submit("a", lambda: None)
+            with pytest.raises(ValueError, match="already submitted"):
+                pipeline.submit("a", lambda: None)
+            with pytest.raises(ValueError, match="unknown stages"):
+                pipeline.submit("b", lambda: None, after=("missing",))
+
+    def test_invalid_workers_raises(self):
+        with pytest.raises(ValueError, match="workers"):
+            StagePipeline(workers=0)
@@ -0,0 +1,120 @@
+"""Unit tests for the sliding-window StreamingAnalyzer."""
+
+import numpy as np
+import pytest
+
+from scaldys_template.core.signal_engine import (
+    SignalData,
+    TimeAxis,
+    compute_fft,
+    compute_metrics,
+    generate_signal,
+)
+from scaldys_template.core.signal_model import FastLength, NoiseType, SignalType, WindowType
+from scaldys_template.core.streaming import StreamingAnalyzer
+
+
+def _window_data(composite: np.ndarray, end: int, size: int, sample_rate: float) -> SignalData:
+    """Helper: the *size* samples of *composite* ending at *end* as ``SignalData``."""
+    window = composite[end - size : end]
+    return SignalData(
+        time=TimeAxis(dt=1.0 / sample_rate, n=size, start=end - size),
+        signal=window,
+        noise=window[:0],
+        composite=window,
+        sample_rate=sample_rate,
+    )
+
+
+@pytest.mark.unit
+class TestStreamingAnalyzer:
+    def test_no_update_until_ring_is_full(self, make_params):
+        params = make_params(fft_size=512)
+        analyzer = StreamingAnalyzer(params, hop=100)
+        assert analyzer.push(np.zeros(511)) == []
+        (update,) = analyzer.push(np.zeros(1))
+        assert update.n_samples == analyzer.n_samples == 512
+        assert update.time == pytest.approx(512 / params.sampling_rate)
+
+    def test_default_hop_follows_welch_overlap(self, make_params):
+        params = make_params(fft_size=512, welch_overlap=0.75)
+        assert StreamingAnalyzer(params).hop == 128
+
+    @pytest.mark.parametrize("window", [WindowType.HANNING, WindowType.RECTANGULAR])
+    def test_first_update_matches_compute_fft(self, make_params, window):
+        params = make_params(fft_size=512, fft_window=window, signal_type=SignalType.SQUARE)
+        sd = generate_signal(params)
+        expected_fft = compute_fft(sd, params)
+        head = _window_data(sd.composite, 512, 512, params.sampling_rate)
+        expected = compute_metrics(head, expected_fft)
+
+        update = StreamingAnalyzer(params).push(sd.composite)[0]
+
+        np.testing.assert_array_equal(update.fft_result.magnitude, expected_fft.magnitude)
+        np.testing.assert_array_equal(update.fft_result.magnitude_db, expected_fft.magnitude_db)
+        np.testing.assert_array_equal(update.fft_result.phase_deg, expected_fft.phase_deg)
+        np.testing.assert_array_equal(update.fft_result.frequencies, expected_fft.frequencies)
+        assert update.metrics.rms == pytest.approx(expected.rms, rel=1e-12)
+        assert update.metrics.peak == expected.peak
+        assert update.metrics.thd_db == expected.thd_db
+        assert update.metrics.peak_freq == expected.peak_freq
+        assert update.metrics.snr_db is None
+
+    def test_every_update_analyses_the_latest_window(self, make_params):
+        params = make_params(
+            fft_size=512,
+            fft_fast_length=FastLength.PAD,
+            duration=1.0,
+            noise_type=NoiseType.GAUSSIAN,
+            snr_db=10.0,
+            seed=4,
+        )
+        composite = generate_signal(params).composite
+        analyzer = StreamingAnalyzer(params, hop=300)
+        updates = list(analyzer.feed(np.array_split(composite, 83)))
+
+        assert [u.n_samples for u in updates] == list(range(512, len(composite) + 1, 300))
+        for update in updates:
+            window = _window_data(composite, update.n_samples, 512, params.sampling_rate)
+            expected = compute_metrics(window, compute_fft(window, params))
+            np.testing.assert_array_equal(
+                update.fft_result.magnitude_db, compute_fft(window, params).magnitude_db
+            )
+            assert update.metrics.rms == pytest.approx(expected.rms, rel=1e-9)
+            assert update.metrics.peak == expected.peak
+            assert update.metrics.peak_freq == expected.peak_freq
+
+    def test_updates_do_not_depend_on_block_sizes(self, make_params):
+        params = make_params(fft_size=256, dtype="float32")
+        composite = generate_signal(params).composite
+        whole = StreamingAnalyzer(params, hop=64).push(composite)
+        pieces = StreamingAnalyzer(params, hop=64)
+        blocked = [u for block in np.array_split(composite, 101) for u in pieces.push(block)]
+
+        assert len(whole) == len(blocked) == (len(composite) - 256) // 64 + 1
+        for a, b in zip(whole, blocked):
+            assert a.n_samples == b.n_samples
+            assert a.fft_result.magnitude is not None
+            assert a.fft_result.magnitude.dtype == np.float32
+            np.testing.assert_array_equal(a.fft_result.magnitude, b.fft_result.magnitude)
+            assert a.metrics.peak == b.metrics.peak
+            assert a.metrics.rms == pytest.approx(b.metrics.rms, rel=1e-9)
+
+    def test_reset_starts_over(self, make_params):
+        params = make_params(fft_size=512)
+        composite = generate_signal(params).composite
+        analyzer = StreamingAnalyzer(params, hop=128)
+        first = analyzer.push(composite)
+        analyzer.reset()
+        assert analyzer.n_samples == 0
+        again = analyzer.push(composite)
+        assert [u.metrics for u in again] == [u.metrics for u in first]
+
+    def test_invalid_arguments_raise(self, make_params):
+        params = make_params()
+        with pytest.raises(ValueError, match="hop"):
+            StreamingAnalyzer(params, hop=0)
+        with pytest.raises(ValueError, match="max_harmonic"):
+            StreamingAnalyzer(params, max_harmonic=1)
+        with pytest.raises(ValueError, match="one-dimensional"):
+            StreamingAnalyzer(params).push(np.zeros((2, 4)))
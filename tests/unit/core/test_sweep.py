@@ -0,0 +1,95 @@
+"""Unit tests for the parameter-sweep engine."""
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from scaldys_template.core.signal_engine import compute_fft, compute_metrics, generate_signal
+from scaldys_template.core.signal_model import NoiseType, SignalParameters
+from scaldys_template.core.sweep import SweepSpec, load_sweep_spec, run_sweep
+
+_BASE = SignalParameters(sampling_rate=8000.0, duration=0.1, fft_size=512)
+
+
+def _spec(**axes) -> SweepSpec:
+    return SweepSpec(base=_BASE, axes=axes)
+
+
+@pytest.mark.unit
+class TestSweepSpec:
+    def test_points_are_cartesian_product_in_grid_order(self):
+        spec = _spec(frequency=[100.0, 200.0], amplitude=[1.0, 2.0, 3.0])
+        points = list(spec.points())
+        assert spec.n_points == len(points) == 6
+        assert [(p.frequency, p.amplitude) for p in points[:4]] == [
+            (100.0, 1.0),
+            (100.0, 2.0),
+            (100.0, 3.0),
+            (200.0, 1.0),
+        ]
+        assert all(p.fft_size == 512 for p in points)
+
+    def test_points_are_validated(self):
+        spec = _spec(frequency=[100.0, -5.0])
+        points = spec.points()
+        next(points)
+        with pytest.raises(ValueError, match="Invalid sweep point 1"):
+            next(points)
+
+    def test_enum_values_are_coerced(self):
+        (point,) = _spec(fft_window=["blackman"]).points()
+        assert point.fft_window == "blackman"
+
+    def test_unknown_axis_raises(self):
+        with pytest.raises(ValidationError, match="Unknown sweep parameter"):
+            _spec(frequncy=[100.0])
+
+    def test_empty_axis_raises(self):
+        with pytest.raises(ValidationError, match="at least one value"):
+            _spec(frequency=[])
+
+    def test_no_axes_raises(self):
+        with pytest.raises(ValidationError, match="At least one sweep axis"):
+            _spec()
+
+    def test_load_from_file(self, tmp_path: Path):
+        path = tmp_path / "spec.json"
+        path.write_text(
+            json.dumps({"base": {"frequency": 50.0}, "axes": {"snr_db": [10, 20]}}),
+            encoding="utf-8",
+        )
+        spec = load_sweep_spec(path)
+        assert spec.base.frequency == 50.0
+        assert spec.n_points == 2
+
+
+@pytest.mark.unit
+class TestRunSweep:
+    def test_serial_matches_direct_analysis(self):
+        spec = _spec(frequency=[100.0, 250.0], fft_window=["hanning", "blackman"])
+        points = sorted(run_sweep(spec, workers=1, chunk_size=3), key=lambda p: p.index)
+
+        assert [p.index for p in points] == [0, 1, 2, 3]
+        for point, params in zip(points, spec.points()):
+            sd = generate_signal(params)
+            assert point.metrics == compute_metrics(sd, compute_fft(sd, params))
+        assert points[1].values == {"frequency": 100.0, "fft_window": "blackman"}
+
+    def test_pool_matches_serial(self):
+        base = _BASE.model_copy(update={"noise_type": NoiseType.GAUSSIAN, "seed": 3})
+        spec = SweepSpec(base=base, axes={"frequency": [100.0, 200.0, 300.0], "snr_db": [10, 30]})
+        serial = sorted(run_sweep(spec, workers=1), key=lambda p: p.index)
+        pooled = sorted(run_sweep(spec, workers=2, chunk_size=2), key=lambda p: p.index)
+        assert [p.metrics for p in pooled] == [p.metrics for p in serial]
+
+    def test_streaming_points_are_supported(self):
+        spec = _spec(streaming=[False, True])
+        first, second = sorted(run_sweep(spec, workers=1), key=lambda p: p.index)
+        assert second.metrics.rms == pytest.approx(first.metrics.rms, rel=1e-9)
+        assert second.metrics.peak_freq == first.metrics.peak_freq
+
+    def test_invalid_workers_raises(self):
+        with pytest.raises(ValueError, match="workers"):
+            list(run_sweep(_spec(frequency=[100.0]), workers=0))